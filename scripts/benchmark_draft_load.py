@@ -0,0 +1,79 @@
+# Standard libraries
+import logging
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Dict, List
+
+# Third-party libraries
+import pandas as pd
+import typer
+
+# Local libraries
+from turkey_bowl import draft
+from turkey_bowl.utils import setup_logger
+
+logger = logging.getLogger('benchmark_draft_load')
+
+
+def make_participant_teams(n_participants: int) -> Dict[str, pd.DataFrame]:
+    """Full draft sheets (every slot drafted) for ``n_participants`` participants."""
+    return {
+        f'participant_{i:03d}': pd.DataFrame(
+            {
+                'Position': draft.ROSTER_SLOTS,
+                'Player': [f'Player {i}-{j}' for j in range(len(draft.ROSTER_SLOTS))],
+                'Team': ['DET'] * len(draft.ROSTER_SLOTS),
+            }
+        )
+        for i in range(n_participants)
+    }
+
+
+def benchmark(n_participants: int, repeat: int, tmp_dir: Path) -> List[Dict[str, object]]:
+    """Best load time of each draft sheet format (and xlsx engine) in seconds."""
+    participant_teams = make_participant_teams(n_participants)
+    paths = {
+        'xlsx': tmp_dir.joinpath(f'{n_participants}_draft_sheet.xlsx'),
+        'csv': tmp_dir.joinpath(f'{n_participants}_draft_sheets'),
+        'json': tmp_dir.joinpath(f'{n_participants}_draft_sheet.json'),
+    }
+    for sheet_format, path in paths.items():
+        draft.write_draft_sheet(participant_teams, path, sheet_format)
+
+    readers = {
+        'xlsx (openpyxl)': lambda: draft.read_xlsx_sheet(paths['xlsx'], engine='openpyxl'),
+        'csv': lambda: draft.read_csv_sheets(paths['csv']),
+        'json': lambda: draft.read_json_sheet(paths['json']),
+    }
+    if draft.XLSX_ENGINE != 'openpyxl':
+        readers[f'xlsx ({draft.XLSX_ENGINE})'] = lambda: draft.read_xlsx_sheet(paths['xlsx'])
+
+    rows = []
+    for name, reader in readers.items():
+        seconds = min(timeit.repeat(reader, number=1, repeat=repeat))
+        rows.append({'participants': n_participants, 'format': name, 'seconds': seconds})
+
+    return rows
+
+
+if __name__ == '__main__':
+    setup_logger(logging.INFO)
+
+    def main(
+        participants: List[int] = typer.Option(
+            [10, 100], '--participants', help='Number of participants (repeatable).'
+        ),
+        repeat: int = typer.Option(5, '--repeat', help='Loads per format (best is kept).'),
+    ):
+        """Compare draft sheet load times across formats."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rows = [row for n in participants for row in benchmark(n, repeat, Path(tmp_dir))]
+
+        results = pd.DataFrame(rows)
+        results['vs_openpyxl'] = results['seconds'] / results.groupby('participants')[
+            'seconds'
+        ].transform('first')
+        logger.info(f'\n{results.round(4).to_string(index=False)}')
+
+    typer.run(main)
@@ -0,0 +1,113 @@
+# Standard libraries
+import logging
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+# Third-party libraries
+import numpy as np
+import pandas as pd
+import typer
+
+# Local libraries
+from turkey_bowl import shared_points
+from turkey_bowl.utils import setup_logger
+
+logger = logging.getLogger('benchmark_shared_points')
+
+# Points table attached by each shared memory worker
+_table: Optional[shared_points.SharedPointsTable] = None
+
+
+def make_player_pts_df(n_players: int, n_stats: int, seed: int = 0) -> pd.DataFrame:
+    """A ``create_player_pts_df`` shaped table of random points."""
+    rng = np.random.default_rng(seed)
+    player_pts_df = pd.DataFrame(
+        {
+            'Player_ID': np.arange(n_players, dtype='int64'),
+            'Player': [f'Player {i}' for i in range(n_players)],
+            'Team': rng.choice(['DET', 'DAL', 'KC', 'GB', 'SF'], n_players),
+            'PROJ_Position': rng.choice(['QB', 'RB', 'WR', 'TE', 'K', 'DEF'], n_players),
+            'PROJ_pts': rng.random(n_players) * 30,
+        }
+    )
+    stats = pd.DataFrame(
+        rng.random((n_players, n_stats)), columns=[f'PROJ_Stat_{i}' for i in range(n_stats)]
+    )
+    return pd.concat([player_pts_df, stats], axis=1)
+
+
+def _score(player_pts_df: pd.DataFrame, player_ids: List[int]) -> float:
+    return float(player_pts_df.loc[player_pts_df['Player_ID'].isin(player_ids), 'PROJ_pts'].sum())
+
+
+def score_pickled(player_pts_df: pd.DataFrame, player_ids: List[int]) -> float:
+    return _score(player_pts_df, player_ids)
+
+
+def _attach(handle: shared_points.PointsTableHandle) -> None:
+    global _table
+    _table = shared_points.attach(handle)
+
+
+def score_shared(player_ids: List[int]) -> float:
+    return _score(_table.rows(player_ids), player_ids)
+
+
+def benchmark(
+    player_pts_df: pd.DataFrame, n_leagues: int, roster_size: int, workers: int
+) -> Dict[str, float]:
+    """Seconds to score ``n_leagues`` leagues with each way of sharing the points."""
+    rng = np.random.default_rng(1)
+    drafts = [
+        rng.choice(player_pts_df['Player_ID'], roster_size, replace=False).tolist()
+        for _ in range(n_leagues)
+    ]
+    timings = {}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as executor:
+        pickled = list(executor.map(score_pickled, [player_pts_df] * n_leagues, drafts))
+    timings['pickle'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with shared_points.publish(player_pts_df) as handle:
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(handle,)) as executor:
+            shared = list(executor.map(score_shared, drafts))
+    timings['shared_memory'] = time.perf_counter() - start
+
+    assert np.allclose(pickled, shared)
+    return timings
+
+
+if __name__ == '__main__':
+    setup_logger(logging.INFO)
+
+    def main(
+        players: int = typer.Option(3000, '--players', help='Rows of the points table.'),
+        stats: int = typer.Option(90, '--stats', help='Stat columns of the points table.'),
+        leagues: List[int] = typer.Option(
+            [10, 100], '--leagues', help='Number of leagues scored (repeatable).'
+        ),
+        roster_size: int = typer.Option(60, '--roster-size', help='Players drafted per league.'),
+        workers: int = typer.Option(4, '--workers', help='Number of processes.'),
+    ):
+        """Compare pickling the points table to each league with sharing it."""
+        player_pts_df = make_player_pts_df(players, stats)
+        logger.info(
+            f'Points table: {player_pts_df.shape}, '
+            + f'{len(pickle.dumps(player_pts_df)) / 1e6:.1f} MB pickled'
+        )
+
+        rows = []
+        for n_leagues in leagues:
+            timings = benchmark(player_pts_df, n_leagues, roster_size, workers)
+            rows.extend(
+                {'leagues': n_leagues, 'method': method, 'seconds': seconds}
+                for method, seconds in timings.items()
+            )
+
+        logger.info(f'\n{pd.DataFrame(rows).round(4).to_string(index=False)}')
+
+    typer.run(main)
@@ -18,9 +18,11 @@ setup(
     package_dir={'': 'src'},
     install_requires=[
         'click-spinner',
+        'ijson',
         'numpy',
         'openpyxl',
         'pandas',
+        'pyarrow',
         'PyQt5',
         'requests',
         'tqdm',
@@ -44,6 +46,7 @@ setup(
             'pytest-freezegun',
             'responses',
         ],
+        'fast': ['pandas>=2.2', 'python-calamine'],
     },
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -1,9 +1,28 @@
 # Local libraries
 from turkey_bowl import aggregate  # noqa: F401
+from turkey_bowl import backfill  # noqa: F401
+from turkey_bowl import breaker  # noqa: F401
 from turkey_bowl import draft  # noqa: F401
+from turkey_bowl import draft_engine  # noqa: F401
 from turkey_bowl import leader_board  # noqa: F401
+from turkey_bowl import leagues  # noqa: F401
+from turkey_bowl import lineup  # noqa: F401
+from turkey_bowl import metrics  # noqa: F401
+from turkey_bowl import player_store  # noqa: F401
+from turkey_bowl import polling  # noqa: F401
+from turkey_bowl import recommend  # noqa: F401
+from turkey_bowl import reconcile  # noqa: F401
+from turkey_bowl import replay  # noqa: F401
+from turkey_bowl import resolve  # noqa: F401
 from turkey_bowl import scrape  # noqa: F401
+from turkey_bowl import search  # noqa: F401
+from turkey_bowl import season_calendar  # noqa: F401
+from turkey_bowl import shared_points  # noqa: F401
+from turkey_bowl import simulate  # noqa: F401
+from turkey_bowl import sources  # noqa: F401
 from turkey_bowl import turkey_bowl_runner  # noqa: F401
 from turkey_bowl import utils  # noqa: F401
+from turkey_bowl import warehouse  # noqa: F401
+from turkey_bowl import writers  # noqa: F401
 
 __version__ = '2024.1'
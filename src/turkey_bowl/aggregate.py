@@ -4,23 +4,24 @@ Data aggregation functions
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Tuple, Union
 
 import pandas as pd
 
-from turkey_bowl import utils
-from turkey_bowl.scrape import Scraper
+from turkey_bowl import resolve, utils, writers
+from turkey_bowl.player_store import PlayerStore
+
+if TYPE_CHECKING:
+    from turkey_bowl.warehouse import StatsWarehouse
 
 logger = logging.getLogger(__name__)
 
 
-def _get_player_pts_stat_type(player_pts: Dict[str, Any]) -> str:
+def _check_stats_types(unique_type: Set[str]) -> str:
     """
-    Helper function to get the stat type within the pulled player
-    points. Will be either 'projectedStats' or 'stats'.
+    Helper function to check that exactly one recognized stats type was
+    found and return it.
     """
-    unique_type = set([list(v.keys())[0] for v in player_pts.values()])
-
     if len(unique_type) > 1:
         raise ValueError(f'More than one unique stats type detected: {unique_type}')
 
@@ -57,7 +58,13 @@ def projected_player_pts_pulled(year: int, week: int, savepath: Path) -> bool:
 
 
 def create_player_pts_df(
-    year: int, week: int, player_pts: Dict[str, Any], savepath: Optional[Path] = None
+    year: int,
+    week: int,
+    player_pts: Union[Dict[str, Any], Iterable[Tuple[str, Dict[str, Any]]]],
+    savepath: Optional[Path] = None,
+    warehouse: Optional['StatsWarehouse'] = None,
+    root: Optional[str] = None,
+    names: bool = True,
 ) -> pd.DataFrame:
     """
     Create a DataFrame to house all player projected and actual points.
@@ -67,34 +74,51 @@ def create_player_pts_df(
     Actual points will need to be pulled multiple times throughout as
     more games are played/completed. Projected points should be pulled
     once and only once.
-    """
-    dir_config = utils.load_dir_config(year)
 
-    # Determine projected ('projectedStats') or actual points ('stats').
-    stats_type = _get_player_pts_stat_type(player_pts)
+    If a ``warehouse`` is given, the points are also stored in it.
 
-    if stats_type == 'projectedStats':
-        prefix = 'PROJ_'
+    Player ids (and stat ids) are read from, and undocumented players
+    resolved into, the assets of ``root`` (see ``utils.load_dir_config``).
 
-        # Projected points should always be saved (pulled only once)
-        if savepath is None:
-            raise ValueError(
-                'When creating a projected player points dataframe, ``savepath`` must be specified.'
-            )
+    Rows are keyed by the integer ``Player_ID``; the ``Player``, ``Team``
+    and ``PROJ_Position`` display columns are only attached if ``names``
+    (``merge_points`` joins on ``Player_ID`` alone).
+    """
+    dir_config = utils.load_dir_config(year, root)
 
-    # _get_player_pts_stat_type handles check and raises error if not
-    # projectedStats or stats
-    else:
-        prefix = 'ACTUAL_'
+    # Player points can be a dict or streamed (player id, player points)
+    # pairs (see ``Scraper.iter_week_player_pts``); unpack as they arrive
+    if isinstance(player_pts, dict):
+        player_pts = player_pts.items()
 
     index = []
     points = []
+    unique_type: Set[str] = set()
+
+    for pid, player_pts_dict in player_pts:
+        # Determine projected ('projectedStats') or actual points ('stats')
+        # from the first player so bad input fails before the rest arrives
+        player_stats_type = list(player_pts_dict.keys())[0]
+        if player_stats_type not in unique_type:
+            unique_type.add(player_stats_type)
+            stats_type = _check_stats_types(unique_type)
+
+            # Projected points should always be saved (pulled only once)
+            if stats_type == 'projectedStats' and savepath is None:
+                raise ValueError(
+                    'When creating a projected player points dataframe, '
+                    + '``savepath`` must be specified.'
+                )
 
-    for pid, player_pts_dict in player_pts.items():
         points_dict = _unpack_player_pts(year, week, player_pts_dict)
         index.append(pid)
         points.append(points_dict)
 
+    # _check_stats_types handles check and raises error if not
+    # projectedStats or stats
+    stats_type = _check_stats_types(unique_type)
+    prefix = 'PROJ_' if stats_type == 'projectedStats' else 'ACTUAL_'
+
     player_pts_df = pd.DataFrame(points, index=index)
 
     # Get definition of each point attribute
@@ -107,62 +131,83 @@ def create_player_pts_df(
     player_pts_df = player_pts_df.reset_index().rename(columns={'index': 'Player'})
 
     # Get definition of each player team and name based on player id
-    player_ids_json_path = dir_config.player_ids_json_path
-    player_ids = utils.load_from_json(player_ids_json_path)
+    player_store = PlayerStore.from_dir_config(dir_config)
+    player_ids = player_store.to_dict()
 
     # It is possible that there are new players when scraping actual points
-    # that don't exist in player_ids.json nor projected points; if so, report and re-pull player ids
+    # that don't exist in player_ids.json nor projected points; if so, report and resolve them
     undocumented_players = set(player_pts_df['Player']).difference(set(player_ids))
     if undocumented_players:
-        scraper = Scraper(year)
+        resolver = resolve.get_resolver(year, root)
+        resolved, errors = resolver.resolve_many(sorted(undocumented_players, key=int))
 
-        for pid in undocumented_players:
-            try:
-                player_metadata = scraper._get_player_metadata(pid)
-                logger.info(f"Undocumented player {pid}: {player_metadata['name']}")
-                scraper._update_single_player_id(pid, player_ids)
-            except Exception:
-                logger.info(f'Error occured for undocumented player {pid}: {player_metadata}')
-                logger.info(f'Removing {pid}...')
-                player_pts_df = player_pts_df[player_pts_df['Player'] != pid]
+        for pid, player_record in resolved.items():
+            logger.info(f"Undocumented player {pid}: {player_record['name']}")
+            player_ids[pid] = player_record
+            player_store.upsert(pid, player_record)
 
-        utils.write_to_json(json_dict=player_ids, filename=scraper.dir_config.player_ids_json_path)
+        for pid, error in errors.items():
+            logger.info(f'Error occured for undocumented player {pid}: {error}')
+            logger.info(f'Removing {pid}...')
+
+        player_pts_df = player_pts_df[~player_pts_df['Player'].isin(errors)]
+        if resolved:
+            # Keep player_ids.json (the committed export) in step with the log
+            player_store.export_json()
+        player_store.maybe_compact()
 
     else:
         logger.info('All player ids in pulled player points exist in player_ids.json')
 
-    team = player_pts_df['Player'].apply(lambda x: player_ids[x]['team'])
-    player_pts_df.insert(1, 'Team', team)
-
-    pos = player_pts_df['Player'].apply(lambda x: player_ids[x]['position'])
-    player_pts_df.insert(2, 'PROJ_Position', pos)
+    # Carry the player id through as the integer join key (see ``merge_points``)
+    player_pts_df = player_pts_df.rename(columns={'Player': 'Player_ID'})
 
-    player_defns = {k: v['name'] for k, v in player_ids.items() if k != 'year'}
-    name = player_pts_df['Player'].apply(lambda x: player_defns[x])
-    player_pts_df['Player'] = name
-
-    # Make pts col the fourth column for easy access
-    pts_col = player_pts_df.filter(regex=f'{prefix}pts')
+    # Make pts col the second column for easy access
     pts_col_name = f'{prefix}pts'
-    player_pts_df = player_pts_df.drop(pts_col_name, axis=1)
-    player_pts_df.insert(3, pts_col_name, pts_col)
+    player_pts_df.insert(1, pts_col_name, player_pts_df.pop(pts_col_name))
 
     # Convert all col types to non-string as strings come from scrape
-    col_types = {}
-    for c in player_pts_df.columns:
-        if c in ('Player', 'Team', 'PROJ_Position'):
-            col_types[c] = 'object'
-        else:
-            col_types[c] = 'float64'
+    col_types = {c: 'float64' for c in player_pts_df.columns}
+    col_types['Player_ID'] = 'int64'
 
     player_pts_df = player_pts_df.astype(col_types)
     player_pts_df = player_pts_df.fillna(0.0)
 
+    # Team, position and name are only attached for display
+    if names:
+        player_pts_df = _attach_player_names(player_pts_df, player_ids)
+
     # Write projected players to csv so only done once
     if stats_type == 'projectedStats':
         logger.info(f'Writing projected player stats to {savepath}...')
         player_pts_df.to_csv(savepath)
 
+    if warehouse is not None:
+        warehouse.write_player_pts_df(
+            year,
+            week,
+            stats_type,
+            player_pts_df if names else _attach_player_names(player_pts_df, player_ids),
+        )
+
+    return player_pts_df
+
+
+def _attach_player_names(player_pts_df: pd.DataFrame, player_ids: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Helper function to insert the ``Player``, ``Team`` and ``PROJ_Position``
+    of each row's ``Player_ID`` (from ``player_ids``) after ``Player_ID``.
+    """
+    players = {int(k): v for k, v in player_ids.items() if k != 'year'}
+    pids = player_pts_df['Player_ID']
+    player_pts_df = player_pts_df.copy()
+
+    for i, (col, key) in enumerate(
+        (('Player', 'name'), ('Team', 'team'), ('PROJ_Position', 'position')), start=1
+    ):
+        values = pids.map({pid: player[key] for pid, player in players.items()})
+        player_pts_df.insert(i, col, values.astype('object'))
+
     return player_pts_df
 
 
@@ -173,12 +218,33 @@ def merge_points(
     Merge participant team with collected player points.
 
     ``pts_df`` can be projected or actual points scraped.
+
+    When both carry a ``Player_ID`` (see ``create_player_pts_df`` and
+    ``reconcile``) teams are merged on that integer key, so two players
+    sharing a name can't be confused; the drafted rows keep their display
+    columns. Otherwise teams are merged on the ``Player`` and ``Team``
+    strings (with a warning, as the draft wasn't reconciled).
     """
+    if 'Player_ID' in pts_df:
+        keyed_pts_df = pts_df.astype({'Player_ID': 'int64'})
+
+    string_merged = []
+
     for participant, participant_team in participant_teams.items():
-        merge_cols = ['Player', 'Team']
-        if ('PROJ_Position' in participant_team) and ('PROJ_Position' in pts_df):
-            merge_cols.append('PROJ_Position')
-        merged = pd.merge(participant_team, pts_df, how='left', on=merge_cols)
+        if ('Player_ID' in participant_team) and ('Player_ID' in pts_df):
+            display_cols = [c for c in ('Player', 'Team', 'PROJ_Position') if c in participant_team]
+            merged = pd.merge(
+                participant_team.astype({'Player_ID': 'Int64'}),
+                keyed_pts_df.drop(columns=display_cols, errors='ignore'),
+                how='left',
+                on='Player_ID',
+            )
+        else:
+            merge_cols = ['Player', 'Team']
+            if ('PROJ_Position' in participant_team) and ('PROJ_Position' in pts_df):
+                merge_cols.append('PROJ_Position')
+            merged = pd.merge(participant_team, pts_df, how='left', on=merge_cols)
+            string_merged.append(participant)
 
         # Drop columns where projected or actual points are 0.0
         # Leave ACTUAL_pts in case they are all 0.0 at start
@@ -200,6 +266,12 @@ def merge_points(
 
         participant_teams[participant] = merged
 
+    if string_merged:
+        logger.info(
+            f'WARNING: No Player_ID to merge points on for {string_merged}; '
+            + 'merged on player names instead (reconcile the draft first).'
+        )
+
     return participant_teams
 
 
@@ -229,31 +301,16 @@ def sort_robust_cols(participant_teams: Dict[str, pd.DataFrame]) -> Dict[str, pd
 
 
 def write_robust_participant_team_scores(
-    participant_teams: Dict[str, pd.DataFrame], savepath: Path
-) -> None:
+    participant_teams: Dict[str, pd.DataFrame], savepath: Path, output_format: str = 'xlsx'
+) -> Path:
     """
-    Writes the total points to an excel file that can be reviewed.
+    Writes the total points to a file (excel by default) that can be reviewed.
+
+    ``output_format`` selects the writer (see ``writers.WRITERS``); the
+    suffix of ``savepath`` is swapped to match. Returns the path written.
     """
+    writer = writers.get_writer(output_format)
+    savepath = writer.path_for(savepath)
     logger.info(f'Writing robust player points summary to {savepath}...')
 
-    with pd.ExcelWriter(savepath) as writer:
-        for participant, participant_team in participant_teams.items():
-            # Write data to sheet
-            participant_team.to_excel(writer, sheet_name=participant, index=False)
-
-            # Auto-format column lengths and center columns
-            worksheet = writer.sheets[participant]
-            workbook = writer.book
-            center = workbook.add_format()
-            center.set_align('center')
-            center.set_align('vcenter')
-
-            for i, col in enumerate(participant_team):
-                series = participant_team[col]
-                max_len = max(series.astype(str).map(len).max(), len(str(series.name)))
-
-                # Add a little extra spacing
-                if col in ('Position', 'Player', 'Team'):
-                    worksheet.set_column(i, i, max_len + 2)
-                else:
-                    worksheet.set_column(i, i, max_len + 2, center)
+    return writer.write(participant_teams, savepath)
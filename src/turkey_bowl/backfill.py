@@ -0,0 +1,153 @@
+"""
+Season-wide backfill of player week stats
+
+Fetches ``weekstats`` (actual) and ``weekprojectedstats`` (projected)
+payloads for a range of seasons and weeks concurrently. Each week is
+handed to a sink as soon as it arrives, so a long backfill streams to
+disk instead of being held in memory until the end.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from turkey_bowl import utils
+from turkey_bowl.scrape import Scraper
+from turkey_bowl.sources import week_path
+
+logger = logging.getLogger(__name__)
+
+STATS_TYPES = ('stats', 'projectedStats')
+
+# (season, week, stats_type)
+WeekKey = Tuple[int, int, str]
+WeekSink = Callable[[int, int, str, Dict[str, Any]], None]
+
+
+def parse_range(spec: str) -> List[int]:
+    """
+    Parse a range spec such as ``'2019-2023'``, ``'1,5,12'`` or
+    ``'1-4,12'`` into a sorted list of ints.
+    """
+    values = set()
+
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        start, _, stop = part.partition('-')
+        stop = stop or start
+        if int(stop) < int(start):
+            raise ValueError(f"Invalid range: '{part}'. Start must not exceed stop.")
+        values.update(range(int(start), int(stop) + 1))
+
+    return sorted(values)
+
+
+def tee(*sinks: WeekSink) -> WeekSink:
+    """Combine several sinks into one that feeds each in turn."""
+
+    def _tee(season: int, week: int, stats_type: str, player_pts: Dict[str, Any]) -> None:
+        for sink in sinks:
+            sink(season, week, stats_type, player_pts)
+
+    return _tee
+
+
+class JSONWeekStore:
+    """
+    Raw player points, one json file per season, week and stats type::
+
+        <backfill_dir>/<season>/<season>_<week>_<stats_type>.json
+    """
+
+    def __init__(self, backfill_dir: Path) -> None:
+        self.backfill_dir = Path(backfill_dir)
+
+    def __repr__(self):
+        return f"JSONWeekStore('{self.backfill_dir}')"
+
+    def path(self, season: int, week: int, stats_type: str) -> Path:
+        return week_path(self.backfill_dir, season, week, stats_type)
+
+    def exists(self, season: int, week: int, stats_type: str) -> bool:
+        return self.path(season, week, stats_type).exists()
+
+    def load(self, season: int, week: int, stats_type: str) -> Dict[str, Any]:
+        return utils.load_from_json(self.path(season, week, stats_type))
+
+    def __call__(self, season: int, week: int, stats_type: str, player_pts: Dict[str, Any]) -> None:
+        path = self.path(season, week, stats_type)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with utils.atomic_path(path) as tmp_path:
+            with open(tmp_path, 'w') as json_file:
+                json.dump(player_pts, json_file)
+
+
+def backfill(
+    seasons: Iterable[int],
+    weeks: Iterable[int],
+    sink: WeekSink,
+    stats_types: Sequence[str] = STATS_TYPES,
+    max_workers: int = 8,
+    skip: Optional[Callable[[int, int, str], bool]] = None,
+    root: Optional[str] = None,
+    base_url: Optional[str] = None,
+) -> Dict[WeekKey, str]:
+    """
+    Fetch every (season, week, stats type) concurrently and pass each to
+    ``sink(season, week, stats_type, player_pts)`` as it completes.
+
+    ``skip(season, week, stats_type)`` can be given to avoid re-fetching
+    weeks that are already stored and ``base_url`` to fetch from somewhere
+    other than NFL.com (see ``Scraper``). Returns the errors of the weeks that
+    could not be fetched, keyed by (season, week, stats type).
+    """
+    for stats_type in stats_types:
+        if stats_type not in STATS_TYPES:
+            raise ValueError(
+                f"Unrecognized stats type: '{stats_type}'. Expected one of {STATS_TYPES}."
+            )
+
+    weeks = list(weeks)
+    scrapers = {season: Scraper(season, root, base_url) for season in seasons}
+    keys = [
+        (season, week, stats_type)
+        for season in scrapers
+        for week in weeks
+        for stats_type in stats_types
+        if skip is None or not skip(season, week, stats_type)
+    ]
+    logger.info(f'Backfilling {len(keys)} weeks of player points...')
+
+    errors: Dict[WeekKey, str] = {}
+
+    with ThreadPoolExecutor(max_workers, thread_name_prefix='backfill') as executor:
+        futures = {
+            executor.submit(
+                scrapers[season].get_week_player_pts,
+                season,
+                week,
+                projected=stats_type == 'projectedStats',
+            ): (season, week, stats_type)
+            for season, week, stats_type in keys
+        }
+
+        for future in as_completed(futures):
+            season, week, stats_type = futures[future]
+            try:
+                player_pts = future.result() or {}
+            except Exception as e:
+                logger.info(f'WARNING: Failed to backfill {season} week {week} {stats_type}: {e}')
+                errors[(season, week, stats_type)] = str(e)
+                continue
+
+            sink(season, week, stats_type, player_pts)
+
+    logger.info(f'Backfilled {len(keys) - len(errors)} of {len(keys)} weeks')
+
+    return errors
@@ -0,0 +1,204 @@
+"""
+Circuit breaker and last good snapshot
+
+During the games a failing API (errors, error documents, timeouts) used
+to crash ``scrape-actual`` and leave the leader board stale without
+saying so. Instead:
+
+- ``CircuitBreaker`` counts consecutive failures of a source. After
+  ``failure_threshold`` failures it opens and requests are refused
+  (``CircuitOpenError``) without touching the API for ``reset_timeout``
+  seconds. Requests are then let through again (half open); a success
+  closes the circuit and a failure re-opens it. The state is persisted
+  so separate ``scrape-actual`` runs share it.
+- ``SnapshotStore`` keeps the last good ACTUAL points per season and week,
+  so a run can serve them (marked stale) while the API is failing.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, NamedTuple, Optional, TypeVar
+
+from turkey_bowl import utils
+from turkey_bowl.sources import week_path
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+T = TypeVar('T')
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a source whose circuit is open."""
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: float = 300.0,
+        state_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state_path = None if state_path is None else Path(state_path)
+        self.clock = clock
+
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dir_config(
+        cls, dir_config: SimpleNamespace, name: str, **kwargs: Any
+    ) -> 'CircuitBreaker':
+        """Breaker persisted at ``<breaker_dir>/<name>.json``."""
+        return cls(name, state_path=dir_config.breaker_dir.joinpath(f'{name}.json'), **kwargs)
+
+    def __repr__(self):
+        return (
+            f"CircuitBreaker('{self.name}', failure_threshold={self.failure_threshold}, "
+            + f'reset_timeout={self.reset_timeout})'
+        )
+
+    def _load(self) -> None:
+        if self.state_path is not None and self.state_path.exists():
+            state = utils.load_from_json(self.state_path)
+            self._failures = state.get('failures', 0)
+            self._opened_at = state.get('opened_at')
+            self._last_error = state.get('last_error')
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            return
+
+        state = {
+            'failures': self._failures,
+            'opened_at': self._opened_at,
+            'last_error': self._last_error,
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with utils.atomic_path(self.state_path) as tmp_path:
+            utils.write_to_json(state, tmp_path)
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self.clock() - self._opened_at < self.reset_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._load()
+            return self._state()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._load()
+            if self._failures or self._opened_at is not None:
+                logger.info(f'Circuit {self.name} closed; the source has recovered.')
+                self._failures = 0
+                self._opened_at = None
+                self._last_error = None
+                self._save()
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self._load()
+            self._failures += 1
+            self._last_error = repr(error)
+
+            # A failed trial (half open) re-opens the circuit for another timeout
+            if self._failures >= self.failure_threshold:
+                if self._state() != OPEN:
+                    logger.info(
+                        f'WARNING: Circuit {self.name} opened after {self._failures} failures '
+                        + f'({self._last_error}); retrying in {self.reset_timeout:.0f}s.'
+                    )
+                self._opened_at = self.clock()
+
+            self._save()
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call ``func`` unless the circuit is open, recording its success or
+        failure. Raises ``CircuitOpenError`` while the circuit is open.
+        """
+        with self._lock:
+            self._load()
+            if self._state() == OPEN:
+                raise CircuitOpenError(
+                    f'Circuit {self.name} is open after {self._failures} failures '
+                    + f'(last: {self._last_error}).'
+                )
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+
+        self.record_success()
+        return result
+
+
+class Snapshot(NamedTuple):
+    """
+    ACTUAL player points with the time they were pulled (``None`` if
+    never) and whether they are a stale fallback.
+    """
+
+    player_pts: Dict[str, Any]
+    as_of: Optional[datetime]
+    stale: bool = False
+
+
+class SnapshotStore:
+    """
+    Last good ACTUAL player points, one json file per season and week::
+
+        <snapshot_dir>/<season>/<season>_<week>_stats.json
+    """
+
+    def __init__(self, snapshot_dir: Path) -> None:
+        self.snapshot_dir = Path(snapshot_dir)
+
+    def __repr__(self):
+        return f"SnapshotStore('{self.snapshot_dir}')"
+
+    def path(self, season: int, week: int) -> Path:
+        return week_path(self.snapshot_dir, season, week, 'stats')
+
+    def save(self, season: int, week: int, player_pts: Dict[str, Any]) -> Snapshot:
+        path = self.path(season, week)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        as_of = datetime.now(timezone.utc)
+
+        with utils.atomic_path(path) as tmp_path:
+            with open(tmp_path, 'w') as json_file:
+                json.dump({'as_of': as_of.isoformat(), 'players': player_pts}, json_file)
+
+        return Snapshot(player_pts, as_of)
+
+    def load(self, season: int, week: int) -> Optional[Snapshot]:
+        """The last good snapshot (marked stale), or ``None`` if there is none."""
+        path = self.path(season, week)
+        if not path.exists():
+            return None
+
+        snapshot = utils.load_from_json(path)
+        return Snapshot(snapshot['players'], datetime.fromisoformat(snapshot['as_of']), stale=True)
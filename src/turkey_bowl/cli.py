@@ -1,15 +1,33 @@
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import typer
 
-from turkey_bowl import __version__, aggregate, utils
+from turkey_bowl import (
+    __version__,
+    aggregate,
+    backfill,
+    leagues,
+    polling,
+    replay,
+    simulate,
+    sources,
+    utils,
+    writers,
+)
+from turkey_bowl.breaker import Snapshot
 from turkey_bowl.draft import Draft
-from turkey_bowl.leader_board import LeaderBoard
+from turkey_bowl.draft_engine import DraftEngine, InvalidPickError
+from turkey_bowl.metrics import METRICS, METRICS_FORMATS
+from turkey_bowl.player_store import PlayerStore
 from turkey_bowl.scrape import Scraper
+from turkey_bowl.search import Match, PlayerIndex, unambiguous_match
+from turkey_bowl.warehouse import StatsWarehouse, load_stat_defns
 
 # Main CLI entry point
 app = typer.Typer(help='Turkey Bowl fantasy football draft CLI')
@@ -21,6 +39,11 @@ HEADER = '\n\n{message:-^72}\n'
 YEAR = utils.get_current_year()
 
 
+METRICS_PATH_ENV_VAR = 'TURKEY_BOWL_METRICS_PATH'
+
+# Matches considered (and listed if ambiguous) by ``pick``
+PICK_CANDIDATES = 5
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,19 +65,26 @@ def clean():
 
 
 @app.command()
-def setup():
+def setup(
+    league: Optional[str] = typer.Option(
+        None, '--league', '-l', help='Set up the draft of this league (see score-leagues).'
+    ),
+):
     """Setup output directory and create draft order."""
     utils.setup_logger()
     logger.info(
         HEADER.format(message=f' {YEAR} Turkey Bowl ') + f'turkey-bowl version: {__version__}\n'
     )
-    draft = Draft(YEAR)
+    draft = Draft(YEAR, league=league)
     draft.setup()
 
 
 @app.command()
 def scrape_projected(
     dry_run: bool = typer.Option(False, '--dry-run', help='Perform a dry run.'),
+    warehouse: bool = typer.Option(
+        True, '--warehouse/--no-warehouse', help='Also store the points in archive/warehouse.'
+    ),
 ):
     """
     Scrape api.fantasy.nfl.com for player PROJECTED points and
@@ -83,17 +113,28 @@ def scrape_projected(
             week=week,
             player_pts=projected_player_pts,
             savepath=projected_player_pts_path,
+            warehouse=StatsWarehouse(draft.dir_config.warehouse_dir) if warehouse else None,
         )
 
 
 @app.command()
 def scrape_actual(
     dry_run: bool = typer.Option(False, '--dry-run', help='Perform a dry run.'),
+    warehouse: bool = typer.Option(
+        True, '--warehouse/--no-warehouse', help='Also store the points in archive/warehouse.'
+    ),
+    output_format: str = typer.Option(
+        'xlsx',
+        '--output-format',
+        '-f',
+        help=f'Format of the robust points and leader board outputs {list(writers.WRITERS)}.',
+    ),
 ):
     """
     Scrape api.fantasy.nfl.com for player ACTUAL points and
     merge with participant drafted teams.
     """
+    writers.get_writer(output_format)  # fail fast on an unknown format
     utils.setup_logger()
     logger.info(HEADER.format(message=' Scraping Player Actual Points '))
     draft = Draft(YEAR)
@@ -117,39 +158,534 @@ def scrape_actual(
         f'{draft.dir_config.output_dir}/{YEAR}_{week}_projected_player_pts.csv'
     )
     projected_player_pts_df = pd.read_csv(projected_player_pts_path, index_col=0)
-    actual_player_pts = scraper.get_actual_player_pts()
+    participant_teams = leagues.reconcile_league(draft, participant_teams, projected_player_pts_df)
+    _update_leader_board(
+        draft,
+        participant_teams,
+        week,
+        projected_player_pts_df,
+        scraper.get_actual_snapshot(),
+        output_format,
+        warehouse,
+    )
+
+
+def _actual_player_pts_df(
+    dir_config: SimpleNamespace,
+    week: int,
+    projected_player_pts_df: pd.DataFrame,
+    actual: Snapshot,
+    warehouse: bool = True,
+) -> pd.DataFrame:
+    """
+    ACTUAL points of a snapshot (0.0 for every projected player if empty),
+    stored in the warehouse if ``warehouse``.
+    """
+    if actual.player_pts:
+        return aggregate.create_player_pts_df(
+            year=YEAR,
+            week=week,
+            player_pts=actual.player_pts,
+            savepath=None,
+            names=False,
+            # Stale points were already stored when they were pulled
+            warehouse=(
+                StatsWarehouse(dir_config.warehouse_dir) if warehouse and not actual.stale else None
+            ),
+        )
+
+    actual_player_pts_df = projected_player_pts_df.filter(['Player_ID', 'Player', 'Team'])
+    actual_player_pts_df['ACTUAL_pts'] = 0.0
+    return actual_player_pts_df
+
+
+def _update_leader_board(
+    draft: Draft,
+    participant_teams: Dict[str, pd.DataFrame],
+    week: int,
+    projected_player_pts_df: pd.DataFrame,
+    actual: Snapshot,
+    output_format: str,
+    warehouse: bool = True,
+) -> None:
+    """
+    Merge ACTUAL points with the drafted teams and write the leader board
+    (marked stale if the points are a fallback snapshot).
+
+    ``participant_teams`` is left as drafted so this can be called per pull.
+    """
+    board = leagues.score_draft(
+        draft,
+        participant_teams,
+        week,
+        projected_player_pts_df,
+        _actual_player_pts_df(draft.dir_config, week, projected_player_pts_df, actual, warehouse),
+        output_format=output_format,
+        stale=actual.stale,
+        as_of=actual.as_of,
+    )
+    board.display()
+
+
+@app.command()
+def watch(
+    ctx: typer.Context,
+    warehouse: bool = typer.Option(
+        True, '--warehouse/--no-warehouse', help='Also store the points in archive/warehouse.'
+    ),
+    output_format: str = typer.Option(
+        'json',
+        '--output-format',
+        '-f',
+        help=f'Format of the robust points and leader board outputs {list(writers.WRITERS)}.',
+    ),
+    live_interval: float = typer.Option(
+        60.0, help='Seconds between pulls while a drafted team is playing.'
+    ),
+    halftime_interval: float = typer.Option(60.0 * 5, help='Seconds between polls at halftime.'),
+    idle_interval: float = typer.Option(
+        60.0 * 15, help='Seconds between polls between games (never past a kickoff).'
+    ),
+):
+    """
+    Keep the leader board up to date through the Thanksgiving games,
+    pulling ACTUAL points only while a drafted player's game is live.
+    """
+    writers.get_writer(output_format)  # fail fast on an unknown format
+    utils.setup_logger()
+    logger.info(HEADER.format(message=' Watching Thanksgiving Games '))
+    draft = Draft(YEAR)
+    participant_teams = draft.load()
+
+    if not draft.check_players_have_been_drafted(participant_teams):
+        logger.info(
+            f'\nNot all players have been drafted yet! Please complete the draft for {YEAR}.'
+        )
+        raise typer.Abort()
+
+    scraper = Scraper(YEAR)
+    week = scraper.nfl_thanksgiving_calendar_week
 
-    if actual_player_pts:
-        actual_player_pts_df = aggregate.create_player_pts_df(
-            year=YEAR, week=week, player_pts=actual_player_pts, savepath=None
+    projected_player_pts_path = Path(
+        f'{draft.dir_config.output_dir}/{YEAR}_{week}_projected_player_pts.csv'
+    )
+    projected_player_pts_df = pd.read_csv(projected_player_pts_path, index_col=0)
+    participant_teams = leagues.reconcile_league(draft, participant_teams, projected_player_pts_df)
+
+    # Only the games of drafted players' teams matter
+    key = 'Player_ID' if 'Player_ID' in projected_player_pts_df else 'Player'
+    drafted = {player for team in participant_teams.values() for player in team[key].dropna()}
+    is_drafted = projected_player_pts_df[key].isin(drafted)
+    teams = set(projected_player_pts_df.loc[is_drafted, 'Team'].dropna())
+
+    metrics_path = getattr(ctx.obj, 'metrics_path', None)
+
+    def on_update(actual: Snapshot) -> None:
+        _update_leader_board(
+            draft,
+            participant_teams,
+            week,
+            projected_player_pts_df,
+            actual,
+            output_format,
+            warehouse,
         )
+        if metrics_path is not None:
+            METRICS.write(metrics_path)
+
+    pulls = polling.watch(
+        scraper,
+        on_update,
+        policy=polling.PollPolicy(live_interval, halftime_interval, idle_interval),
+        teams=teams,
+        fetch=scraper.get_actual_snapshot,
+    )
+    logger.info(f'Done watching after {pulls} player points pulls.')
+
+
+@app.command(name='score-leagues')
+def score_leagues_cmd(
+    league: Optional[List[str]] = typer.Option(
+        None, '--league', '-l', help='League to score (repeatable, default: every league).'
+    ),
+    output_format: str = typer.Option(
+        'xlsx',
+        '--output-format',
+        '-f',
+        help=f'Format of the robust points and leader board outputs {list(writers.WRITERS)}.',
+    ),
+    workers: Optional[int] = typer.Option(
+        None, '--workers', help='Number of processes (default: one per CPU).'
+    ),
+    warehouse: bool = typer.Option(
+        True, '--warehouse/--no-warehouse', help='Also store the points in archive/warehouse.'
+    ),
+):
+    """
+    Scrape PROJECTED and ACTUAL points once and update the leader board of
+    every league (set up with `setup --league`).
+    """
+    writers.get_writer(output_format)  # fail fast on an unknown format
+    utils.setup_logger()
+    logger.info(HEADER.format(message=' Scoring Leagues '))
+    leagues_to_score = league or utils.list_leagues(YEAR)
+    if not leagues_to_score:
+        typer.echo(f'No leagues found for {YEAR}. Set one up with `setup --league`.')
+        raise typer.Exit(code=1)
+
+    dir_config = utils.load_dir_config(YEAR)
+    scraper = Scraper(YEAR)
+    week = scraper.nfl_thanksgiving_calendar_week
+
+    # Points are scraped into the season directory, shared by every league
+    projected_player_pts_path = Path(
+        f'{dir_config.season_dir}/{YEAR}_{week}_projected_player_pts.csv'
+    )
+    if aggregate.projected_player_pts_pulled(YEAR, week, savepath=projected_player_pts_path):
+        projected_player_pts_df = pd.read_csv(projected_player_pts_path, index_col=0)
     else:
-        actual_player_pts_df = projected_player_pts_df[['Player', 'Team']].copy()
-        actual_player_pts_df['ACTUAL_pts'] = 0.0
+        dir_config.season_dir.mkdir(parents=True, exist_ok=True)
+        projected_player_pts = scraper.get_projected_player_pts()
+        scraper.update_player_ids(projected_player_pts)
+        projected_player_pts_df = aggregate.create_player_pts_df(
+            year=YEAR,
+            week=week,
+            player_pts=projected_player_pts,
+            savepath=projected_player_pts_path,
+            warehouse=StatsWarehouse(dir_config.warehouse_dir) if warehouse else None,
+        )
+
+    actual = scraper.get_actual_snapshot()
+    boards = leagues.score_leagues(
+        YEAR,
+        week,
+        leagues_to_score,
+        projected_player_pts_df,
+        _actual_player_pts_df(dir_config, week, projected_player_pts_df, actual, warehouse),
+        output_format=output_format,
+        stale=actual.stale,
+        as_of=actual.as_of,
+        max_workers=workers,
+    )
+
+    for name, board in boards.items():
+        logger.info(HEADER.format(message=f' {name} '))
+        if board is None:
+            logger.info(
+                f'Not all players have been drafted yet! Please complete the draft of {name}.'
+            )
+        else:
+            board.display()
+
+
+@app.command()
+def find(
+    query: str = typer.Argument(..., help='Player name (or the start of one), e.g. "amon ra".'),
+    limit: int = typer.Option(10, '--limit', '-n', help='Maximum number of players to list.'),
+    team: Optional[str] = typer.Option(None, '--team', help='Only players of this team.'),
+    position: Optional[str] = typer.Option(
+        None, '--position', help='Only players of this position.'
+    ),
+):
+    """
+    Search players by name (prefix or fuzzy), ranked by projected points,
+    for entering draft picks.
+    """
+    scraper = Scraper(YEAR)
+    week = scraper.nfl_thanksgiving_calendar_week
+    index = PlayerIndex.from_dir_config(
+        scraper.dir_config,
+        Path(f'{scraper.dir_config.output_dir}/{YEAR}_{week}_projected_player_pts.csv'),
+    )
 
-    # Merge points to teams
-    participant_teams = aggregate.merge_points(
-        participant_teams, projected_player_pts_df, verbose=False
+    matches = index.find(query, limit, team=team, position=position)
+    if not matches:
+        typer.echo(f'No players found for "{query}".')
+        raise typer.Exit(code=1)
+
+    typer.echo(_matches_df(matches).to_string(index=False))
+
+
+def _matches_df(matches: List[Match]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{**match.entry._asdict(), 'score': match.score} for match in matches]
+    ).rename(
+        columns={
+            'player_id': 'Player_ID',
+            'name': 'Player',
+            'team': 'Team',
+            'position': 'Position',
+            'proj_pts': 'PROJ_pts',
+        }
     )
 
-    participant_teams = aggregate.merge_points(
-        participant_teams, actual_player_pts_df, verbose=True
+
+def _draft_engine(draft: Draft) -> Tuple[DraftEngine, PlayerIndex]:
+    """Draft engine (resumed from its pick log) and the player index it drafts from."""
+    week = Scraper(YEAR).nfl_thanksgiving_calendar_week
+    index = PlayerIndex.from_dir_config(
+        draft.dir_config,
+        Path(f'{draft.dir_config.output_dir}/{YEAR}_{week}_projected_player_pts.csv'),
     )
+    return DraftEngine.from_dir_config(draft.dir_config, index.entries), index
+
 
-    # Sort robust columns so actual is next to projected
-    participant_teams = aggregate.sort_robust_cols(participant_teams)
+@app.command()
+def pick(
+    query: str = typer.Argument(..., help='Drafted player name (or the start of one).'),
+    team: Optional[str] = typer.Option(None, '--team', help='Only players of this team.'),
+    position: Optional[str] = typer.Option(
+        None, '--position', help='Only players of this position.'
+    ),
+    slot: Optional[str] = typer.Option(
+        None, '--slot', help='Roster slot to fill (default: the first open slot that fits).'
+    ),
+    yes: bool = typer.Option(
+        False, '--yes', '-y', help='Draft the top match even if QUERY is ambiguous.'
+    ),
+):
+    """
+    Draft the match for QUERY for the participant on the clock; the draft
+    sheet is rewritten from the pick log.
 
-    # Write robust scores to excel for reviewing if desired
-    aggregate.write_robust_participant_team_scores(
-        participant_teams=participant_teams,
-        savepath=Path(
-            f'{draft.dir_config.output_dir}/{YEAR}_{week}_robust_participant_player_pts.xlsx'
-        ),
+    If QUERY doesn't clearly mean one player, the candidates are listed
+    and nothing is drafted (unless --yes).
+    """
+    utils.setup_logger()
+    draft = Draft(YEAR)
+    engine, index = _draft_engine(draft)
+
+    matches = index.find(query, limit=PICK_CANDIDATES, team=team, position=position)
+    if not matches:
+        typer.echo(f'No players found for "{query}".')
+        raise typer.Exit(code=1)
+
+    match = matches[0] if yes else unambiguous_match(query, matches)
+    if match is None:
+        typer.echo(f'"{query}" is ambiguous:')
+        typer.echo(_matches_df(matches).to_string(index=False))
+        typer.echo('Narrow it down (full name, --team or --position) or pass --yes.')
+        raise typer.Exit(code=1)
+
+    try:
+        drafted = engine.pick(engine.on_the_clock, match.entry.player_id, slot)
+    except InvalidPickError as error:
+        typer.echo(str(error))
+        raise typer.Exit(code=1)
+
+    engine.export(draft.sheet_path)
+    entry = engine.players[drafted.player_id]
+    typer.echo(
+        f'Pick {drafted.number}: {drafted.participant} drafts {entry.name} ({entry.team}) '
+        + f'at {drafted.slot}'
     )
+    if not engine.is_complete:
+        typer.echo(f'On the clock: {engine.on_the_clock} (pick {engine.pick_number})')
 
-    board = LeaderBoard(YEAR, participant_teams)
-    board.display()
-    board.save(Path(f'{draft.dir_config.output_dir}/{YEAR}_leader_board.xlsx'))
+
+@app.command()
+def unpick():
+    """Take back the last draft pick and rewrite the draft sheet."""
+    utils.setup_logger()
+    draft = Draft(YEAR)
+    engine, _ = _draft_engine(draft)
+
+    try:
+        undone = engine.undo()
+    except InvalidPickError as error:
+        typer.echo(str(error))
+        raise typer.Exit(code=1)
+
+    engine.export(draft.sheet_path)
+    typer.echo(f'Undid pick {undone.number} ({undone.participant})')
+    typer.echo(f'On the clock: {engine.on_the_clock} (pick {engine.pick_number})')
+
+
+@app.command()
+def recommend(
+    participant: Optional[str] = typer.Option(
+        None, '--participant', '-p', help='Participant to recommend for (default: on the clock).'
+    ),
+    limit: int = typer.Option(5, '--limit', '-n', help='Maximum number of players to list.'),
+):
+    """
+    List the best available players by projected points for the open
+    roster slots of the participant on the clock.
+    """
+    draft = Draft(YEAR)
+    engine, _ = _draft_engine(draft)
+
+    if participant is not None and participant not in engine.rosters:
+        typer.echo(
+            f"Unrecognized participant: '{participant}'. Expected one of {engine.draft_order}."
+        )
+        raise typer.Exit(code=1)
+
+    recommendations = engine.recommend(participant, limit)
+    if not recommendations:
+        typer.echo('No players to recommend.')
+        raise typer.Exit(code=1)
+
+    recommendations_df = pd.DataFrame(
+        [{**rec.entry._asdict(), 'slot': rec.slot} for rec in recommendations]
+    ).rename(
+        columns={
+            'player_id': 'Player_ID',
+            'name': 'Player',
+            'team': 'Team',
+            'position': 'Position',
+            'proj_pts': 'PROJ_pts',
+            'slot': 'Slot',
+        }
+    )
+    typer.echo(f'Best available for {participant or engine.on_the_clock}:')
+    typer.echo(recommendations_df.to_string(index=False))
+
+
+@app.command(name='simulate')
+def simulate_cmd(
+    sims: int = typer.Option(1000, '--sims', help='Number of mock drafts.'),
+    participants: Optional[int] = typer.Option(
+        None, '--participants', help='Number of participants (default: the draft order).'
+    ),
+    strategy: str = typer.Option(
+        'noisy',
+        '--strategy',
+        help=f'Pick strategy {list(simulate.STRATEGIES)} for every participant, '
+        + 'or one per draft slot separated by commas.',
+    ),
+    seed: int = typer.Option(0, '--seed', help='Random seed (same seed, same results).'),
+    workers: Optional[int] = typer.Option(
+        None, '--workers', help='Number of processes (default: one per CPU).'
+    ),
+    output_path: Optional[Path] = typer.Option(
+        None, '--output', help='Also write every mock draft result to this csv.'
+    ),
+):
+    """
+    Run mock drafts and report the projected and historical Thanksgiving
+    points of the rosters by draft slot.
+    """
+    utils.setup_logger()
+    logger.info(HEADER.format(message=' Simulating Mock Drafts '))
+    draft = Draft(YEAR)
+
+    if participants is None:
+        participants = (
+            len(utils.load_from_json(draft.dir_config.draft_order_path))
+            if draft.dir_config.draft_order_path.exists()
+            else 6
+        )
+
+    strategies = [name.strip() for name in strategy.split(',')]
+    if len(strategies) == 1:
+        strategies = strategies * participants
+    elif len(strategies) != participants:
+        typer.echo(f'Expected 1 or {participants} strategies, got {len(strategies)}.')
+        raise typer.Exit(code=1)
+
+    week = Scraper(YEAR).nfl_thanksgiving_calendar_week
+    index = PlayerIndex.from_dir_config(
+        draft.dir_config,
+        Path(f'{draft.dir_config.output_dir}/{YEAR}_{week}_projected_player_pts.csv'),
+    )
+    thanksgiving_pts = StatsWarehouse(draft.dir_config.warehouse_dir).thanksgiving_pts()
+
+    results = simulate.simulate(
+        index.entries,
+        strategies,
+        n_sims=sims,
+        seed=seed,
+        actual_pts={str(pid): pts for pid, pts in thanksgiving_pts.items()},
+        max_workers=workers,
+    )
+    if output_path is not None:
+        results.to_csv(output_path, index=False)
+        logger.info(f'Wrote mock draft results to {output_path}')
+
+    logger.info(f'\n{simulate.summarize(results)}\n')
+
+
+@app.command(name='backfill')
+def backfill_cmd(
+    seasons: str = typer.Option(
+        str(YEAR), '--seasons', '-s', help="Seasons to fetch, e.g. '2019-2023' or '2021,2023'."
+    ),
+    weeks: str = typer.Option('1-18', '--weeks', '-w', help="Weeks to fetch, e.g. '1-18'."),
+    projected: bool = typer.Option(
+        True, '--projected/--no-projected', help='Also fetch projected points.'
+    ),
+    workers: int = typer.Option(8, '--workers', help='Number of concurrent requests.'),
+    overwrite: bool = typer.Option(False, '--overwrite', help='Re-fetch weeks already stored.'),
+    warehouse: bool = typer.Option(
+        True, '--warehouse/--no-warehouse', help='Also store weeks in archive/warehouse.'
+    ),
+):
+    """
+    Fetch api.fantasy.nfl.com player points for a range of seasons and
+    weeks and store the raw payloads in archive/backfill.
+    """
+    utils.setup_logger()
+    logger.info(HEADER.format(message=' Backfilling Player Points '))
+    dir_config = utils.load_dir_config(YEAR)
+    store = backfill.JSONWeekStore(dir_config.backfill_dir)
+    stats_types = backfill.STATS_TYPES if projected else ('stats',)
+
+    sink = store
+    if warehouse:
+        warehouse_sink = StatsWarehouse(dir_config.warehouse_dir).sink(
+            player_ids=PlayerStore.from_dir_config(dir_config).to_dict(),
+            stat_defns=load_stat_defns(dir_config.stat_ids_json_path),
+        )
+        sink = backfill.tee(store, warehouse_sink)
+
+    errors = backfill.backfill(
+        seasons=backfill.parse_range(seasons),
+        weeks=backfill.parse_range(weeks),
+        sink=sink,
+        stats_types=stats_types,
+        max_workers=workers,
+        skip=None if overwrite else store.exists,
+    )
+
+    if errors:
+        raise typer.Exit(code=1)
+
+
+@app.command(name='replay')
+def replay_cmd(
+    port: int = typer.Option(8080, '--port', '-p', help='Port to serve on.'),
+    latency: float = typer.Option(0.0, '--latency', help='Seconds added to every response.'),
+    jitter: float = typer.Option(0.0, '--jitter', help='Maximum +/- seconds of random latency.'),
+    error_rate: float = typer.Option(
+        0.0, '--error-rate', help='Fraction of requests failed with a 503.'
+    ),
+    rate_limit: Optional[float] = typer.Option(
+        None, '--rate-limit', help='Requests per second allowed before 429s.'
+    ),
+    seed: Optional[int] = typer.Option(None, '--seed', help='Random seed for jitter and errors.'),
+):
+    """
+    Replay the player points stored by backfill (and the stored player
+    ids) as a local stand-in for api.fantasy.nfl.com. Point scraping at it
+    with TURKEY_BOWL_BASE_URL=http://127.0.0.1:<port>/v2.
+    """
+    utils.setup_logger()
+    logger.info(HEADER.format(message=' Replaying NFL.com '))
+    server = replay.ReplayServer.from_dir_config(
+        utils.load_dir_config(YEAR),
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+        rate_limit=rate_limit,
+        seed=seed,
+        port=port,
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info(f'Served {server.counts}')
 
 
 def version_callback(value: bool):
@@ -163,6 +699,7 @@ def version_callback(value: bool):
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: Optional[bool] = typer.Option(
         None,
         '--version',
@@ -171,8 +708,32 @@ def main(
         is_eager=True,
         help='Report current version of turkey-bowl package.',
     ),
+    source: Optional[str] = typer.Option(
+        None,
+        '--source',
+        envvar=sources.SOURCE_ENV_VAR,
+        help=f"Player data source {list(sources.SOURCES)}, e.g. 'file:archive/backfill'.",
+    ),
+    metrics_path: Optional[Path] = typer.Option(
+        None,
+        '--metrics-path',
+        envvar=METRICS_PATH_ENV_VAR,
+        help=f'Write scrape metrics to this file at the end of the run {list(METRICS_FORMATS)}.',
+    ),
 ):
-    return
+    if source is not None:
+        sources.get_source(source, utils.load_dir_config(YEAR))  # fail fast on a bad source
+        # Picked up by every Scraper (including those on worker threads)
+        os.environ[sources.SOURCE_ENV_VAR] = source
+
+    ctx.obj = SimpleNamespace(metrics_path=metrics_path)
+    if metrics_path is not None:
+        if metrics_path.suffix not in METRICS_FORMATS:
+            raise typer.BadParameter(
+                f"Unrecognized metrics file suffix: '{metrics_path.suffix}'. "
+                + f'Expected one of {list(METRICS_FORMATS)}.'
+            )
+        ctx.call_on_close(lambda: METRICS.write(metrics_path))
 
 
 if __name__ == '__main__':
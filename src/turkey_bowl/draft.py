@@ -1,5 +1,19 @@
 """
 Draft functions
+
+The draft sheet (participant teams with 'Position', 'Player' and 'Team'
+columns) can be kept in one of ``DRAFT_SHEET_FORMATS``:
+
+* ``xlsx``: one excel spreadsheet, one sheet per participant
+  (``<year>_draft_sheet.xlsx``)
+* ``csv``: a directory of one csv file per participant
+  (``<year>_draft_sheets/<Participant>.csv``)
+* ``json``: one json file of rows by participant
+  (``<year>_draft_sheet.json``)
+
+Excel spreadsheets are read with the calamine engine when
+``python-calamine`` is installed (much faster than openpyxl) and with
+openpyxl otherwise (or if pandas, before 2.2, doesn't know calamine).
 """
 
 import itertools
@@ -7,31 +21,205 @@ import json
 import logging
 import random
 import time
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
 
 import click_spinner
 import pandas as pd
 
 from turkey_bowl import utils
 
+try:
+    import python_calamine  # noqa: F401
+
+    XLSX_ENGINE = 'calamine'
+except ImportError:
+    XLSX_ENGINE = 'openpyxl'
+
 logger = logging.getLogger(__name__)
 
+# Roster slots of each participant, in draft sheet order
+ROSTER_SLOTS = [
+    'QB',
+    'RB_1',
+    'RB_2',
+    'WR_1',
+    'WR_2',
+    'TE',
+    'Flex (RB/WR/TE)',
+    'K',
+    'Defense (Team Name)',
+    'Bench (RB/WR/TE)',
+]
+
+
+SheetReader = Callable[[Path], Dict[str, pd.DataFrame]]
+SheetWriter = Callable[[Dict[str, pd.DataFrame], Path], None]
+
+
+def read_xlsx_sheet(path: Path, engine: str = XLSX_ENGINE) -> Dict[str, pd.DataFrame]:
+    """Read participant teams from an excel spreadsheet, one sheet per participant."""
+    try:
+        return pd.read_excel(path, sheet_name=None, engine=engine)
+    except ValueError as e:
+        if engine == 'openpyxl' or not str(e).startswith('Unknown engine'):
+            raise
+
+    logger.info(f'WARNING: pandas {pd.__version__} has no {engine} engine; using openpyxl.')
+    return pd.read_excel(path, sheet_name=None, engine='openpyxl')
+
+
+def write_xlsx_sheet(participant_teams: Dict[str, pd.DataFrame], savepath: Path) -> None:
+    with pd.ExcelWriter(savepath) as writer:
+        for participant, participant_team in participant_teams.items():
+            participant_team.to_excel(writer, sheet_name=participant.title(), index=False)
+
+            # Ensure Position text is correct spacing length
+            worksheet = writer.sheets[participant.title()]
+            max_len = max(map(len, participant_team['Position']))
+            worksheet.set_column(0, 0, max_len)
+
+
+def read_csv_sheets(path: Path) -> Dict[str, pd.DataFrame]:
+    """
+    Read participant teams from a directory of csv files, one per
+    participant (named after the file, in alphabetical order).
+    """
+    return {
+        csv_path.stem: pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+        for csv_path in sorted(Path(path).glob('*.csv'))
+    }
+
+
+def write_csv_sheets(participant_teams: Dict[str, pd.DataFrame], savepath: Path) -> None:
+    savepath = Path(savepath)
+    savepath.mkdir(parents=True, exist_ok=True)
+    for participant, participant_team in participant_teams.items():
+        participant_team.to_csv(savepath.joinpath(f'{participant.title()}.csv'), index=False)
+
+
+def read_json_sheet(path: Path) -> Dict[str, pd.DataFrame]:
+    """Read participant teams from a json file of rows by participant."""
+    participant_rows = utils.load_from_json(path)
+    return {
+        participant: pd.DataFrame(rows, dtype=str) for participant, rows in participant_rows.items()
+    }
+
+
+def write_json_sheet(participant_teams: Dict[str, pd.DataFrame], savepath: Path) -> None:
+    participant_rows = {
+        participant.title(): participant_team.to_dict(orient='records')
+        for participant, participant_team in participant_teams.items()
+    }
+    with open(savepath, 'w') as sheet_file:
+        json.dump(participant_rows, sheet_file, indent=2)
+
+
+DRAFT_SHEET_FORMATS: Dict[str, Tuple[SheetReader, SheetWriter]] = {
+    'xlsx': (read_xlsx_sheet, write_xlsx_sheet),
+    'csv': (read_csv_sheets, write_csv_sheets),
+    'json': (read_json_sheet, write_json_sheet),
+}
+
+# ``dir_config`` attribute of the draft sheet path of each format
+DRAFT_SHEET_PATHS = {
+    'xlsx': 'draft_sheet_path',
+    'csv': 'draft_sheet_csv_dir',
+    'json': 'draft_sheet_json_path',
+}
+
+
+def get_draft_sheet_format(sheet_format: str) -> Tuple[SheetReader, SheetWriter]:
+    """Return the (reader, writer) registered for ``sheet_format`` (e.g. 'csv')."""
+    try:
+        return DRAFT_SHEET_FORMATS[sheet_format]
+    except KeyError:
+        raise ValueError(
+            f"Unrecognized draft sheet format: '{sheet_format}'. "
+            + f'Expected one of {list(DRAFT_SHEET_FORMATS)}.'
+        ) from None
+
+
+def sheet_format_of(path: Path) -> str:
+    """Draft sheet format of ``path`` from its suffix (no suffix is a csv directory)."""
+    suffix = Path(path).suffix.lstrip('.')
+    return suffix or 'csv'
+
+
+def read_draft_sheet(path: Path, sheet_format: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """Read participant teams from a draft sheet of any format (see ``sheet_format_of``)."""
+    reader, _ = get_draft_sheet_format(sheet_format or sheet_format_of(path))
+    return reader(path)
+
+
+def write_draft_sheet(
+    participant_teams: Dict[str, pd.DataFrame], savepath: Path, sheet_format: Optional[str] = None
+) -> None:
+    """
+    Write participant teams (with 'Position', 'Player' and 'Team' columns)
+    to the draft sheet, one sheet per participant.
+    """
+    _, writer = get_draft_sheet_format(sheet_format or sheet_format_of(savepath))
+    writer(participant_teams, savepath)
+
 
 class Draft:
-    def __init__(self, year: int, root: Optional[str] = None) -> None:
-        self.dir_config = utils.load_dir_config(year, root)
+    _sheet_format: Optional[str] = None
+    league: Optional[str] = None
+
+    def __init__(
+        self,
+        year: int,
+        root: Optional[str] = None,
+        sheet_format: Optional[str] = None,
+        league: Optional[str] = None,
+    ) -> None:
+        self.dir_config = utils.load_dir_config(year, root, league)
         self.year = year
+        self.league = league
+        if sheet_format is not None:
+            get_draft_sheet_format(sheet_format)  # fail fast on an unknown format
+        self._sheet_format = sheet_format
 
     def __repr__(self):
+        if self.league is not None:
+            return f"Draft({self.year}, league='{self.league}')"
         return f'Draft({self.year})'
 
     def __str__(self):
+        if self.league is not None:
+            return f'Turkey Bowl Draft: {self.year} ({self.league})'
         return f'Turkey Bowl Draft: {self.year}'
 
+    @property
+    def sheet_format(self) -> str:
+        """
+        Format of the draft sheet: as given, else the format of the existing
+        draft sheet (``xlsx`` first), else ``xlsx``.
+        """
+        if self._sheet_format is not None:
+            return self._sheet_format
+
+        paths = {
+            sheet_format: getattr(self.dir_config, attr, None)
+            for sheet_format, attr in DRAFT_SHEET_PATHS.items()
+        }
+        existing = [sheet_format for sheet_format, path in paths.items() if path and path.exists()]
+        if len(existing) > 1:
+            logger.info(
+                f'WARNING: Found draft sheets in several formats {existing}; using {existing[0]}.'
+            )
+        return existing[0] if existing else 'xlsx'
+
+    @property
+    def sheet_path(self) -> Path:
+        """Path of the draft sheet (a directory for ``csv``)."""
+        return getattr(self.dir_config, DRAFT_SHEET_PATHS[self.sheet_format])
+
     def setup(self) -> None:
         """Instantiate draft with attributes, files, and directories."""
         if not self.dir_config.output_dir.exists():
-            self.dir_config.output_dir.mkdir()
+            self.dir_config.output_dir.mkdir(parents=True)
 
         if not self.dir_config.draft_order_path.exists():
             participant_list = input('Please enter participants separated by a comma: ').split(',')
@@ -65,53 +253,40 @@ class Draft:
 
             logger.info(f'Draft Order: {self.draft_order}')
 
-        if not self.dir_config.draft_sheet_path.exists():
-            draft_info = {
-                'Position': [
-                    'QB',
-                    'RB_1',
-                    'RB_2',
-                    'WR_1',
-                    'WR_2',
-                    'TE',
-                    'Flex (RB/WR/TE)',
-                    'K',
-                    'Defense (Team Name)',
-                    'Bench (RB/WR/TE)',
-                ],
-                'Player': [' '] * 10,  # intentional space so strip works in load
-                'Team': [' '] * 10,  # intentional space so strip works in load
-            }
-            draft_df = pd.DataFrame(draft_info)
-
-            with pd.ExcelWriter(self.dir_config.draft_sheet_path) as writer:
-                for participant in self.draft_order:
-                    draft_df.to_excel(writer, sheet_name=participant.title(), index=False)
-
-                    # Ensure Position text is correct spacing length
-                    worksheet = writer.sheets[participant.title()]
-                    max_len = max(map(len, draft_info['Position']))
-                    worksheet.set_column(0, 0, max_len)
+        if not self.sheet_path.exists():
+            draft_df = pd.DataFrame(
+                {
+                    'Position': ROSTER_SLOTS,
+                    'Player': [' '] * len(ROSTER_SLOTS),  # intentional space so strip works in load
+                    'Team': [' '] * len(ROSTER_SLOTS),  # intentional space so strip works in load
+                }
+            )
+            write_draft_sheet(
+                {participant: draft_df for participant in self.draft_order},
+                self.sheet_path,
+                self.sheet_format,
+            )
 
     def load(self) -> Dict[str, pd.DataFrame]:
         """
-        Loads draft data by parsing excel spreadsheet.
+        Loads draft data by parsing the draft sheet (see ``sheet_format``).
 
         The drafted teams should be collected within one excel
-        spreadsheet in which each participant is a separate sheet.
+        spreadsheet in which each participant is a separate sheet, one
+        directory in which each participant is a separate csv file, or
+        one json file of rows by participant.
 
-        The sheet names correspond to the names of the participants and
-        each sheet should have a 'Position' column, a 'Player', and a
+        The sheet (file) names correspond to the names of the participants
+        and each sheet should have a 'Position' column, a 'Player', and a
         'Team' column.
 
-        For the time being, the draft-able positions are as follows:
+        For the time being, the draft-able positions are as follows
+        (``ROSTER_SLOTS``):
             'QB', 'RB_1', 'RB_2', 'WR_1', 'WR_2', 'TE',
             'Flex (RB/WR/TE)', 'K', 'Defense (Team Name)',
             'Bench (RB/WR/TE)'.
         """
-        participant_teams = pd.read_excel(
-            self.dir_config.draft_sheet_path, sheet_name=None, engine='openpyxl'
-        )
+        participant_teams = read_draft_sheet(self.sheet_path, self.sheet_format)
 
         # Strip all whitespace
         # All columns are string values so can be apply across DataFrame
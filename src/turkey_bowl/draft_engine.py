@@ -0,0 +1,322 @@
+"""
+Live draft engine
+
+The draft used to be run by typing picks into ``{year}_draft_sheet.xlsx``
+and parsing it again with ``Draft.load``. ``DraftEngine`` holds the board
+in memory instead:
+
+* each participant's roster has the slots of ``draft.ROSTER_SLOTS``
+* drafted player ids are kept in a set, so a duplicate pick is refused
+  with a single lookup
+* undrafted players are indexed by position (see ``available``) and
+  ranked for ``recommend`` (see ``recommend.Recommender``)
+
+Every pick (and undo) is appended to a JSON lines log next to the draft
+sheet (``{year}_draft_picks.jsonl``) before it is applied::
+
+    {"draft_order": ["dodd", "logan", "becca"], "snake": true}
+    {"number": 1, "participant": "dodd", "slot": "QB", "player_id": "2558125"}
+    {"undo": 1}
+
+A new engine replays the log, so a crashed draft resumes at the pick it
+stopped on (a partial last line from an interrupted append is dropped).
+``export`` writes the board in the draft sheet format ``Draft.load`` reads.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+import pandas as pd
+
+from turkey_bowl import utils
+from turkey_bowl.draft import ROSTER_SLOTS, write_draft_sheet
+from turkey_bowl.recommend import Recommendation, Recommender, fill_slot
+from turkey_bowl.reconcile import slot_positions
+from turkey_bowl.search import PlayerEntry
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidPickError(ValueError):
+    """A pick breaking the draft rules (it is neither logged nor applied)."""
+
+
+class Pick(NamedTuple):
+    number: int
+    participant: str
+    slot: str
+    player_id: str
+
+
+class DraftEngine:
+    def __init__(
+        self,
+        draft_order: Sequence[str],
+        players: Iterable[PlayerEntry],
+        pick_log_path: Optional[Path] = None,
+        slots: Sequence[str] = ROSTER_SLOTS,
+        snake: bool = True,
+    ) -> None:
+        """
+        ``draft_order`` is the order of the first round; with ``snake``
+        every other round runs in reverse.
+        """
+        self.draft_order = list(draft_order)
+        self.players = {entry.player_id: entry for entry in players}
+        self.slots = list(slots)
+        self.snake = snake
+        self.pick_log_path = None if pick_log_path is None else Path(pick_log_path)
+
+        self.picks: List[Pick] = []
+        self.drafted: Set[str] = set()
+        self.rosters: Dict[str, Dict[str, Optional[str]]] = {
+            participant: dict.fromkeys(self.slots) for participant in self.draft_order
+        }
+        self._available: Dict[Optional[str], Set[str]] = {}
+        for pid, entry in self.players.items():
+            self._available.setdefault(entry.position, set()).add(pid)
+        self.recommender = Recommender(self.players.values())
+
+        if self.pick_log_path is not None:
+            if self.pick_log_path.exists():
+                self._recover()
+            else:
+                self.pick_log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._append(self._header())
+
+    @classmethod
+    def from_dir_config(
+        cls, dir_config: SimpleNamespace, players: Iterable[PlayerEntry], snake: bool = True
+    ) -> 'DraftEngine':
+        """Engine for the draft order written by ``Draft.setup``."""
+        draft_order_dict = utils.load_from_json(dir_config.draft_order_path)
+        draft_order = sorted(draft_order_dict, key=draft_order_dict.get)
+        return cls(draft_order, players, dir_config.draft_picks_path, snake=snake)
+
+    def __repr__(self):
+        return f'DraftEngine({self.draft_order}, pick {self.pick_number} of {self.n_picks})'
+
+    @property
+    def n_picks(self) -> int:
+        return len(self.draft_order) * len(self.slots)
+
+    @property
+    def pick_number(self) -> int:
+        """Number (from 1) of the next pick."""
+        return len(self.picks) + 1
+
+    @property
+    def is_complete(self) -> bool:
+        return len(self.picks) >= self.n_picks
+
+    def participant_for(self, number: int) -> str:
+        """Participant making pick ``number`` (from 1)."""
+        draft_round, i = divmod(number - 1, len(self.draft_order))
+        if self.snake and draft_round % 2:
+            i = len(self.draft_order) - 1 - i
+        return self.draft_order[i]
+
+    @property
+    def on_the_clock(self) -> Optional[str]:
+        """Participant making the next pick (``None`` once the draft is complete)."""
+        return None if self.is_complete else self.participant_for(self.pick_number)
+
+    def open_slots(self, participant: str) -> List[str]:
+        return [slot for slot, pid in self.rosters[participant].items() if pid is None]
+
+    def available(self, position: Optional[str] = None) -> List[PlayerEntry]:
+        """Undrafted players (of ``position``), by projected points."""
+        if position is None:
+            pids: Iterable[str] = (pid for pids in self._available.values() for pid in pids)
+        else:
+            pids = self._available.get(position, ())
+        return sorted(
+            (self.players[pid] for pid in pids), key=lambda entry: (-entry.proj_pts, entry.name)
+        )
+
+    def recommend(self, participant: Optional[str] = None, limit: int = 5) -> List[Recommendation]:
+        """
+        Best available players for the open slots of ``participant`` (the
+        participant on the clock by default).
+        """
+        participant = self.on_the_clock if participant is None else participant
+        if participant is None:
+            return []
+        return self.recommender.recommend(self.open_slots(participant), limit)
+
+    def validate(self, participant: str, player_id: str, slot: Optional[str] = None) -> str:
+        """
+        Check a pick against the draft rules and return the roster slot it
+        fills (the first open slot allowing the player if ``slot`` is not
+        given). Raises ``InvalidPickError`` otherwise.
+        """
+        if self.is_complete:
+            raise InvalidPickError(f'The draft is complete ({self.n_picks} picks).')
+
+        if participant not in self.rosters:
+            raise InvalidPickError(
+                f"Unrecognized participant: '{participant}'. Expected one of {self.draft_order}."
+            )
+
+        if participant != self.on_the_clock:
+            raise InvalidPickError(
+                f'{participant} is not on the clock ({self.on_the_clock} has pick '
+                + f'{self.pick_number}).'
+            )
+
+        entry = self.players.get(player_id)
+        if entry is None:
+            raise InvalidPickError(f"Unrecognized player id: '{player_id}'.")
+
+        if player_id in self.drafted:
+            raise InvalidPickError(f'{entry.name} ({entry.team}) has already been drafted.')
+
+        if slot is None:
+            open_slot = fill_slot(entry, self.open_slots(participant))
+            if open_slot is not None:
+                return open_slot
+            raise InvalidPickError(
+                f'{participant} has no open slot for {entry.name} ({entry.position}).'
+            )
+
+        if slot not in self.rosters[participant]:
+            raise InvalidPickError(f"Unrecognized slot: '{slot}'. Expected one of {self.slots}.")
+
+        if self.rosters[participant][slot] is not None:
+            raise InvalidPickError(f'{participant} has already filled {slot}.')
+
+        positions = slot_positions(slot)
+        if positions is not None and entry.position not in positions:
+            raise InvalidPickError(f'{slot} can not hold {entry.name} ({entry.position}).')
+
+        return slot
+
+    def pick(self, participant: str, player_id: str, slot: Optional[str] = None) -> Pick:
+        """Validate, log and apply a pick."""
+        slot = self.validate(participant, player_id, slot)
+        pick = Pick(self.pick_number, participant, slot, player_id)
+
+        self._append(pick._asdict())
+        self._apply(pick)
+
+        entry = self.players[player_id]
+        logger.debug(
+            f'Pick {pick.number}: {participant} drafts {entry.name} ({entry.team}) at {slot}'
+        )
+        return pick
+
+    def undo(self) -> Pick:
+        """Take back the last pick."""
+        if not self.picks:
+            raise InvalidPickError('There are no picks to undo.')
+
+        pick = self.picks[-1]
+        self._append({'undo': pick.number})
+        self._revert(pick)
+
+        logger.debug(f'Undid pick {pick.number} ({pick.participant})')
+        return pick
+
+    def _apply(self, pick: Pick) -> None:
+        self.picks.append(pick)
+        self.drafted.add(pick.player_id)
+        self.rosters[pick.participant][pick.slot] = pick.player_id
+        self._available[self.players[pick.player_id].position].discard(pick.player_id)
+        self.recommender.remove(pick.player_id)
+
+    def _revert(self, pick: Pick) -> None:
+        self.picks.pop()
+        self.drafted.discard(pick.player_id)
+        self.rosters[pick.participant][pick.slot] = None
+        self._available[self.players[pick.player_id].position].add(pick.player_id)
+        self.recommender.restore(pick.player_id)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self.pick_log_path is None:
+            return
+
+        with open(self.pick_log_path, 'a') as log_file:
+            log_file.write(json.dumps(record) + '\n')
+            # A pick is only made once it is on disk
+            log_file.flush()
+            os.fsync(log_file.fileno())
+
+    def _header(self) -> Dict[str, Any]:
+        return {'draft_order': self.draft_order, 'snake': self.snake}
+
+    def _recover(self) -> None:
+        """Replay the pick log."""
+        with open(self.pick_log_path, 'rb') as log_file:
+            lines = log_file.readlines()
+
+        if lines and not lines[-1].endswith(b'\n'):
+            # Partial record from an interrupted append; drop it
+            logger.info(f'Truncating partial record at end of {self.pick_log_path}')
+            os.truncate(self.pick_log_path, sum(map(len, lines[:-1])))
+            lines = lines[:-1]
+
+        try:
+            header = json.loads(lines[0]) if lines else None
+        except ValueError:
+            header = None
+
+        if header is None and len(lines) <= 1:
+            # Empty or torn header from an interrupted start; nothing was picked yet
+            logger.info(f'Rewriting the header of {self.pick_log_path}')
+            os.truncate(self.pick_log_path, 0)
+            self._append(self._header())
+            return
+
+        header = header or {}
+        if header.get('draft_order') != self.draft_order or header.get('snake') != self.snake:
+            raise ValueError(
+                f'Pick log {self.pick_log_path} is for another draft: '
+                + f"{header.get('draft_order')} (snake={header.get('snake')})."
+            )
+
+        for line in lines[1:]:
+            record = json.loads(line)
+            if 'undo' in record:
+                self._revert(self.picks[-1])
+            else:
+                self._apply(Pick(**record))
+
+        if self.picks:
+            logger.info(f'Resuming draft from {self.pick_log_path} ({len(self.picks)} picks)')
+
+    def to_participant_teams(self) -> Dict[str, pd.DataFrame]:
+        """
+        The board as ``Draft.load`` would return it (empty slots are ''),
+        with the ``Player_ID`` of each pick for ``aggregate.merge_points``.
+        """
+        participant_teams = {}
+        for participant, roster in self.rosters.items():
+            entries = [None if pid is None else self.players[pid] for pid in roster.values()]
+            participant_teams[participant.title()] = pd.DataFrame(
+                {
+                    'Position': list(roster),
+                    'Player': ['' if entry is None else entry.name for entry in entries],
+                    'Team': ['' if entry is None else entry.team for entry in entries],
+                    'Player_ID': pd.array(
+                        [None if pid is None else int(pid) for pid in roster.values()],
+                        dtype='Int64',
+                    ),
+                }
+            )
+        return participant_teams
+
+    def export(self, draft_sheet_path: Path) -> Path:
+        """Write the board to the draft sheet."""
+        participant_teams = {
+            # Intentional space so strip works in load (see ``Draft.setup``)
+            participant: participant_team.drop(columns='Player_ID').replace('', ' ')
+            for participant, participant_team in self.to_participant_teams().items()
+        }
+        with utils.atomic_path(draft_sheet_path) as tmp_path:
+            write_draft_sheet(participant_teams, tmp_path)
+        logger.info(f'Saved draft board to {draft_sheet_path}')
+        return Path(draft_sheet_path)
@@ -3,18 +3,38 @@ Leader board methods
 """
 
 import logging
+from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
 
+from turkey_bowl import lineup, writers
+
 logger = logging.getLogger(__name__)
 
 
 class LeaderBoard:
-    def __init__(self, year: int, participant_teams: Dict[str, pd.DataFrame]) -> None:
+    def __init__(
+        self,
+        year: int,
+        participant_teams: Dict[str, pd.DataFrame],
+        stale: bool = False,
+        as_of: Optional[datetime] = None,
+        best_ball: bool = False,
+    ) -> None:
+        """
+        ``stale`` marks a board built from the last good snapshot of
+        ACTUAL points (pulled ``as_of``) because the API is failing.
+
+        ``best_ball`` scores each team's optimal lineup rather than the
+        drafted one (see ``lineup.best_ball``).
+        """
         self.year = year
         self.participant_teams = participant_teams
+        self.stale = stale
+        self.as_of = as_of
+        self.best_ball = best_ball
         self.filter_cols = ['Position', 'Player', 'Team', 'ACTUAL_pts', 'PROJ_pts']
 
     def __repr__(self):
@@ -25,16 +45,13 @@ class LeaderBoard:
 
     @property
     def data(self) -> pd.DataFrame:
-        leader_board_data = {}
-
-        for participant, participant_team in self.participant_teams.items():
-            # Assumes Bench player is last row (displayed but not included in sum)
-            team_pts = participant_team[:-1]['ACTUAL_pts'].sum().round(3)
-            # team_pts = participant_team[:-1]["PROJ_pts"].sum().round(3)
-            leader_board_data[participant] = team_pts
+        # Bench players are displayed but not included in the sum
+        if self.best_ball:
+            team_pts = lineup.best_ball(self.participant_teams, 'ACTUAL_pts')
+        else:
+            team_pts = lineup.score(self.participant_teams, 'ACTUAL_pts')
 
-        # Create a DataFrame from point_totals
-        leader_board_df = pd.DataFrame.from_dict(leader_board_data, orient='index', columns=['PTS'])
+        leader_board_df = team_pts.to_frame('PTS')
 
         # Sort the leader board on highest pts to lowest pts
         leader_board_df = leader_board_df.sort_values('PTS', ascending=False)
@@ -57,43 +74,32 @@ class LeaderBoard:
             f'{self.data.index[0]} winning with {round(self.data.iloc[0, 0], 2)} pts\n{self.data}\n'
         )
 
-    def save(self, savepath: Path) -> None:
+        if self.stale:
+            logger.info(f'WARNING: STALE leader board (points as of {self.stale_as_of})')
+
+    @property
+    def stale_as_of(self) -> Optional[str]:
+        """When the points of a stale board were pulled ('never' if unknown)."""
+        if not self.stale:
+            return None
+        return 'never' if self.as_of is None else self.as_of.isoformat()
+
+    def save(self, savepath: Path, output_format: str = 'xlsx') -> Path:
+        """
+        Save the leader board and each participant's stats.
+
+        ``output_format`` selects the writer (see ``writers.WRITERS``); the
+        suffix of ``savepath`` is swapped to match. A stale board gets a
+        ``stale_as_of`` column. Returns the path written.
+        """
+        writer = writers.get_writer(output_format)
+        savepath = writer.path_for(savepath)
         logger.info(f'Saving LeaderBoard to {savepath}...')
 
-        with pd.ExcelWriter(savepath) as writer:
-            # Center columns
-            workbook = writer.book
-            center = workbook.add_format()
-            center.set_align('center')
-            center.set_align('vcenter')
-
-            # Leader board sheet
-            self.data.to_excel(writer, sheet_name='Leader Board')
-            worksheet = writer.sheets['Leader Board']
-
-            # Start enumerate at 1 since index written
-            for i, col in enumerate(self.data, 1):
-                series = self.data[col]
-                max_len = max(series.astype(str).map(len).max(), len(str(series.name)))
-
-                # Add a little extra spacing
-                worksheet.set_column(i, i, max_len + 1, center)
-
-            # Individual Players
-            for participant, participant_team in self.participant_teams.items():
-                participant_team[self.filter_cols].to_excel(
-                    writer, sheet_name=participant, index=False
-                )
-
-                # Auto-format column lengths and center columns
-                worksheet = writer.sheets[participant]
-
-                for i, col in enumerate(participant_team):
-                    series = participant_team[col]
-                    max_len = max(series.astype(str).map(len).max(), len(str(series.name)))
-
-                    # Add a little extra spacing
-                    if col in ('Position', 'Player', 'Team'):
-                        worksheet.set_column(i, i, max_len + 2)
-                    else:
-                        worksheet.set_column(i, i, max_len + 2, center)
+        sheets = {'Leader Board': self.data}
+        if self.stale:
+            sheets['Leader Board'] = self.data.assign(stale_as_of=self.stale_as_of)
+        for participant, participant_team in self.participant_teams.items():
+            sheets[participant] = participant_team[self.filter_cols]
+
+        return writer.write(sheets, savepath, index_sheets=['Leader Board'])
@@ -0,0 +1,209 @@
+"""
+Multi-league scoring
+
+Several leagues (family, office, ...) can share one checkout. Each
+league keeps its draft and outputs in its own directory::
+
+    archive/<year>/leagues/<league>/
+
+while the scraped points (kept in ``archive/<year>``), player ids,
+warehouse, snapshots and breakers are shared (see
+``utils.load_dir_config``).
+
+``score_leagues`` scores every league from one scrape of PROJECTED and
+ACTUAL points. Leagues are spread over a process pool; the points frames
+are published once to shared memory (see ``shared_points``) and each
+worker attaches to them, by its initializer, rather than unpickling a
+copy. A league only gathers the rows of the players it drafted.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from turkey_bowl import aggregate, reconcile, shared_points
+from turkey_bowl.draft import Draft
+from turkey_bowl.leader_board import LeaderBoard
+from turkey_bowl.player_store import PlayerStore
+from turkey_bowl.search import PlayerIndex
+
+logger = logging.getLogger(__name__)
+
+# Points shared by the leagues scored in this process (see ``_init_worker``)
+_shared: Dict[str, Any] = {}
+
+
+def score_draft(
+    draft: Draft,
+    participant_teams: Dict[str, pd.DataFrame],
+    week: int,
+    projected_player_pts_df: pd.DataFrame,
+    actual_player_pts_df: pd.DataFrame,
+    output_format: str = 'xlsx',
+    stale: bool = False,
+    as_of: Optional[datetime] = None,
+) -> LeaderBoard:
+    """
+    Merge PROJECTED and ACTUAL points with the drafted teams, write the
+    robust scores and save the leader board of ``draft``.
+
+    ``participant_teams`` is left as drafted so this can be called per pull.
+    """
+    participant_teams = dict(participant_teams)
+    output_dir = draft.dir_config.output_dir
+
+    # Merge points to teams
+    participant_teams = aggregate.merge_points(
+        participant_teams, projected_player_pts_df, verbose=False
+    )
+
+    participant_teams = aggregate.merge_points(
+        participant_teams, actual_player_pts_df, verbose=True
+    )
+
+    # Sort robust columns so actual is next to projected
+    participant_teams = aggregate.sort_robust_cols(participant_teams)
+
+    # Write robust scores for reviewing if desired
+    aggregate.write_robust_participant_team_scores(
+        participant_teams=participant_teams,
+        savepath=Path(f'{output_dir}/{draft.year}_{week}_robust_participant_player_pts.xlsx'),
+        output_format=output_format,
+    )
+
+    board = LeaderBoard(draft.year, participant_teams, stale=stale, as_of=as_of)
+    board.save(Path(f'{output_dir}/{draft.year}_leader_board.xlsx'), output_format=output_format)
+    return board
+
+
+def reconcile_league(
+    draft: Draft,
+    participant_teams: Dict[str, pd.DataFrame],
+    projected_player_pts_df: pd.DataFrame,
+) -> Dict[str, pd.DataFrame]:
+    """Match drafted rows to players (once per version of the draft sheet)."""
+    return reconcile.reconcile_draft(
+        participant_teams,
+        draft.sheet_path,
+        draft.dir_config.draft_reconciled_path,
+        lambda: PlayerIndex.from_player_ids(
+            PlayerStore.from_dir_config(draft.dir_config).to_dict(), projected_player_pts_df
+        ),
+    )
+
+
+def _init_worker(
+    year: int,
+    week: int,
+    projected: shared_points.PointsTableHandle,
+    actual: shared_points.PointsTableHandle,
+    root: Optional[str],
+) -> None:
+    _shared.update(
+        year=year,
+        week=week,
+        projected=shared_points.attach(projected),
+        actual=shared_points.attach(actual),
+        root=root,
+    )
+
+
+def _close_worker() -> None:
+    for key in ('projected', 'actual'):
+        _shared[key].close()
+    _shared.clear()
+
+
+def _drafted_ids(participant_teams: Dict[str, pd.DataFrame]) -> Set[int]:
+    return {
+        int(pid)
+        for participant_team in participant_teams.values()
+        for pid in participant_team['Player_ID'].dropna()
+    }
+
+
+def score_league(
+    league: str,
+    output_format: str = 'xlsx',
+    stale: bool = False,
+    as_of: Optional[datetime] = None,
+) -> Optional[LeaderBoard]:
+    """
+    Worker: score one league from the shared points (``None`` if its
+    draft isn't complete).
+    """
+    draft = Draft(_shared['year'], root=_shared['root'], league=league)
+    participant_teams = draft.load()
+
+    if not draft.check_players_have_been_drafted(participant_teams):
+        logger.info(f'Not all players have been drafted yet in league {league}!')
+        return None
+
+    # Copies, so no view of the shared block outlives the league
+    participant_teams = reconcile_league(
+        draft, participant_teams, _shared['projected'].index_with(['PROJ_pts'])
+    )
+    drafted_ids = _drafted_ids(participant_teams)
+    return score_draft(
+        draft,
+        participant_teams,
+        _shared['week'],
+        _shared['projected'].rows(drafted_ids),
+        _shared['actual'].rows(drafted_ids),
+        output_format=output_format,
+        stale=stale,
+        as_of=as_of,
+    )
+
+
+def score_leagues(
+    year: int,
+    week: int,
+    leagues: Sequence[str],
+    projected_player_pts_df: pd.DataFrame,
+    actual_player_pts_df: pd.DataFrame,
+    root: Optional[str] = None,
+    output_format: str = 'xlsx',
+    stale: bool = False,
+    as_of: Optional[datetime] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Optional[LeaderBoard]]:
+    """
+    Score every league in ``leagues`` from the same points and return
+    their leader boards by league (``None`` for an incomplete draft).
+
+    ``max_workers=1`` scores the leagues in this process.
+    """
+    kwargs = dict(output_format=output_format, stale=stale, as_of=as_of)
+
+    logger.info(f'Scoring {len(leagues)} leagues...')
+    with shared_points.publish(projected_player_pts_df) as projected:
+        with shared_points.publish(actual_player_pts_df) as actual:
+            initargs = (year, week, projected, actual, root)
+            boards = _run(leagues, initargs, kwargs, max_workers)
+
+    return dict(zip(leagues, boards))
+
+
+def _run(
+    leagues: Sequence[str],
+    initargs: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    max_workers: Optional[int],
+) -> List[Optional[LeaderBoard]]:
+    if max_workers == 1 or len(leagues) <= 1:
+        _init_worker(*initargs)
+        try:
+            return [score_league(league, **kwargs) for league in leagues]
+        finally:
+            _close_worker()
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(leagues))
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=initargs) as executor:
+        futures = [executor.submit(score_league, league, **kwargs) for league in leagues]
+        return [future.result() for future in futures]
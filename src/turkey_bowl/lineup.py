@@ -0,0 +1,94 @@
+"""
+Lineup scoring
+
+Teams are scored from their roster slots (``draft.ROSTER_SLOTS``) rather
+than their row order: every starting slot counts and the Bench slot
+doesn't. All participant teams are stacked into one long roster table
+(``roster_table``) and scored with a single grouped sum.
+
+``best_ball`` scores each team's optimal lineup instead: drafted players
+are re-slotted by their ``PROJ_Position`` so the best players of each
+position start, then the best remaining RB/WR/TE take the Flex slot.
+Filling single-position slots before flex slots is optimal as a flex
+slot accepts any player of its positions.
+"""
+
+from collections import Counter
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+import pandas as pd
+
+from turkey_bowl.draft import ROSTER_SLOTS
+from turkey_bowl.reconcile import slot_positions, slot_type
+
+# Slots that are displayed but not scored
+BENCH_SLOTS = {'Bench (RB/WR/TE)'}
+
+# Columns of a roster table (besides the points columns of the teams)
+ROSTER_COLS = ['Participant', 'Position', 'Player', 'Team', 'Slot_Type', 'Starter']
+
+
+def roster_table(participant_teams: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    All participant teams stacked into one table with ``Participant``,
+    ``Slot_Type`` and ``Starter`` columns (empty if there are no teams).
+    """
+    if not participant_teams:
+        return pd.DataFrame(columns=ROSTER_COLS)
+
+    roster = pd.concat(participant_teams, names=['Participant', None])
+    roster = roster.reset_index(level='Participant').reset_index(drop=True)
+    roster['Slot_Type'] = roster['Position'].map(slot_type)
+    roster['Starter'] = ~roster['Slot_Type'].isin(BENCH_SLOTS)
+    return roster
+
+
+def _total(roster: pd.DataFrame, pts: pd.Series, participants: Sequence[str]) -> pd.Series:
+    totals = pts.fillna(0.0).groupby(roster['Participant']).sum()
+    return totals.reindex(participants, fill_value=0.0).rename_axis(None).round(3)
+
+
+def score(participant_teams: Dict[str, pd.DataFrame], pts_col: str = 'ACTUAL_pts') -> pd.Series:
+    """Points of the starting slots of each team (by participant)."""
+    if not participant_teams:
+        return pd.Series(dtype='float64')
+
+    roster = roster_table(participant_teams)
+    return _total(roster, roster[pts_col].where(roster['Starter'], 0.0), list(participant_teams))
+
+
+def lineup_requirements(slots: Sequence[str] = ROSTER_SLOTS) -> List[Tuple[FrozenSet[str], int]]:
+    """
+    Number of starting slots per set of allowed positions, single-position
+    slots first (e.g. ``(frozenset({'RB'}), 2)``).
+    """
+    counts = Counter(
+        frozenset(slot_positions(slot))
+        for slot in slots
+        if slot_type(slot) not in BENCH_SLOTS and slot_positions(slot) is not None
+    )
+    return sorted(counts.items(), key=lambda item: (len(item[0]), sorted(item[0])))
+
+
+def best_ball(
+    participant_teams: Dict[str, pd.DataFrame],
+    pts_col: str = 'ACTUAL_pts',
+    position_col: str = 'PROJ_Position',
+    slots: Sequence[str] = ROSTER_SLOTS,
+) -> pd.Series:
+    """Points of the optimal lineup of each team (by participant)."""
+    if not participant_teams:
+        return pd.Series(dtype='float64')
+
+    roster = roster_table(participant_teams)
+    roster['pts'] = roster[pts_col].fillna(0.0)
+    roster = roster.sort_values('pts', ascending=False, kind='stable')
+
+    starter = pd.Series(False, index=roster.index)
+    for positions, count in lineup_requirements(slots):
+        eligible = roster[~starter & roster[position_col].isin(positions)]
+        # Players are sorted by points, so the first ``count`` of each team start
+        rank = eligible.groupby('Participant').cumcount()
+        starter[rank.index[rank < count]] = True
+
+    return _total(roster, roster['pts'].where(starter, 0.0), list(participant_teams))
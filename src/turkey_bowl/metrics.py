@@ -0,0 +1,234 @@
+"""
+Scrape metrics
+
+Counters and latency histograms for the scraping layer, per endpoint
+(e.g. ``players/weekstats``):
+
+- requests, by status code (so 4xx and 5xx responses can be told apart)
+- latency (request sent to body read), with p50/p95/p99 of the most
+  recent ``LATENCY_RESERVOIR_SIZE`` requests
+- bytes transferred
+- retries (player ids re-attempted after a failed refresh)
+- cache hits and misses (``resolve.PlayerResolver``)
+
+Everything is recorded in the process wide ``METRICS`` and can be
+exported as JSON or in the Prometheus text format (``write``), e.g. with
+``turkey-bowl --metrics-path metrics.prom scrape-actual``.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Prometheus style (cumulative, upper bound) latency buckets in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PERCENTILES = (50, 95, 99)
+# Latencies kept per endpoint for the percentiles (the buckets count all of them)
+LATENCY_RESERVOIR_SIZE = 10_000
+
+METRICS_FORMATS = {'.json': 'json', '.prom': 'prometheus', '.txt': 'prometheus'}
+
+
+def endpoint_for(url: str) -> str:
+    """Metric label for a url: its path below the API version (e.g. ``game/stats``)."""
+    path = urlparse(url).path.strip('/')
+    head, _, tail = path.partition('/')
+    return tail if head.startswith('v') and head[1:].isdigit() and tail else path or url
+
+
+class _Endpoint:
+    def __init__(self, buckets: Sequence[float], reservoir_size: int) -> None:
+        self.statuses: Dict[int, int] = {}
+        self.buckets = buckets
+        self.bucket_counts: List[int] = [0] * len(buckets)
+        self.latency_count = 0
+        self.latency_sum = 0.0
+        self.latencies: Deque[float] = deque(maxlen=reservoir_size)
+        self.bytes = 0
+        self.retries = 0
+
+    def observe_latency(self, seconds: float) -> None:
+        self.latency_count += 1
+        self.latency_sum += seconds
+        self.latencies.append(seconds)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    def count_status(self, status_class: int) -> int:
+        return sum(n for status, n in self.statuses.items() if status // 100 == status_class)
+
+    def to_dict(self) -> Dict[str, Any]:
+        percentiles = (
+            np.percentile(np.asarray(self.latencies, dtype=float), PERCENTILES).tolist()
+            if self.latencies
+            else [None] * len(PERCENTILES)
+        )
+        return {
+            'requests': self.requests,
+            'statuses': {str(status): n for status, n in sorted(self.statuses.items())},
+            'errors_4xx': self.count_status(4),
+            'errors_5xx': self.count_status(5),
+            'bytes': self.bytes,
+            'retries': self.retries,
+            'latency_seconds': {
+                'count': self.latency_count,
+                'sum': self.latency_sum,
+                **{f'p{p}': value for p, value in zip(PERCENTILES, percentiles)},
+                'buckets': {str(bound): n for bound, n in zip(self.buckets, self.bucket_counts)},
+            },
+        }
+
+
+class ScrapeMetrics:
+    """Thread-safe scrape metrics (see the module docstring)."""
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        reservoir_size: int = LATENCY_RESERVOIR_SIZE,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.reservoir_size = reservoir_size
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._cache: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'ScrapeMetrics(endpoints={sorted(self._endpoints)})'
+
+    def _endpoint(self, endpoint: str) -> _Endpoint:
+        if endpoint not in self._endpoints:
+            self._endpoints[endpoint] = _Endpoint(self.buckets, self.reservoir_size)
+        return self._endpoints[endpoint]
+
+    def observe(self, endpoint: str, status: int, seconds: float, nbytes: int = 0) -> None:
+        """Record one request to ``endpoint``."""
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.observe_latency(seconds)
+            stats.bytes += nbytes
+
+    def record_retry(self, endpoint: str, n: int = 1) -> None:
+        with self._lock:
+            self._endpoint(endpoint).retries += n
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._cache.setdefault(cache, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._cache.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'endpoints': {
+                    endpoint: stats.to_dict() for endpoint, stats in sorted(self._endpoints.items())
+                },
+                'cache': {cache: dict(counts) for cache, counts in sorted(self._cache.items())},
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=4)
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        metrics = self.to_dict()
+        lines = []
+
+        def family(name: str, metric_type: str, help_text: str) -> None:
+            lines.append(f'# HELP turkey_bowl_{name} {help_text}')
+            lines.append(f'# TYPE turkey_bowl_{name} {metric_type}')
+
+        endpoints = metrics['endpoints']
+
+        family('scrape_requests_total', 'counter', 'Scrape requests by endpoint and status.')
+        for endpoint, stats in endpoints.items():
+            for status, n in stats['statuses'].items():
+                lines.append(
+                    f'turkey_bowl_scrape_requests_total{{endpoint="{endpoint}",status="{status}"}} '
+                    + f'{n}'
+                )
+
+        for name, key, help_text in (
+            ('scrape_bytes_total', 'bytes', 'Bytes transferred by endpoint.'),
+            ('scrape_retries_total', 'retries', 'Retried requests by endpoint.'),
+            ('scrape_errors_4xx_total', 'errors_4xx', 'Client error responses by endpoint.'),
+            ('scrape_errors_5xx_total', 'errors_5xx', 'Server error responses by endpoint.'),
+        ):
+            family(name, 'counter', help_text)
+            for endpoint, stats in endpoints.items():
+                lines.append(f'turkey_bowl_{name}{{endpoint="{endpoint}"}} {stats[key]}')
+
+        family('scrape_latency_seconds', 'histogram', 'Scrape request latency by endpoint.')
+        for endpoint, stats in endpoints.items():
+            latency = stats['latency_seconds']
+            label = f'endpoint="{endpoint}"'
+            for bound, n in latency['buckets'].items():
+                lines.append(
+                    f'turkey_bowl_scrape_latency_seconds_bucket{{{label},le="{bound}"}} {n}'
+                )
+            lines.append(
+                f'turkey_bowl_scrape_latency_seconds_bucket{{{label},le="+Inf"}} {latency["count"]}'
+            )
+            lines.append(f'turkey_bowl_scrape_latency_seconds_sum{{{label}}} {latency["sum"]}')
+            lines.append(f'turkey_bowl_scrape_latency_seconds_count{{{label}}} {latency["count"]}')
+
+        family('cache_requests_total', 'counter', 'Cache lookups by cache and result.')
+        for cache, counts in metrics['cache'].items():
+            for result, key in (('hit', 'hits'), ('miss', 'misses')):
+                lines.append(
+                    f'turkey_bowl_cache_requests_total{{cache="{cache}",result="{result}"}} '
+                    + f'{counts[key]}'
+                )
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: Path, metrics_format: Optional[str] = None) -> None:
+        """
+        Write the metrics to ``path`` as JSON or Prometheus text, by
+        default chosen by the file suffix (see ``METRICS_FORMATS``).
+        """
+        path = Path(path)
+        if metrics_format is None:
+            if path.suffix not in METRICS_FORMATS:
+                raise ValueError(
+                    f"Unrecognized metrics file suffix: '{path.suffix}'. "
+                    + f'Expected one of {list(METRICS_FORMATS)}.'
+                )
+            metrics_format = METRICS_FORMATS[path.suffix]
+
+        if metrics_format == 'json':
+            text = self.to_json()
+        elif metrics_format == 'prometheus':
+            text = self.to_prometheus()
+        else:
+            raise ValueError(
+                f"Unrecognized metrics format: '{metrics_format}'. "
+                + "Expected one of ['json', 'prometheus']."
+            )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        logger.info(f'Scrape metrics written to {path}')
+
+
+# Process wide metrics recorded by ``sources`` and ``resolve``
+METRICS = ScrapeMetrics()
@@ -0,0 +1,306 @@
+"""
+Player metadata store
+
+Player metadata (name, position, team, injury) used to live only in
+``assets/player_ids.json`` which had to be rewritten in full for every
+change. The store keeps an append-only JSON lines log next to it
+(``assets/player_ids.jsonl``) with one record per line::
+
+    {"pid": "310", "data": {"name": "Matt Ryan", "position": "QB", ...}}
+    {"pid": "310", "deleted": true}
+
+An in-memory index maps each player id to the byte offset of its latest
+record, so upserts are a single append and lookups a single seek. Dead
+records are dropped by ``compact``. ``player_ids.json`` is kept as an
+export for compatibility; when it is newer than the log (e.g. after a
+``git pull``) the log is rebuilt from it.
+
+A full refresh of the player ids is journaled (``RefreshJournal``) so an
+interrupted refresh resumes where it stopped.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from turkey_bowl import utils
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerStore:
+    def __init__(
+        self,
+        log_path: Path,
+        json_path: Optional[Path] = None,
+        compact_ratio: float = 2.0,
+    ) -> None:
+        self.log_path = Path(log_path)
+        self.json_path = None if json_path is None else Path(json_path)
+        self.compact_ratio = compact_ratio
+        self._offsets: Dict[str, int] = {}
+        self._n_records = 0
+
+        if self._json_is_newer():
+            self._seed_from_json()
+        else:
+            self._load_index()
+
+    @classmethod
+    def from_dir_config(cls, dir_config: SimpleNamespace) -> 'PlayerStore':
+        return cls(dir_config.player_ids_log_path, dir_config.player_ids_json_path)
+
+    def __repr__(self):
+        return f"PlayerStore('{self.log_path}')"
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._offsets))
+
+    @property
+    def year(self) -> Optional[int]:
+        """Season the stored player ids were last fully refreshed for."""
+        return self.get('year')
+
+    @property
+    def dead_records(self) -> int:
+        """Number of superseded or deleted records still in the log."""
+        return self._n_records - len(self._offsets)
+
+    def _json_is_newer(self) -> bool:
+        if self.json_path is None or not self.json_path.exists():
+            return False
+        if not self.log_path.exists():
+            return True
+        return self.json_path.stat().st_mtime_ns > self.log_path.stat().st_mtime_ns
+
+    def _seed_from_json(self) -> None:
+        logger.info(f'Building player store {self.log_path} from {self.json_path}')
+        self._rewrite(utils.load_from_json(self.json_path).items())
+
+    def _load_index(self) -> None:
+        """Scan the log once, recording the offset of each id's latest record."""
+        self._offsets = {}
+        self._n_records = 0
+
+        if not self.log_path.exists():
+            return
+
+        offset = 0
+        with open(self.log_path, 'rb') as log_file:
+            for line in log_file:
+                if not line.endswith(b'\n'):
+                    # Partial record from an interrupted append; drop it
+                    logger.info(f'Truncating partial record at end of {self.log_path}')
+                    log_file.close()
+                    os.truncate(self.log_path, offset)
+                    break
+
+                record = json.loads(line)
+                self._n_records += 1
+                if record.get('deleted'):
+                    self._offsets.pop(record['pid'], None)
+                else:
+                    self._offsets[record['pid']] = offset
+                offset += len(line)
+
+    def _append(self, record: Dict[str, Any]) -> int:
+        line = json.dumps(record).encode() + b'\n'
+        with open(self.log_path, 'ab') as log_file:
+            offset = log_file.tell()
+            log_file.write(line)
+        self._n_records += 1
+        return offset
+
+    def _rewrite(self, items: Iterable) -> None:
+        """Replace the log with one live record per (pid, data) in ``items``."""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        offsets = {}
+        offset = 0
+
+        with utils.atomic_path(self.log_path) as tmp_path:
+            with open(tmp_path, 'wb') as log_file:
+                for pid, data in items:
+                    line = json.dumps({'pid': pid, 'data': data}).encode() + b'\n'
+                    log_file.write(line)
+                    offsets[pid] = offset
+                    offset += len(line)
+
+        self._offsets = offsets
+        self._n_records = len(offsets)
+
+    def get(self, pid: str, default: Any = None) -> Any:
+        offset = self._offsets.get(pid)
+        if offset is None:
+            return default
+
+        with open(self.log_path, 'rb') as log_file:
+            log_file.seek(offset)
+            return json.loads(log_file.readline())['data']
+
+    def upsert(self, pid: str, data: Any) -> None:
+        """Insert or replace ``pid``; a single append to the log."""
+        self._offsets[pid] = self._append({'pid': pid, 'data': data})
+
+    def delete(self, pid: str) -> None:
+        if pid in self._offsets:
+            self._append({'pid': pid, 'deleted': True})
+            del self._offsets[pid]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        All live records in the ``player_ids.json`` layout.
+
+        Reads the log sequentially rather than seeking per id.
+        """
+        live: Dict[str, Any] = {}
+        latest = {offset: pid for pid, offset in self._offsets.items()}
+
+        if not latest:
+            return live
+
+        with open(self.log_path, 'rb') as log_file:
+            offset = 0
+            for line in log_file:
+                if offset in latest:
+                    live[latest[offset]] = json.loads(line)['data']
+                offset += len(line)
+
+        return {pid: live[pid] for pid in self._offsets}
+
+    def compact(self, order: Optional[Iterable[str]] = None) -> None:
+        """
+        Rewrite the log keeping only live records.
+
+        ``order`` optionally gives the order ids are written in (ids not
+        listed follow in their current order).
+        """
+        records = self.to_dict()
+        ordered = [pid for pid in (order or []) if pid in records]
+        listed = set(ordered)
+        ordered += [pid for pid in records if pid not in listed]
+
+        logger.info(f'Compacting {self.log_path} ({self.dead_records} dead records)')
+        self._rewrite((pid, records[pid]) for pid in ordered)
+
+    def maybe_compact(self) -> bool:
+        """Compact once dead records outnumber live ones by ``compact_ratio``."""
+        if self.dead_records > max(len(self), 1) * self.compact_ratio:
+            self.compact()
+            return True
+        return False
+
+    def export_json(self, json_path: Optional[Path] = None) -> None:
+        """Write all live records to ``player_ids.json`` (or ``json_path``)."""
+        json_path = self.json_path if json_path is None else Path(json_path)
+
+        with utils.atomic_path(json_path) as tmp_path:
+            utils.write_to_json(json_dict=self.to_dict(), filename=tmp_path)
+
+        # Keep the log authoritative (see ``_json_is_newer``)
+        if self.log_path.exists():
+            os.utime(self.log_path)
+
+
+class RefreshJournal:
+    """
+    Journal of player ids completed (or failed) during a player id refresh.
+
+    The first line records the season being refreshed; each following line
+    records one attempt::
+
+        {"year": 2024}
+        {"pid": "310", "ok": true}
+        {"pid": "382", "ok": false, "error": "..."}
+        {"pid": "415", "ok": false, "error": "...", "failed": true}
+
+    A journal for a different season is discarded. The latest attempt per
+    id wins, so a failed id that later succeeds counts as completed.
+
+    An id that fails permanently (e.g. the API has no metadata for it), or
+    fails ``max_attempts`` times, is marked ``failed`` and given up on so
+    the refresh can complete without it.
+    """
+
+    def __init__(self, journal_path: Path, year: int, max_attempts: int = 3) -> None:
+        self.journal_path = Path(journal_path)
+        self.year = year
+        self.max_attempts = max_attempts
+        self.completed: Set[str] = set()
+        self.failed: Dict[str, str] = {}
+        self.given_up: Dict[str, str] = {}
+        self._attempts: Dict[str, int] = {}
+
+        if self.journal_path.exists():
+            self._load()
+
+        if not self.journal_path.exists():
+            self._append({'year': self.year})
+
+    def __repr__(self):
+        return f"RefreshJournal('{self.journal_path}', {self.year})"
+
+    def _load(self) -> None:
+        with open(self.journal_path, 'r') as journal_file:
+            lines = [line for line in journal_file if line.endswith('\n')]
+
+        if not lines or json.loads(lines[0]).get('year') != self.year:
+            logger.info(f'Discarding player id refresh journal {self.journal_path}')
+            self.journal_path.unlink()
+            return
+
+        for line in lines[1:]:
+            entry = json.loads(line)
+            self._apply(entry['pid'], entry.get('error'), entry.get('failed', False))
+
+        logger.info(
+            f'Resuming player id refresh from {self.journal_path} '
+            + f'({len(self.completed)} completed, {len(self.failed)} failed, '
+            + f'{len(self.given_up)} given up)'
+        )
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with open(self.journal_path, 'a') as journal_file:
+            journal_file.write(json.dumps(entry) + '\n')
+
+    def _apply(self, pid: str, error: Optional[str], permanent: bool) -> None:
+        self.completed.discard(pid)
+        self.failed.pop(pid, None)
+        self.given_up.pop(pid, None)
+
+        if error is None:
+            self.completed.add(pid)
+        elif permanent:
+            self.given_up[pid] = error
+        else:
+            self._attempts[pid] = self._attempts.get(pid, 0) + 1
+            self.failed[pid] = error
+
+    def record(self, pid: str, error: Optional[str] = None, permanent: bool = False) -> None:
+        """
+        Record an attempt for ``pid``; ``error`` is given if it failed and
+        ``permanent`` if retrying is pointless.
+        """
+        if error is None:
+            self._append({'pid': pid, 'ok': True})
+        else:
+            permanent = permanent or self._attempts.get(pid, 0) + 1 >= self.max_attempts
+            entry = {'pid': pid, 'ok': False, 'error': error}
+            if permanent:
+                entry['failed'] = True
+            self._append(entry)
+
+        self._apply(pid, error, permanent)
+
+    def clear(self) -> None:
+        """Remove the journal once the refresh is complete."""
+        if self.journal_path.exists():
+            self.journal_path.unlink()
@@ -0,0 +1,209 @@
+"""
+Game status aware polling
+
+Rather than polling player stats blindly all day, the ``gameStats``
+service is checked for the status of the Thanksgiving games and player
+stats are only pulled while a relevant game is live (or has just changed
+status, e.g. gone final). Polling backs off during halftime and between
+games, sleeping until the next kickoff, and stops once every game is
+final, after one last full refresh.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SCHEDULED = 'scheduled'
+LIVE = 'live'
+HALFTIME = 'halftime'
+FINAL = 'final'
+
+# gameStats statuses; anything unrecognized is treated as live so it is
+# polled (the behaviour before game statuses were checked)
+GAME_STATUSES = {
+    'PREGAME': SCHEDULED,
+    'SCHEDULED': SCHEDULED,
+    'INPROGRESS': LIVE,
+    'IN_PROGRESS': LIVE,
+    'HALFTIME': HALFTIME,
+    'HALF': HALFTIME,
+    'FINAL': FINAL,
+    'FINAL_OVERTIME': FINAL,
+    'POSTGAME': FINAL,
+}
+
+# Thanksgiving is always after daylight saving time ends
+EASTERN = timezone(timedelta(hours=-5), 'EST')
+
+
+class GameStatus(NamedTuple):
+    game_id: str
+    status: str
+    home_team: Optional[str] = None
+    away_team: Optional[str] = None
+    kickoff: Optional[datetime] = None
+
+    @property
+    def teams(self) -> Set[str]:
+        return {team for team in (self.home_team, self.away_team) if team}
+
+
+def _team_abbr(team: Any) -> Optional[str]:
+    if isinstance(team, dict):
+        return team.get('abbr') or team.get('abbreviation')
+    return team
+
+
+def _parse_kickoff(game_time: Optional[str]) -> Optional[datetime]:
+    if not game_time:
+        return None
+    kickoff = datetime.fromisoformat(game_time.replace('Z', '+00:00'))
+    return kickoff if kickoff.tzinfo else kickoff.replace(tzinfo=timezone.utc)
+
+
+def parse_game_stats(game_stats: Dict[str, Any]) -> List[GameStatus]:
+    """
+    Parse a ``gameStats`` payload::
+
+        {"games": {"<gameId>": {"gameStatus": "INPROGRESS",
+                                "homeTeam": {"abbr": "DET"}, "awayTeam": "GB",
+                                "gameTime": "2023-11-23T17:30:00Z", ...}}}
+    """
+    games = []
+
+    for game_id, game in game_stats.get('games', {}).items():
+        raw_status = str(game.get('gameStatus') or game.get('status') or '').upper()
+        games.append(
+            GameStatus(
+                game_id=str(game_id),
+                status=GAME_STATUSES.get(raw_status, LIVE),
+                home_team=_team_abbr(game.get('homeTeam') or game.get('homeTeamAbbr')),
+                away_team=_team_abbr(game.get('awayTeam') or game.get('awayTeamAbbr')),
+                kickoff=_parse_kickoff(game.get('gameTime') or game.get('startTime')),
+            )
+        )
+
+    return games
+
+
+def on_day(games: Iterable[GameStatus], day) -> List[GameStatus]:
+    """Games kicking off on ``day`` (US Eastern); games without a kickoff are kept."""
+    return [
+        game
+        for game in games
+        if game.kickoff is None or game.kickoff.astimezone(EASTERN).date() == day
+    ]
+
+
+class PollPolicy:
+    def __init__(
+        self,
+        live_interval: float = 60.0,
+        halftime_interval: float = 300.0,
+        idle_interval: float = 900.0,
+    ) -> None:
+        self.live_interval = live_interval
+        self.halftime_interval = halftime_interval
+        self.idle_interval = idle_interval
+
+    def __repr__(self):
+        return (
+            f'PollPolicy(live_interval={self.live_interval}, '
+            + f'halftime_interval={self.halftime_interval}, idle_interval={self.idle_interval})'
+        )
+
+    def next_interval(self, games: List[GameStatus], now: datetime) -> Optional[float]:
+        """
+        Seconds until the next poll, or ``None`` once every game is final.
+
+        With no games (their statuses are unknown) and while a game is
+        live, polls are every ``live_interval``. Otherwise polling
+        backs off to ``halftime_interval`` (a game at halftime) or
+        ``idle_interval`` (between games), but never sleeps through the
+        next kickoff.
+        """
+        statuses = {game.status for game in games}
+
+        if statuses == {FINAL}:
+            return None
+
+        if not games or LIVE in statuses:
+            return self.live_interval
+
+        interval = self.halftime_interval if HALFTIME in statuses else self.idle_interval
+
+        kickoffs = [
+            game.kickoff for game in games if game.status == SCHEDULED and game.kickoff is not None
+        ]
+        if kickoffs:
+            until_kickoff = (min(kickoffs) - now).total_seconds()
+            interval = min(interval, max(until_kickoff, self.live_interval))
+
+        return interval
+
+    @staticmethod
+    def should_fetch(previous: Dict[str, str], current: Dict[str, str]) -> bool:
+        """
+        Player stats are pulled while a game is live and once more whenever
+        a game changes status (so halftime and final stats are captured).
+        """
+        return LIVE in current.values() or previous != current
+
+
+def watch(
+    scraper: Any,
+    on_update: Callable[[Any], None],
+    policy: Optional[PollPolicy] = None,
+    teams: Optional[Set[str]] = None,
+    clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    sleep: Callable[[float], None] = time.sleep,
+    fetch: Optional[Callable[[], Any]] = None,
+) -> int:
+    """
+    Poll ``scraper`` for ACTUAL player points through the Thanksgiving
+    games, passing each pull to ``on_update``.
+
+    Only games involving ``teams`` (if given) are considered. If the game
+    statuses can't be fetched (or no games are found, e.g. for an error
+    payload), player stats are pulled every ``live_interval`` instead. Player stats are pulled with ``fetch``
+    (by default ``scraper.get_actual_player_pts``). Returns the number of
+    player stat pulls.
+    """
+    policy = PollPolicy() if policy is None else policy
+    fetch = scraper.get_actual_player_pts if fetch is None else fetch
+    previous: Dict[str, str] = {}
+    pulls = 0
+
+    while True:
+        try:
+            games = scraper.get_thanksgiving_games()
+        except Exception as e:
+            logger.info(f'WARNING: Unable to get game statuses ({e}); polling player stats.')
+            current, interval = {}, policy.live_interval
+        else:
+            if teams is not None:
+                games = [game for game in games if game.teams & teams]
+            if not games:
+                logger.info('WARNING: No game statuses found; polling player stats.')
+            current = {game.game_id: game.status for game in games}
+            interval = policy.next_interval(games, clock())
+
+            if interval is None:
+                break
+
+        if not current or policy.should_fetch(previous, current):
+            on_update(fetch())
+            pulls += 1
+
+        previous = current
+        logger.info(f'Game statuses: {current or "unknown"}; next poll in {interval:.0f}s')
+        sleep(interval)
+
+    # Final full refresh once every game is final
+    logger.info('All games are final; running a final refresh...')
+    on_update(fetch())
+
+    return pulls + 1
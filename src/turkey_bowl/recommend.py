@@ -0,0 +1,122 @@
+"""
+Best-available draft recommendations
+
+Projected points are pulled before the draft, so they can rank the
+players still available to the participant on the clock. ``Recommender``
+keeps a max-heap of undrafted players per position, keyed on
+``PROJ_pts``::
+
+    recommender = Recommender(index.entries)
+    recommender.remove(player_id)   # a pick, O(1)
+    recommender.restore(player_id)  # an undone pick, O(log n)
+    recommender.recommend(open_slots, limit=5)
+
+Drafted players are deleted lazily: they are skipped (and popped once
+they reach the top of a heap), so a pick never rebuilds a heap.
+Recommendations only consider the positions the participant's open roster
+slots allow (an open Flex (RB/WR/TE) or Bench slot allows an RB, WR or
+TE), best first across those positions, along with the slot each would
+fill.
+"""
+
+import heapq
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from turkey_bowl.reconcile import slot_positions
+from turkey_bowl.search import PlayerEntry
+
+# (-PROJ_pts, name, player id); the smallest item is the best player
+HeapItem = Tuple[float, str, str]
+
+
+class Recommendation(NamedTuple):
+    entry: PlayerEntry
+    slot: str
+
+
+def fill_slot(entry: PlayerEntry, open_slots: Iterable[str]) -> Optional[str]:
+    """First of ``open_slots`` that can hold the player (roster order)."""
+    for slot in open_slots:
+        positions = slot_positions(slot)
+        if positions is None or entry.position in positions:
+            return slot
+    return None
+
+
+class Recommender:
+    def __init__(self, players: Iterable[PlayerEntry]) -> None:
+        self.players: Dict[str, PlayerEntry] = {}
+        self._heaps: Dict[Optional[str], List[HeapItem]] = {}
+        self.drafted: Set[str] = set()
+        self._popped: Set[str] = set()
+
+        for entry in players:
+            self.players[entry.player_id] = entry
+            self._heaps.setdefault(entry.position, []).append(self._item(entry))
+
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+
+    def __repr__(self):
+        return f'Recommender({len(self.players) - len(self.drafted)} available players)'
+
+    @staticmethod
+    def _item(entry: PlayerEntry) -> HeapItem:
+        return (-entry.proj_pts, entry.name, entry.player_id)
+
+    @property
+    def positions(self) -> List[Optional[str]]:
+        return list(self._heaps)
+
+    def remove(self, player_id: str) -> None:
+        """Mark a player drafted."""
+        self.drafted.add(player_id)
+
+    def restore(self, player_id: str) -> None:
+        """Make a drafted player available again (e.g. an undone pick)."""
+        self.drafted.discard(player_id)
+        if player_id in self._popped:
+            self._popped.discard(player_id)
+            entry = self.players[player_id]
+            heapq.heappush(self._heaps[entry.position], self._item(entry))
+
+    def best(self, position: Optional[str]) -> Iterator[PlayerEntry]:
+        """
+        Undrafted players of ``position``, best first. Each player yielded
+        costs O(log n) (a walk of the heap, which is left as it is).
+        """
+        heap = self._heaps.get(position, [])
+
+        # Lazy deletion of drafted players at the top of the heap
+        while heap and heap[0][2] in self.drafted:
+            self._popped.add(heapq.heappop(heap)[2])
+
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            (_, _, pid), i = heapq.heappop(frontier)
+            if pid not in self.drafted:
+                yield self.players[pid]
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+    def recommend(self, open_slots: Iterable[str], limit: int = 5) -> List[Recommendation]:
+        """Best available players for ``open_slots`` and the slot each would fill."""
+        open_slots = list(open_slots)
+        allowed = [slot_positions(slot) for slot in open_slots]
+        if any(positions is None for positions in allowed):
+            positions = set(self.positions)
+        else:
+            positions = set().union(*allowed)
+
+        best = heapq.merge(
+            *(self.best(position) for position in positions if position in self._heaps),
+            key=lambda entry: (-entry.proj_pts, entry.name, entry.player_id),
+        )
+
+        recommendations = []
+        for entry in best:
+            if len(recommendations) >= limit:
+                break
+            recommendations.append(Recommendation(entry, fill_slot(entry, open_slots)))
+        return recommendations
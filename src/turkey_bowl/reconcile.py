@@ -0,0 +1,221 @@
+"""
+Draft reconciliation
+
+Drafted players are typed in by hand, so a typo ("Aman Ra St. Brown") or a
+traded player would silently score NaN. Between ``Draft.load`` and
+``aggregate.merge_points`` each drafted row is matched to a player id,
+kept in an integer ``Player_ID`` column that ``merge_points`` joins on,
+and its ``Player`` and ``Team`` are replaced by the player's own.
+Matching uses a ``search.PlayerIndex`` blocked by team and by the
+positions a draft slot allows, so a row is only compared with a handful
+of players:
+
+1. same (normalized) name, same team and allowed position
+2. most similar name (trigrams), same team and allowed position
+3. same name, any team (a traded player)
+4. most similar name, any team (with a stricter ``min_score``)
+
+Rows that can't be matched are left as drafted (and reported). The
+matches are cached next to the draft sheet and reused for as long as the
+sheet is unchanged, so reconciliation runs once per sheet, not per poll.
+"""
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import pandas as pd
+
+from turkey_bowl import utils
+from turkey_bowl.search import Match, PlayerIndex
+
+logger = logging.getLogger(__name__)
+
+# Player positions allowed by each draft slot (``RB_1`` is an ``RB`` slot)
+SLOT_POSITIONS = {
+    'QB': {'QB'},
+    'RB': {'RB'},
+    'WR': {'WR'},
+    'TE': {'TE'},
+    'K': {'K'},
+    'Flex (RB/WR/TE)': {'RB', 'WR', 'TE'},
+    'Defense (Team Name)': {'DEF'},
+    'Bench (RB/WR/TE)': {'RB', 'WR', 'TE'},
+}
+
+
+def slot_type(slot: Optional[str]) -> Optional[str]:
+    """Type of a draft slot (``'RB'`` for ``'RB_1'``)."""
+    if not isinstance(slot, str):
+        return None
+    return re.sub(r'_\d+$', '', slot.strip())
+
+
+def slot_positions(slot: Optional[str]) -> Optional[Set[str]]:
+    """Positions allowed by a draft slot (``None`` if any position is)."""
+    return SLOT_POSITIONS.get(slot_type(slot))
+
+
+def sheet_hash(draft_sheet_path: Path) -> str:
+    """Content hash identifying a version of the draft sheet (file or csv directory)."""
+    draft_sheet_path = Path(draft_sheet_path)
+    if not draft_sheet_path.is_dir():
+        return hashlib.sha256(draft_sheet_path.read_bytes()).hexdigest()
+
+    digest = hashlib.sha256()
+    for csv_path in sorted(draft_sheet_path.glob('*.csv')):
+        digest.update(csv_path.name.encode())
+        digest.update(csv_path.read_bytes())
+    return digest.hexdigest()
+
+
+class Reconciler:
+    def __init__(
+        self, index: PlayerIndex, min_score: float = 0.5, min_score_any_team: float = 0.75
+    ) -> None:
+        self.index = index
+        self.min_score = min_score
+        self.min_score_any_team = min_score_any_team
+
+    def __repr__(self):
+        return f'Reconciler({self.index!r}, min_score={self.min_score})'
+
+    def match(
+        self, player: str, team: Optional[str] = None, slot: Optional[str] = None
+    ) -> Optional[Match]:
+        """Best match for a drafted row (see the module docstring), if any."""
+        if not isinstance(player, str) or not player.strip():
+            return None
+
+        positions = slot_positions(slot)
+        team = team if isinstance(team, str) and team else None
+
+        if team is not None:
+            block = self.index.block(team, positions)
+            exact = self.index.exact(player, block)
+            if exact:
+                return Match(self.index.entries[exact[0]], 1.0)
+
+            scored = self.index.score(player, block)
+            if scored and scored[0].score >= self.min_score:
+                return scored[0]
+
+        block = self.index.block(None, positions)
+        exact = self.index.exact(player, block)
+        if exact:
+            ranked = self.index.score(player, exact)
+            return ranked[0]._replace(score=1.0)
+
+        # Only players sharing a trigram with the name are scored
+        scored = self.index.fuzzy(player, limit=len(self.index), min_score=self.min_score_any_team)
+        allowed = [m for m in scored if positions is None or m.entry.position in positions]
+        return allowed[0] if allowed else None
+
+    def reconcile_team(self, participant_team: pd.DataFrame, participant: str = '') -> pd.DataFrame:
+        """
+        Drafted team with a ``Player_ID`` column and the matched players'
+        ``Player`` and ``Team``.
+        """
+        participant_team = participant_team.copy()
+        player_ids: List[Optional[str]] = []
+
+        for row in participant_team.itertuples(index=False):
+            player = getattr(row, 'Player', None)
+            team = getattr(row, 'Team', None)
+            match = self.match(player, team, getattr(row, 'Position', None))
+
+            if match is None:
+                if isinstance(player, str) and player:
+                    logger.info(f'WARNING: {participant} drafted unknown player {player} ({team})')
+                player_ids.append(None)
+                continue
+
+            entry = match.entry
+            if (entry.name, entry.team) != (player, team):
+                logger.info(
+                    f'{participant}: {player} ({team}) -> {entry.name} ({entry.team}) '
+                    + f'[score {match.score}]'
+                )
+            player_ids.append(entry.player_id)
+
+        matched = pd.Series(player_ids, index=participant_team.index)
+        entries = {entry.player_id: entry for entry in self.index.entries}
+        is_matched = matched.notna()
+
+        participant_team.loc[is_matched, 'Player'] = matched[is_matched].map(
+            lambda pid: entries[pid].name
+        )
+        participant_team.loc[is_matched, 'Team'] = matched[is_matched].map(
+            lambda pid: entries[pid].team
+        )
+        participant_team['Player_ID'] = matched.astype('Int64')
+
+        return participant_team
+
+    def reconcile(self, participant_teams: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        return {
+            participant: self.reconcile_team(participant_team, participant)
+            for participant, participant_team in participant_teams.items()
+        }
+
+
+def _apply_cached(
+    participant_teams: Dict[str, pd.DataFrame], cached: Dict[str, List[Dict[str, Any]]]
+) -> Dict[str, pd.DataFrame]:
+    reconciled = {}
+    for participant, participant_team in participant_teams.items():
+        rows = pd.DataFrame(cached[participant], index=participant_team.index)
+        participant_team = participant_team.copy()
+        participant_team[['Player', 'Team']] = rows[['Player', 'Team']]
+        participant_team['Player_ID'] = rows['Player_ID'].astype('Int64')
+        reconciled[participant] = participant_team
+    return reconciled
+
+
+def reconcile_draft(
+    participant_teams: Dict[str, pd.DataFrame],
+    draft_sheet_path: Path,
+    cache_path: Path,
+    index_factory: Callable[[], PlayerIndex],
+) -> Dict[str, pd.DataFrame]:
+    """
+    Reconcile the teams loaded from ``draft_sheet_path``, reusing the
+    matches cached at ``cache_path`` while the sheet is unchanged.
+
+    ``index_factory()`` builds the ``PlayerIndex`` (only when the cache
+    can't be used).
+    """
+    draft_sheet_hash = sheet_hash(draft_sheet_path)
+    cache_path = Path(cache_path)
+
+    if cache_path.exists():
+        cache = utils.load_from_json(cache_path)
+        if cache.get('sheet_hash') == draft_sheet_hash and set(cache['teams']) == set(
+            participant_teams
+        ):
+            logger.info(f'Using reconciled draft from {cache_path}')
+            return _apply_cached(participant_teams, cache['teams'])
+
+    reconciled = Reconciler(index_factory()).reconcile(participant_teams)
+
+    cache = {
+        'sheet_hash': draft_sheet_hash,
+        'teams': {
+            participant: [
+                {
+                    'Player': None if pd.isna(row.Player) else row.Player,
+                    'Team': None if pd.isna(row.Team) else row.Team,
+                    'Player_ID': None if pd.isna(row.Player_ID) else int(row.Player_ID),
+                }
+                for row in participant_team.itertuples(index=False)
+            ]
+            for participant, participant_team in reconciled.items()
+        },
+    }
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with utils.atomic_path(cache_path) as tmp_path:
+        utils.write_to_json(cache, tmp_path)
+
+    return reconciled
@@ -0,0 +1,271 @@
+"""
+Replay server
+
+A local stand-in for api.fantasy.nfl.com that replays recorded payloads,
+for load testing the scraper (concurrency, retries, caching) against
+realistic latency without hitting NFL.com::
+
+    with ReplayServer.from_dir_config(dir_config, latency=0.2, error_rate=0.05) as server:
+        scraper = Scraper(2023, base_url=server.base_url)
+
+or from the command line (``turkey-bowl replay``) together with the
+``TURKEY_BOWL_BASE_URL`` environment variable.
+
+Served endpoints (under ``/v2``):
+
+- ``players/weekstats`` and ``players/weekprojectedstats``: the weeks
+  stored by ``turkey-bowl backfill`` (``backfill.JSONWeekStore``)
+- ``player/ngs-content``: players in the player store
+- ``game/stats``: ``<season>_<week>_gameStats.json`` payloads stored
+  beside the backfilled weeks
+
+Latency (plus uniform jitter), random server errors and a token bucket
+rate limit (429 with ``Retry-After``) can be configured.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from turkey_bowl.backfill import JSONWeekStore
+from turkey_bowl.player_store import PlayerStore
+
+logger = logging.getLogger(__name__)
+
+# Single game id used for replayed payloads
+REPLAY_GAME_ID = '1'
+
+STATS_PATHS = {
+    '/v2/players/weekstats': 'stats',
+    '/v2/players/weekprojectedstats': 'projectedStats',
+}
+PLAYER_NGS_CONTENT_PATH = '/v2/player/ngs-content'
+GAME_STATS_PATH = '/v2/game/stats'
+
+
+def _error_payload(message: str) -> Dict[str, Any]:
+    return {'errors': [{'id': 'replay', 'message': message, 'messageStringId': message}]}
+
+
+class TokenBucket:
+    """Allow ``rate`` requests per second with bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None, clock=time.monotonic) -> None:
+        self.rate = rate
+        self.burst = max(1, int(rate) if burst is None else burst)
+        self.clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'TokenBucket({self.rate}, burst={self.burst})'
+
+    def acquire(self) -> float:
+        """
+        Take a token. Returns 0 on success, otherwise the seconds until a
+        token is available.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            return (1 - self._tokens) / self.rate
+
+
+class ReplayServer:
+    def __init__(
+        self,
+        backfill_dir: Path,
+        player_ids: Optional[Dict[str, Any]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        seed: Optional[int] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        self.week_store = JSONWeekStore(backfill_dir)
+        self.player_ids = {} if player_ids is None else player_ids
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limiter = None if rate_limit is None else TokenBucket(rate_limit, burst)
+
+        self.counts = {'requests': 0, 'errors': 0, 'throttled': 0, 'not_found': 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+
+    @classmethod
+    def from_dir_config(cls, dir_config: SimpleNamespace, **kwargs: Any) -> 'ReplayServer':
+        player_ids = PlayerStore.from_dir_config(dir_config).to_dict()
+        return cls(dir_config.backfill_dir, player_ids, **kwargs)
+
+    def __repr__(self):
+        return f"ReplayServer('{self.week_store.backfill_dir}', base_url='{self.base_url}')"
+
+    def __enter__(self) -> 'ReplayServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """Base url to give ``Scraper`` (or ``TURKEY_BOWL_BASE_URL``)."""
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/v2'
+
+    def start(self) -> None:
+        """Serve on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='replay-server', daemon=True
+        )
+        self._thread.start()
+        logger.info(f'Replaying {self.week_store.backfill_dir} at {self.base_url}')
+
+    def serve_forever(self) -> None:
+        """Serve on this thread (until interrupted)."""
+        logger.info(f'Replaying {self.week_store.backfill_dir} at {self.base_url}')
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] += 1
+
+    def _delay(self) -> float:
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + jitter)
+
+    def _inject_error(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def respond(self, url: str) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        """(status, headers, json payload) for a GET of ``url``."""
+        self._count('requests')
+
+        if self.rate_limiter is not None:
+            retry_after = self.rate_limiter.acquire()
+            if retry_after:
+                self._count('throttled')
+                headers = {'Retry-After': f'{retry_after:.3f}'}
+                return 429, headers, _error_payload('TOO_MANY_REQUESTS')
+
+        time.sleep(self._delay())
+
+        if self._inject_error():
+            self._count('errors')
+            return 503, {}, _error_payload('SERVICE_UNAVAILABLE')
+
+        parsed = urlparse(url)
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+
+        if parsed.path in STATS_PATHS:
+            return self._week_stats(STATS_PATHS[parsed.path], params)
+
+        if parsed.path == GAME_STATS_PATH:
+            return self._game_stats(params)
+
+        if parsed.path == PLAYER_NGS_CONTENT_PATH:
+            return self._ngs_content(params.get('playerId', ''))
+
+        self._count('not_found')
+        return 404, {}, _error_payload('NOT_FOUND')
+
+    def _stored_week(self, stats_type: str, params: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """(status, stored payload or error payload) of a stored week."""
+        try:
+            season, week = int(params['season']), int(params['week'])
+        except (KeyError, ValueError):
+            return 400, _error_payload('INVALID_PARAMETERS')
+
+        if not self.week_store.exists(season, week, stats_type):
+            self._count('not_found')
+            return 404, _error_payload('NOT_FOUND')
+
+        return 200, self.week_store.load(season, week, stats_type)
+
+    def _week_stats(
+        self, stats_type: str, params: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        status, player_pts = self._stored_week(stats_type, params)
+        if status != 200:
+            return status, {}, player_pts
+
+        payload = {
+            'systemConfig': {'currentGameId': REPLAY_GAME_ID},
+            'games': {REPLAY_GAME_ID: {'players': player_pts}},
+        }
+        return 200, {}, payload
+
+    def _game_stats(self, params: Dict[str, str]) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        status, game_stats = self._stored_week('gameStats', params)
+        return status, {}, game_stats
+
+    def _ngs_content(self, pid: str) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        player_record = self.player_ids.get(pid)
+        if not isinstance(player_record, dict):
+            return 400, {}, _error_payload('PLAYER_INVALID')
+
+        player = {
+            'playerId': pid,
+            'name': player_record.get('name'),
+            'position': player_record.get('position'),
+            'nflTeamAbbr': player_record.get('team'),
+            'injuryGameStatus': player_record.get('injury'),
+        }
+        return 200, {}, {'games': {REPLAY_GAME_ID: {'players': {pid: player}}}}
+
+    def _make_handler(self):
+        replay_server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, headers, payload = replay_server.respond(self.path)
+                body = json.dumps(payload).encode()
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for header, value in headers.items():
+                    self.send_header(header, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return ReplayHandler
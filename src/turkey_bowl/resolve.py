@@ -0,0 +1,142 @@
+"""
+Player metadata resolution
+
+Resolves player ids that are missing from the player store (e.g. players
+that show up in actual points but were never projected). Lookups are:
+
+- coalesced: concurrent requests for the same id share one fetch
+- concurrent: ids are fetched on a thread pool
+- cached: resolved ids are kept for the life of the resolver, and
+  failed ids are kept in a negative cache for ``negative_ttl`` seconds so
+  repeated polls don't keep re-requesting them (hits and misses are
+  counted in ``metrics.METRICS``)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from turkey_bowl.metrics import METRICS
+from turkey_bowl.scrape import Scraper
+
+logger = logging.getLogger(__name__)
+
+PlayerRecord = Dict[str, Optional[str]]
+
+# Name of the resolver's cache in ``metrics.METRICS``
+CACHE_NAME = 'player_resolver'
+
+
+class PlayerResolver:
+    def __init__(
+        self,
+        scraper: Scraper,
+        max_workers: int = 8,
+        negative_ttl: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.scraper = scraper
+        self.max_workers = max_workers
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+
+        self._resolved: Dict[str, PlayerRecord] = {}
+        self._failed: Dict[str, Tuple[float, str]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='resolver')
+
+    def __repr__(self):
+        return f'PlayerResolver({self.scraper!r}, max_workers={self.max_workers})'
+
+    def _fetch(self, pid: str) -> PlayerRecord:
+        try:
+            record = self.scraper._get_player_record(pid)
+        except Exception as e:
+            with self._lock:
+                self._failed[pid] = (self.clock() + self.negative_ttl, str(e))
+                del self._inflight[pid]
+            raise
+
+        with self._lock:
+            self._resolved[pid] = record
+            self._failed.pop(pid, None)
+            del self._inflight[pid]
+
+        return record
+
+    def submit(self, pid: str) -> Future:
+        """
+        Return a future for ``pid``'s record.
+
+        Cached ids (resolved or recently failed) complete immediately, and
+        an id already being fetched returns the in-flight future.
+        """
+        with self._lock:
+            if pid in self._resolved:
+                METRICS.record_cache(CACHE_NAME, hit=True)
+                future: Future = Future()
+                future.set_result(self._resolved[pid])
+                return future
+
+            if pid in self._failed:
+                expires, error = self._failed[pid]
+                if self.clock() < expires:
+                    METRICS.record_cache(CACHE_NAME, hit=True)
+                    future = Future()
+                    future.set_exception(LookupError(f'{error} (cached failure)'))
+                    return future
+                del self._failed[pid]
+
+            # A coalesced (in-flight) lookup is a hit too: it sends no request
+            METRICS.record_cache(CACHE_NAME, hit=pid in self._inflight)
+            if pid not in self._inflight:
+                self._inflight[pid] = self._executor.submit(self._fetch, pid)
+
+            return self._inflight[pid]
+
+    def resolve(self, pid: str) -> PlayerRecord:
+        """Resolve a single id, raising if it can't be resolved."""
+        return self.submit(pid).result()
+
+    def resolve_many(self, pids: Iterable[str]) -> Tuple[Dict[str, PlayerRecord], Dict[str, str]]:
+        """
+        Resolve ``pids`` concurrently.
+
+        Returns the resolved records and the errors of the ids that could
+        not be resolved, both keyed by player id.
+        """
+        futures = {pid: self.submit(pid) for pid in dict.fromkeys(pids)}
+        resolved = {}
+        errors = {}
+
+        for pid, future in futures.items():
+            try:
+                resolved[pid] = future.result()
+            except Exception as e:
+                errors[pid] = str(e)
+
+        return resolved, errors
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_resolvers: Dict[Tuple[int, Optional[str]], PlayerResolver] = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_resolver(year: int, root: Optional[str] = None) -> PlayerResolver:
+    """
+    Shared resolver (and so shared caches) per year and root directory,
+    so repeated polls in one process reuse it.
+    """
+    key = (year, None if root is None else str(root))
+
+    with _resolvers_lock:
+        if key not in _resolvers:
+            _resolvers[key] = PlayerResolver(Scraper(year, root))
+
+        return _resolvers[key]
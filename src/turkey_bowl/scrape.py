@@ -16,26 +16,60 @@ Notes:
     https://api.fantasy.nfl.com/v2/docs/service?serviceName=gameStats
 """
 
-import calendar
 import logging
-from datetime import datetime
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
-import numpy as np
-import requests
 from tqdm import tqdm
 
-from turkey_bowl import utils
+from turkey_bowl import polling, sources, utils
+from turkey_bowl.breaker import CircuitBreaker, Snapshot, SnapshotStore
+from turkey_bowl.metrics import METRICS, endpoint_for
+from turkey_bowl.player_store import PlayerStore, RefreshJournal
+from turkey_bowl.season_calendar import SeasonCalendar, season_calendar
+from turkey_bowl.sources import (  # noqa: F401
+    ACTUAL_PTS_URL,
+    PROJECTED_PTS_URL,
+    NFLSource,
+    PlayerPts,
+    Source,
+    iter_player_pts,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class PlayerNotFoundError(ValueError):
+    """The source answered but has no metadata for a player id."""
+
+
 class Scraper:
-    def __init__(self, year: int, root: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        year: int,
+        root: Optional[str] = None,
+        base_url: Optional[str] = None,
+        source: Optional[Union[str, Source]] = None,
+    ) -> None:
+        """
+        Player data comes from ``source`` (a ``sources.Source`` or a spec
+        such as ``'file:archive/backfill'``, see ``sources.get_source``),
+        by default the configured source. ``base_url`` is shorthand for
+        NFL.com served from elsewhere (e.g. a replay server).
+        """
         self.dir_config = utils.load_dir_config(year, root)
         self.year = year
+
+        if isinstance(source, Source):
+            self.source = source
+        elif source is None and base_url is not None:
+            self.source = NFLSource(base_url)
+        else:
+            self.source = sources.get_source(source, self.dir_config)
+
         self.week_delta = self.thanksgiving_calendar_week_start - self.nfl_calendar_week_start
+        self._breaker: Optional[CircuitBreaker] = None
 
     def __repr__(self):
         return f'Scraper({self.year})'
@@ -43,6 +77,10 @@ class Scraper:
     def __str__(self):
         return f'Turkey Bowl Scraper (Year: {self.year} NFL Week: {self.nfl_thanksgiving_calendar_week})'
 
+    @property
+    def season_calendar(self) -> SeasonCalendar:
+        return season_calendar(self.year)
+
     @property
     def nfl_calendar_week_start(self) -> int:
         """
@@ -56,26 +94,11 @@ class Scraper:
 
         This is 1-indexed not 0-indexed. Thus, Week 1 is the true start
         of the NFL season.
-        """
-        # Set Sunday as first day of the week
-        calendar.setfirstweekday(calendar.SUNDAY)
-
-        # Gather September days
-        sept = np.array(calendar.monthcalendar(self.year, 9))
-
-        # Get all September Mondays
-        sept_mondays = sept[:, 1]
 
-        # Find first Monday's date
-        sept_first_monday = min([mon for mon in sept_mondays if mon != 0])
-
-        # Convert first Monday in September to datetime object
-        sept_first_monday_date = datetime(self.year, 9, sept_first_monday)
-
-        # Find calendar week for start of NFL season
-        nfl_calendar_week_start = sept_first_monday_date.isocalendar()[1]
-
-        return nfl_calendar_week_start
+        The calendar week is that of the first Monday in September (see
+        ``season_calendar``).
+        """
+        return self.season_calendar.nfl_calendar_week_start
 
     @property
     def thanksgiving_calendar_week_start(self) -> int:
@@ -93,23 +116,7 @@ class Scraper:
         For example, if the NFL starts on week 35 and Thanksgiving is
         week 47, the week to pull via the API is week 12 (47 - 35 = 12).
         """
-        # Set Sunday as first day of week
-        calendar.setfirstweekday(calendar.SUNDAY)
-
-        # Gather November days
-        nov = np.array(calendar.monthcalendar(self.year, 11))
-
-        # Find 4th Thursday in November
-        nov_thursdays = nov[:, 4]
-        thanksgiving_day = [thur for thur in nov_thursdays if thur != 0][3]
-
-        # Convert Thanksgiving day to datetime object
-        thanksgiving_day_date = datetime(self.year, 11, thanksgiving_day)
-
-        # Find calendar week for Thanksgiving day
-        thanksgiving_calendar_week_start = thanksgiving_day_date.isocalendar()[1]
-
-        return thanksgiving_calendar_week_start
+        return self.season_calendar.thanksgiving_calendar_week_start
 
     @property
     def nfl_thanksgiving_calendar_week(self) -> int:
@@ -142,11 +149,17 @@ class Scraper:
         )
         self.week_delta = week - 1
 
-    def _encode_url_params(self, url: str) -> str:
+    def _encode_url_params(
+        self, url: str, season: Optional[int] = None, week: Optional[int] = None
+    ) -> str:
         """
         Helper function to encode year (season) and week as url params.
+
+        Defaults to this scraper's year and NFL Thanksgiving week.
         """
-        params = {'season': self.year, 'week': self.nfl_thanksgiving_calendar_week}
+        season = self.year if season is None else season
+        week = self.nfl_thanksgiving_calendar_week if week is None else week
+        params = {'season': season, 'week': week}
         params_encoded = urlencode(params)
 
         url_encoded = f'{url}{params_encoded}'
@@ -163,8 +176,9 @@ class Scraper:
         stats type (projected) in order to scrape the correct player
         fantasy points.
         """
-        url = 'https://api.fantasy.nfl.com/v2/players/weekprojectedstats?'
-        projected_pts_url = self._encode_url_params(url)
+        projected_pts_url = self.source.pts_url(
+            self.year, self.nfl_thanksgiving_calendar_week, projected=True
+        )
         return projected_pts_url
 
     @property
@@ -176,8 +190,9 @@ class Scraper:
         will create a query url for the desired year, week, and
         stats type in order to scrape the correct player fantasy points.
         """
-        url = 'https://api.fantasy.nfl.com/v2/players/weekstats?'
-        actual_pts_url = self._encode_url_params(url)
+        actual_pts_url = self.source.pts_url(
+            self.year, self.nfl_thanksgiving_calendar_week, projected=False
+        )
         return actual_pts_url
 
     @staticmethod
@@ -186,45 +201,157 @@ class Scraper:
         Send a GET request for the query url provided.
         Return the json dictionary received from the request.
         """
-        response = requests.get(query_url)
-
-        if verbose:
-            if response.status_code == requests.codes.ok:
-                logger.info(f'Successful API response obtained for: {query_url}')
-            else:
-                logger.info(f'WARNING: API response unsuccessful for: {query_url}')
-
-        return response.json()
+        return sources.get_json(query_url, verbose)
 
     def get_projected_player_pts(self) -> Dict[str, Any]:
         """
         Collect players and their corresponding PROJECTED points.
 
-        A GET request is sent to the  projected_pts_url. The returned
-        json is parsed to only get relevant player points.
+        A GET request is sent to the  projected_pts_url (for the NFL.com
+        source). The returned json is parsed to only get relevant player
+        points.
         """
-        # This is a unique identifier NOT truly a GAME identifier
         logger.info('Collecting projected player points...')
-        response_json = self.scrape_url(self.projected_pts_url)
-        system_config = response_json['systemConfig'].get('currentGameId')
-        projected_player_pts = response_json['games'][system_config].get('players')
-
-        return projected_player_pts
+        return self.source.get_player_pts(
+            self.year, self.nfl_thanksgiving_calendar_week, projected=True
+        )
 
     def get_actual_player_pts(self) -> Dict[str, Any]:
         """
         Collect players and their corresponding ACTUAL points.
 
-        A GET request is sent to the  actual_pts_url. The returned
-        json is parsed to only get relevant player points.
+        A GET request is sent to the  actual_pts_url (for the NFL.com
+        source). The returned json is parsed to only get relevant player
+        points.
         """
-        # This is a unique identifier NOT truly a GAME identifier
         logger.info('Collecting actual player points...')
-        response_json = self.scrape_url(self.actual_pts_url)
-        system_config = response_json['systemConfig'].get('currentGameId')
-        actual_player_pts = response_json['games'][system_config].get('players')
+        return self.source.get_player_pts(
+            self.year, self.nfl_thanksgiving_calendar_week, projected=False
+        )
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Circuit breaker of this scraper's source (see ``get_actual_snapshot``)."""
+        if self._breaker is None:
+            self._breaker = CircuitBreaker.from_dir_config(self.dir_config, self.source.name)
+        return self._breaker
 
-        return actual_player_pts
+    def get_actual_snapshot(self) -> Snapshot:
+        """
+        Collect ACTUAL points through the source's circuit breaker, keeping
+        them as the last good snapshot.
+
+        If the request fails (or the circuit is open) the last good
+        snapshot is served instead, marked stale; with no snapshot yet,
+        empty (stale) points are served. An empty response is served as
+        is only if there is no snapshot to fall back to.
+        """
+        week = self.nfl_thanksgiving_calendar_week
+        snapshots = SnapshotStore(self.dir_config.snapshot_dir)
+
+        try:
+            player_pts = self.breaker.call(self.get_actual_player_pts)
+        except Exception as e:
+            snapshot = snapshots.load(self.year, week)
+            as_of = 'never' if snapshot is None else snapshot.as_of.isoformat()
+            logger.info(
+                f'WARNING: Unable to collect actual player points ({e}); '
+                + f'serving the last good snapshot (as of {as_of}).'
+            )
+            return Snapshot({}, None, stale=True) if snapshot is None else snapshot
+
+        if not player_pts:
+            snapshot = snapshots.load(self.year, week)
+            if snapshot is None:
+                return Snapshot(player_pts, None)
+
+            logger.info(
+                'WARNING: No actual player points were returned; '
+                + f'serving the last good snapshot (as of {snapshot.as_of.isoformat()}).'
+            )
+            return snapshot
+
+        return snapshots.save(self.year, week, player_pts)
+
+    def fetch_player_pts(
+        self, projected: bool = True, actual: bool = True, update_player_ids: bool = True
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Collect PROJECTED and ACTUAL points concurrently, yielding
+        ``('projected', player_pts)`` and ``('actual', player_pts)`` as
+        each completes so they can be aggregated right away.
+
+        Player ids are updated from the projected points (if needed) in
+        the same worker, while the actual request is in flight. Actual
+        points are never yielded before the projected points (and so the
+        player id update) when both are requested, since aggregating
+        them relies on up to date player ids.
+        """
+
+        def _get_projected_player_pts() -> Dict[str, Any]:
+            player_pts = self.get_projected_player_pts()
+            if update_player_ids:
+                self.update_player_ids(player_pts)
+            return player_pts
+
+        tasks = {}
+        if projected:
+            tasks['projected'] = _get_projected_player_pts
+        if actual:
+            tasks['actual'] = self.get_actual_player_pts
+
+        if not tasks:
+            return
+
+        with ThreadPoolExecutor(len(tasks), thread_name_prefix='scrape') as executor:
+            futures = {executor.submit(task): kind for kind, task in tasks.items()}
+            held = []
+
+            for future in as_completed(futures):
+                kind = futures[future]
+                if kind == 'actual' and 'projected' in tasks:
+                    held.append((kind, future.result()))
+                    continue
+
+                yield kind, future.result()
+                tasks.pop(kind)
+                yield from held
+
+    def get_week_player_pts(
+        self, season: int, week: int, projected: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Collect players and their ACTUAL (or PROJECTED) points for any
+        season and week, not just Thanksgiving week.
+        """
+        return self.source.get_player_pts(season, week, projected)
+
+    def iter_week_player_pts(
+        self, season: Optional[int] = None, week: Optional[int] = None, projected: bool = False
+    ) -> Iterator[PlayerPts]:
+        """
+        Stream (player id, player points) pairs for a season and week
+        (by default, this year's Thanksgiving week) as they download.
+
+        The pairs can be passed straight to
+        ``aggregate.create_player_pts_df``.
+        """
+        season = self.year if season is None else season
+        week = self.nfl_thanksgiving_calendar_week if week is None else week
+        return self.source.iter_player_pts(season, week, projected)
+
+    def get_game_statuses(self, week: Optional[int] = None) -> List[polling.GameStatus]:
+        """
+        Status of each game of a week (by default, this year's
+        Thanksgiving week) from the ``gameStats`` service.
+        """
+        week = self.nfl_thanksgiving_calendar_week if week is None else week
+        return polling.parse_game_stats(self.source.get_game_stats(self.year, week))
+
+    def get_thanksgiving_games(self) -> List[polling.GameStatus]:
+        """Status of the games played on Thanksgiving day."""
+        thanksgiving_day = self.season_calendar.thanksgiving_day
+        return polling.on_day(self.get_game_statuses(), thanksgiving_day)
 
     def _player_ids_need_update(self) -> bool:
         """
@@ -232,41 +359,52 @@ class Scraper:
         If it does, player ids need to be updated only if ``year`` does
         not match THIS year.
         """
-        if self.dir_config.player_ids_json_path.exists():
-            player_ids_loaded = utils.load_from_json(self.dir_config.player_ids_json_path)
+        player_store = PlayerStore.from_dir_config(self.dir_config)
+        return player_store.year != self.year
 
-            if player_ids_loaded.get('year') == self.year:
-                return False
-        return True
+    def _get_player_metadata(self, player_id: str) -> sources.PlayerMetadata:
+        """
+        Helper function to scrape NFL.com (or the configured source) for
+        individual player data. Returns an error message if the player
+        can't be found.
+        """
+        return self.source.get_player_metadata(player_id)
 
-    def _get_player_metadata(self, player_id: str) -> Dict[str, str]:
+    def _get_player_record(self, pid: str) -> Dict[str, Optional[str]]:
         """
-        Helper function to scrape NFL.com for individual player data.
+        Helper function to scrape a player and keep the fields stored in
+        ``player_ids.json`` (name, position, team, injury).
         """
-        url = f'https://api.fantasy.nfl.com/v2/player/ngs-content?playerId={player_id}'
-        response_json = self.scrape_url(url, verbose=False)
-        if 'errors' in response_json:
-            metadata = response_json['errors'][0]['message']
-        else:
-            # This is a unique identifier not truly a GAME identifier
-            game_id = list(response_json['games'].keys())[0]
-            metadata = response_json['games'][game_id]['players'].get(player_id)
+        player_metadata = self._get_player_metadata(pid)
+
+        if not isinstance(player_metadata, dict):
+            raise PlayerNotFoundError(f'No metadata for player {pid}: {player_metadata}')
 
-        return metadata
+        player_record = {
+            'name': player_metadata.get('name'),
+            'position': player_metadata.get('position'),
+            'team': player_metadata.get('nflTeamAbbr'),
+            'injury': player_metadata.get('injuryGameStatus'),
+        }
+
+        return player_record
 
     def _update_single_player_id(
         self, pid: str, pulled_player_id_data: Dict[str, Dict[str, Optional[str]]]
     ) -> None:
-        player_metadata = self._get_player_metadata(pid)
-        pulled_player_id_data[pid] = {}
-        pulled_player_id_data[pid]['name'] = player_metadata.get('name')
-        pulled_player_id_data[pid]['position'] = player_metadata.get('position')
-        pulled_player_id_data[pid]['team'] = player_metadata.get('nflTeamAbbr')
-        pulled_player_id_data[pid]['injury'] = player_metadata.get('injuryGameStatus')
+        pulled_player_id_data[pid] = self._get_player_record(pid)
 
     def update_player_ids(self, projected_player_pts: Dict[str, Any]) -> None:
         """
         Updates player ids (name, pos, team) and saves to json file.
+
+        Each player is upserted into the player store as soon as it is
+        scraped and journaled, so an interrupted refresh resumes with only
+        the missing or failed ids (ids that fail permanently are given up
+        on, see ``RefreshJournal``). Once every id has been scraped, players
+        no longer in the projections are dropped, the store is compacted in
+        id order and exported to json (the same output as an uninterrupted
+        refresh).
         """
         if self._player_ids_need_update():
             pulled_player_ids = list(projected_player_pts.keys())
@@ -274,20 +412,55 @@ class Scraper:
             # Sort by numerical string value
             pulled_player_ids.sort(key=int)
 
-            # Add a year reference (for checking)
-            pulled_player_ids.insert(0, 'year')
-            pulled_player_id_data: Dict[str, Dict[str, Optional[str]]] = {}
-
-            for pid in tqdm(pulled_player_ids, desc='\tUpdating player ids', ncols=75):
-                if pid == 'year':
-                    pulled_player_id_data[pid] = self.year  # type: ignore[assignment]
+            player_store = PlayerStore.from_dir_config(self.dir_config)
+            journal = RefreshJournal(self.dir_config.player_ids_journal_path, self.year)
+
+            todo_player_ids = [
+                pid
+                for pid in pulled_player_ids
+                if pid not in journal.given_up
+                and (pid not in journal.completed or pid not in player_store)
+            ]
+
+            retried = [pid for pid in todo_player_ids if pid in journal.failed]
+            if retried:
+                METRICS.record_retry(endpoint_for(sources.PLAYER_NGS_CONTENT_PATH), len(retried))
+
+            for pid in tqdm(todo_player_ids, desc='\tUpdating player ids', ncols=75):
+                try:
+                    player_store.upsert(pid, self._get_player_record(pid))
+                except PlayerNotFoundError as e:
+                    # The API answered without metadata; retrying won't help
+                    logger.debug(f'No metadata for player id {pid}', exc_info=True)
+                    journal.record(pid, error=repr(e), permanent=True)
+                except Exception as e:
+                    logger.debug(f'Failed to update player id {pid}', exc_info=True)
+                    journal.record(pid, error=repr(e))
                 else:
-                    self._update_single_player_id(pid, pulled_player_id_data)
-
-            utils.write_to_json(
-                json_dict=pulled_player_id_data,
-                filename=self.dir_config.player_ids_json_path,
-            )
+                    journal.record(pid)
+
+            if journal.failed:
+                logger.info(
+                    f'WARNING: {len(journal.failed)} player ids failed to update '
+                    + f'{sorted(journal.failed, key=int)}; re-run to retry them.'
+                )
+                return
+
+            if journal.given_up:
+                logger.info(
+                    f'WARNING: Gave up on {len(journal.given_up)} player ids '
+                    + f'{sorted(journal.given_up, key=int)}; they are left out of the player ids.'
+                )
+
+            for pid in set(player_store).difference(pulled_player_ids):
+                player_store.delete(pid)
+
+            # Add a year reference (for checking) last so an interrupted
+            # refresh is never mistaken for a complete one
+            player_store.upsert('year', self.year)
+            player_store.compact(order=['year', *pulled_player_ids])
+            player_store.export_json()
+            journal.clear()
 
         else:
             logger.info(f'Player ids are up to date at {self.dir_config.player_ids_json_path}')
@@ -0,0 +1,283 @@
+"""
+Player search
+
+An in-memory index of the players in ``player_ids.json`` (ranked by
+projected points when they are available) for looking players up while
+entering the draft::
+
+    index = PlayerIndex.from_dir_config(dir_config, projected_player_pts_df)
+    index.find('amon ra')   # prefix of any name token
+    index.find('aman ra st brown')   # fuzzy (character trigrams)
+
+Names are normalized (accents, case, punctuation and suffixes such as
+"Jr." are dropped) before indexing. Prefix queries bisect a sorted list of
+name keys; fuzzy queries score the players sharing trigrams with the query
+through an inverted index, so neither compares against every player.
+"""
+
+import bisect
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+import pandas as pd
+
+from turkey_bowl.player_store import PlayerStore
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Lead a top match needs over the next one to be picked without confirmation
+AMBIGUITY_MARGIN = 0.15
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a player name for matching: "Amon-Ra St. Brown" and
+    "amon ra st brown" both become ``'amon ra st brown'``.
+    """
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    name = re.sub(r"[.'`]", '', name.lower())
+    tokens = re.sub(r'[^a-z0-9]+', ' ', name).split()
+
+    # Keep a suffix if it is all there is (e.g. a bare "v" query)
+    stripped = [token for token in tokens if token not in NAME_SUFFIXES]
+    return ' '.join(stripped or tokens)
+
+
+def trigrams(normalized_name: str) -> Set[str]:
+    """Character trigrams of a normalized name (padded so short names match)."""
+    padded = f'  {normalized_name} '
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerEntry(NamedTuple):
+    player_id: str
+    name: str
+    team: Optional[str]
+    position: Optional[str]
+    proj_pts: float = 0.0
+
+
+class Match(NamedTuple):
+    entry: PlayerEntry
+    score: float
+
+
+class PlayerIndex:
+    def __init__(self, entries: Iterable[PlayerEntry]) -> None:
+        self.entries = list(entries)
+        self.keys = [normalize_name(entry.name) for entry in self.entries]
+
+        # (name key suffix starting at each token, entry) pairs so "brown"
+        # and "st brown" find "Amon-Ra St. Brown"
+        prefixes = []
+        for i, key in enumerate(self.keys):
+            tokens = key.split()
+            for start in range(len(tokens)):
+                prefixes.append((' '.join(tokens[start:]), i))
+        prefixes.sort()
+        self._prefix_keys = [prefix for prefix, _ in prefixes]
+        self._prefix_entries = [i for _, i in prefixes]
+
+        self._trigrams = [trigrams(key) for key in self.keys]
+        self._postings: Dict[str, List[int]] = {}
+        for i, grams in enumerate(self._trigrams):
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+
+        # Blocks for matching known rows (see ``block``)
+        self._by_key: Dict[str, List[int]] = {}
+        self._by_team: Dict[Optional[str], List[int]] = {}
+        for i, (key, entry) in enumerate(zip(self.keys, self.entries)):
+            self._by_key.setdefault(key, []).append(i)
+            self._by_team.setdefault(entry.team, []).append(i)
+
+    @classmethod
+    def from_player_ids(
+        cls,
+        player_ids: Dict[str, Any],
+        projected_player_pts_df: Optional[pd.DataFrame] = None,
+    ) -> 'PlayerIndex':
+        """
+        Index ``player_ids.json`` data, ranked by the ``PROJ_pts`` of
+        ``projected_player_pts_df`` (matched on ``Player_ID``, or on
+        ``Player`` and ``Team`` for csvs written without ids).
+        """
+        proj_pts: Dict[Any, float] = {}
+        if projected_player_pts_df is not None and 'Player_ID' in projected_player_pts_df:
+            proj_pts = dict(
+                zip(
+                    projected_player_pts_df['Player_ID'].astype(str),
+                    projected_player_pts_df['PROJ_pts'],
+                )
+            )
+        elif projected_player_pts_df is not None:
+            proj_pts = {
+                (player, team): pts
+                for player, team, pts in projected_player_pts_df[
+                    ['Player', 'Team', 'PROJ_pts']
+                ].itertuples(index=False)
+            }
+
+        entries = [
+            PlayerEntry(
+                player_id=pid,
+                name=record['name'],
+                team=record.get('team'),
+                position=record.get('position'),
+                proj_pts=float(
+                    proj_pts.get(pid, proj_pts.get((record['name'], record.get('team')), 0.0))
+                ),
+            )
+            for pid, record in player_ids.items()
+            if isinstance(record, dict) and record.get('name')
+        ]
+        return cls(entries)
+
+    @classmethod
+    def from_dir_config(
+        cls,
+        dir_config: SimpleNamespace,
+        projected_player_pts_path: Optional[Path] = None,
+    ) -> 'PlayerIndex':
+        """Index the player store, ranked by a projected points csv if it exists."""
+        projected_player_pts_df = None
+        if projected_player_pts_path is not None and Path(projected_player_pts_path).exists():
+            projected_player_pts_df = pd.read_csv(projected_player_pts_path, index_col=0)
+
+        player_ids = PlayerStore.from_dir_config(dir_config).to_dict()
+        return cls.from_player_ids(player_ids, projected_player_pts_df)
+
+    def __repr__(self):
+        return f'PlayerIndex({len(self.entries)} players)'
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _allowed(self, i: int, team: Optional[str], position: Optional[str]) -> bool:
+        entry = self.entries[i]
+        return (team is None or entry.team == team) and (
+            position is None or entry.position == position
+        )
+
+    def prefix(
+        self,
+        query: str,
+        limit: int = 10,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+    ) -> List[Match]:
+        """Players with a name token starting with ``query``, by projected points."""
+        key = normalize_name(query)
+        if not key:
+            return []
+
+        lo = bisect.bisect_left(self._prefix_keys, key)
+        hi = bisect.bisect_left(self._prefix_keys, key + '\x7f', lo)
+        found = {i for i in self._prefix_entries[lo:hi] if self._allowed(i, team, position)}
+
+        ranked = sorted(found, key=lambda i: (-self.entries[i].proj_pts, self.keys[i]))
+        return [Match(self.entries[i], 1.0) for i in ranked[:limit]]
+
+    def fuzzy(
+        self,
+        query: str,
+        limit: int = 10,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        min_score: float = 0.4,
+    ) -> List[Match]:
+        """
+        Players whose names share the most trigrams with ``query`` (Dice
+        coefficient of at least ``min_score``), ties by projected points.
+        """
+        query_grams = trigrams(normalize_name(query))
+
+        shared: Counter = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+
+        scored = []
+        for i, n_shared in shared.items():
+            if not self._allowed(i, team, position):
+                continue
+            score = 2 * n_shared / (len(query_grams) + len(self._trigrams[i]))
+            if score >= min_score:
+                scored.append((score, i))
+
+        scored.sort(
+            key=lambda item: (-item[0], -self.entries[item[1]].proj_pts, self.keys[item[1]])
+        )
+        return [Match(self.entries[i], round(score, 3)) for score, i in scored[:limit]]
+
+    def block(self, team: Optional[str] = None, positions: Optional[Set[str]] = None) -> List[int]:
+        """Positions (in ``entries``) of the players of ``team`` and ``positions``."""
+        block = range(len(self.entries)) if team is None else self._by_team.get(team, [])
+        if positions is None:
+            return list(block)
+        return [i for i in block if self.entries[i].position in positions]
+
+    def exact(self, name: str, candidates: Optional[Iterable[int]] = None) -> List[int]:
+        """Positions of the players whose normalized name is that of ``name``."""
+        found = self._by_key.get(normalize_name(name), [])
+        if candidates is None:
+            return list(found)
+        allowed = set(candidates)
+        return [i for i in found if i in allowed]
+
+    def score(self, query: str, candidates: Iterable[int]) -> List[Match]:
+        """Trigram (Dice) similarity of ``query`` to each candidate, best first."""
+        query_grams = trigrams(normalize_name(query))
+        scored = [
+            (
+                2
+                * len(query_grams & self._trigrams[i])
+                / (len(query_grams) + len(self._trigrams[i])),
+                i,
+            )
+            for i in candidates
+        ]
+        scored.sort(
+            key=lambda item: (-item[0], -self.entries[item[1]].proj_pts, self.keys[item[1]])
+        )
+        return [Match(self.entries[i], round(score, 3)) for score, i in scored]
+
+    def find(
+        self,
+        query: str,
+        limit: int = 10,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+    ) -> List[Match]:
+        """Prefix matches first, then fuzzy matches to make up ``limit``."""
+        matches = self.prefix(query, limit, team, position)
+        if len(matches) < limit:
+            seen = {match.entry.player_id for match in matches}
+            for match in self.fuzzy(query, limit, team, position):
+                if match.entry.player_id not in seen and len(matches) < limit:
+                    matches.append(match)
+        return matches
+
+
+def unambiguous_match(
+    query: str, matches: List[Match], margin: float = AMBIGUITY_MARGIN
+) -> Optional[Match]:
+    """
+    The one match ``query`` clearly means, if any: the only match, the
+    only exact (normalized) name or a top score at least ``margin`` ahead
+    of the next one.
+    """
+    if len(matches) == 1:
+        return matches[0]
+
+    key = normalize_name(query)
+    exact = [match for match in matches if normalize_name(match.entry.name) == key]
+    if len(exact) == 1:
+        return exact[0]
+
+    if len(matches) > 1 and matches[0].score - matches[1].score >= margin:
+        return matches[0]
+    return None
@@ -0,0 +1,136 @@
+"""
+NFL season calendar
+
+The API pulls scores by NFL week. NFL Week 1 is taken to be the calendar
+(ISO) week of Labor Day (the first Monday in September) and Thanksgiving
+is the fourth Thursday in November, so the Thanksgiving NFL week is the
+number of calendar weeks between the two plus one.
+
+Everything here is pure date arithmetic (no ``calendar.setfirstweekday``
+global state), computed for many seasons at once with NumPy and cached
+per season, so it is safe to call from worker threads.
+"""
+
+import threading
+from datetime import date, datetime
+from typing import Dict, Iterable, NamedTuple, Optional, Union
+
+import numpy as np
+
+# 1970-01-01 (day 0 of datetime64[D]) was a Thursday; Monday is 0
+_EPOCH_WEEKDAY = 3
+_MONDAY = 0
+_THURSDAY = 3
+
+
+class SeasonCalendar(NamedTuple):
+    season: int
+    labor_day: date
+    thanksgiving_day: date
+    nfl_calendar_week_start: int
+    thanksgiving_calendar_week_start: int
+
+    @property
+    def thanksgiving_week(self) -> int:
+        """NFL week that corresponds to Thanksgiving."""
+        return self.week_for(self.thanksgiving_day)
+
+    def week_for(self, day: Union[date, datetime]) -> int:
+        """
+        NFL week (calendar weeks since Week 1, 1-indexed) containing ``day``.
+
+        Days before Week 1 give weeks <= 0. Unlike ISO week numbers this
+        carries on across the new year for January games.
+        """
+        if isinstance(day, datetime):
+            day = day.date()
+        return (day - self.labor_day).days // 7 + 1
+
+
+def _weekday(days: np.ndarray) -> np.ndarray:
+    """Weekday (Monday is 0) of ``datetime64[D]`` values."""
+    return (days.astype('int64') + _EPOCH_WEEKDAY) % 7
+
+
+def _iso_week(days: np.ndarray) -> np.ndarray:
+    """
+    ISO week number of ``datetime64[D]`` values.
+
+    Only valid away from the year boundary (which is all that September
+    and November dates need).
+    """
+    years = days.astype('datetime64[Y]')
+    day_of_year = (days - years.astype('datetime64[D]')).astype('int64') + 1
+    return (day_of_year - _weekday(days) + 9) // 7
+
+
+def compute_season_calendars(seasons: Iterable[int]) -> Dict[int, SeasonCalendar]:
+    """Compute the calendars of ``seasons`` in one vectorized pass."""
+    seasons = np.unique(np.asarray(list(seasons), dtype='int64'))
+    if seasons.size == 0:
+        return {}
+
+    years = (seasons - 1970).astype('datetime64[Y]')
+    sept_first = years.astype('datetime64[M]') + np.timedelta64(8, 'M')
+    nov_first = years.astype('datetime64[M]') + np.timedelta64(10, 'M')
+    sept_first = sept_first.astype('datetime64[D]')
+    nov_first = nov_first.astype('datetime64[D]')
+
+    labor_days = sept_first + (_MONDAY - _weekday(sept_first)) % 7
+    thanksgiving_days = nov_first + (_THURSDAY - _weekday(nov_first)) % 7 + 21
+
+    nfl_weeks = _iso_week(labor_days)
+    thanksgiving_weeks = _iso_week(thanksgiving_days)
+
+    return {
+        int(season): SeasonCalendar(
+            season=int(season),
+            labor_day=labor_day.item(),
+            thanksgiving_day=thanksgiving_day.item(),
+            nfl_calendar_week_start=int(nfl_week),
+            thanksgiving_calendar_week_start=int(thanksgiving_week),
+        )
+        for season, labor_day, thanksgiving_day, nfl_week, thanksgiving_week in zip(
+            seasons, labor_days, thanksgiving_days, nfl_weeks, thanksgiving_weeks
+        )
+    }
+
+
+_calendars: Dict[int, SeasonCalendar] = {}
+_calendars_lock = threading.Lock()
+
+
+def season_calendars(seasons: Iterable[int]) -> Dict[int, SeasonCalendar]:
+    """Cached calendars of ``seasons``; uncached seasons are computed together."""
+    seasons = [int(season) for season in seasons]
+    missing = [season for season in seasons if season not in _calendars]
+
+    if missing:
+        computed = compute_season_calendars(missing)
+        with _calendars_lock:
+            _calendars.update(computed)
+
+    return {season: _calendars[season] for season in seasons}
+
+
+def season_calendar(season: int) -> SeasonCalendar:
+    calendar = _calendars.get(season)
+    if calendar is None:
+        calendar = season_calendars([season])[season]
+    return calendar
+
+
+def thanksgiving_week(season: int) -> int:
+    """NFL week that corresponds to Thanksgiving of ``season``."""
+    return season_calendar(season).thanksgiving_week
+
+
+def season_for(day: Union[date, datetime]) -> int:
+    """NFL season a date falls in (January through February is the prior season)."""
+    return day.year if day.month >= 3 else day.year - 1
+
+
+def nfl_week(day: Union[date, datetime], season: Optional[int] = None) -> int:
+    """NFL week of ``season`` (by default, the season ``day`` falls in) for ``day``."""
+    season = season_for(day) if season is None else season
+    return season_calendar(season).week_for(day)
@@ -0,0 +1,157 @@
+"""
+Shared-memory points table
+
+A ``create_player_pts_df`` output is wide (one column per stat) and
+every league scored in a worker process needs it; pickling it to each
+worker costs more than the scoring itself. ``publish`` copies its
+numeric block (``pts`` and stats, as float64) once into
+``multiprocessing.shared_memory`` and returns a small picklable
+``PointsTableHandle``: the name and shape of the block, its columns and
+an index of the other columns (``Player_ID``, ``Player``, ``Team``,
+``PROJ_Position``).
+
+Workers ``attach`` the handle to get a ``SharedPointsTable`` whose
+``values`` (and ``frame()`` columns) are zero-copy NumPy views of the
+block. ``rows`` gathers the rows of only the players a league drafted.
+
+The table keeps a weak reference to every view it hands out (any view
+derived from one keeps it alive) and ``close`` refuses to unmap the block
+while one is still in use, since touching it afterwards would crash the
+process.
+"""
+
+import logging
+import weakref
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class PointsTableHandle(NamedTuple):
+    """Picklable description of a published points table (see ``publish``)."""
+
+    shm_name: str
+    shape: Tuple[int, int]
+    columns: List[str]  # numeric block columns
+    index: pd.DataFrame  # other columns, one row per player
+    column_order: List[str]
+
+
+def _numeric_cols(player_pts_df: pd.DataFrame) -> List[str]:
+    numeric = player_pts_df.select_dtypes(include='number').columns
+    return [c for c in numeric if c != 'Player_ID']
+
+
+@contextmanager
+def publish(player_pts_df: pd.DataFrame) -> Iterator[PointsTableHandle]:
+    """
+    Copy the numeric block of ``player_pts_df`` into shared memory for
+    the duration of the context (the block is freed on exit).
+    """
+    columns = _numeric_cols(player_pts_df)
+    block = player_pts_df[columns].to_numpy(dtype='float64')
+    # Shared memory blocks can't be empty
+    shm = SharedMemory(create=True, size=max(block.nbytes, 1))
+
+    try:
+        # Column-major so each column is one contiguous slice of the block
+        view = np.ndarray(block.shape, dtype='float64', buffer=shm.buf, order='F')
+        view[:] = block
+        del view
+
+        logger.debug(f'Published {block.shape} points block ({block.nbytes} bytes) to {shm.name}')
+        yield PointsTableHandle(
+            shm_name=shm.name,
+            shape=block.shape,
+            columns=columns,
+            index=player_pts_df.drop(columns=columns).reset_index(drop=True),
+            column_order=list(player_pts_df.columns),
+        )
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+class SharedPointsTable:
+    def __init__(self, handle: PointsTableHandle) -> None:
+        self.handle = handle
+        self._shm: Optional[SharedMemory] = SharedMemory(name=handle.shm_name)
+        self._views: List[weakref.ref] = []
+
+    def __repr__(self):
+        return f"SharedPointsTable('{self.handle.shm_name}', shape={self.handle.shape})"
+
+    def __len__(self) -> int:
+        return self.handle.shape[0]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Zero-copy view of the numeric block (columns in ``handle.columns`` order)."""
+        if self._shm is None:
+            raise ValueError(f'{self!r} is closed.')
+        view = np.ndarray(self.handle.shape, dtype='float64', buffer=self._shm.buf, order='F')
+        self._views = [ref for ref in self._views if ref() is not None]
+        self._views.append(weakref.ref(view))
+        return view
+
+    def _frame(self, values: np.ndarray, index: pd.DataFrame) -> pd.DataFrame:
+        frame = pd.DataFrame(values, columns=self.handle.columns, copy=False)
+        for i, col in enumerate(self.handle.column_order):
+            if col in index:
+                frame.insert(i, col, index[col])
+        return frame
+
+    def frame(self) -> pd.DataFrame:
+        """The whole table; its numeric columns are views of the shared block."""
+        return self._frame(self.values, self.handle.index)
+
+    def rows(self, player_ids: Iterable[int]) -> pd.DataFrame:
+        """
+        Copies of the rows of ``player_ids`` (by ``Player_ID``), or of the
+        whole table if it has no ``Player_ID`` column.
+        """
+        index = self.handle.index
+        if 'Player_ID' not in index:
+            return self._frame(self.values.copy(order='F'), index)
+
+        positions = np.flatnonzero(index['Player_ID'].isin(list(player_ids)))
+        return self._frame(self.values[positions], index.iloc[positions].reset_index(drop=True))
+
+    def index_with(self, columns: Sequence[str]) -> pd.DataFrame:
+        """The non-numeric columns of every player with copies of ``columns``."""
+        values = self.values
+        index = self.handle.index.copy()
+        for col in columns:
+            index[col] = values[:, self.handle.columns.index(col)].copy()
+        return index
+
+    @property
+    def n_views(self) -> int:
+        """Number of views of the shared block still in use."""
+        return sum(ref() is not None for ref in self._views)
+
+    def close(self) -> None:
+        """
+        Detach from the shared block; raises a ``BufferError`` while views
+        of it (e.g. ``frame`` columns) are still in use.
+        """
+        if self._shm is None:
+            return
+
+        n_views = self.n_views
+        if n_views:
+            raise BufferError(f'Unable to close {self!r}: {n_views} view(s) of it still in use.')
+
+        self._views = []
+        self._shm.close()
+        self._shm = None
+
+
+def attach(handle: PointsTableHandle) -> SharedPointsTable:
+    """Attach to a published points table (e.g. in a worker process)."""
+    return SharedPointsTable(handle)
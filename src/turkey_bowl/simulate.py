@@ -0,0 +1,207 @@
+"""
+Mock draft simulator
+
+``Draft.setup`` draws the draft order at random, so whether a draft slot
+is an advantage is a fair question. ``simulate`` runs mock drafts (a
+``DraftEngine`` without a pick log per draft) in which each slot picks
+with a strategy from ``STRATEGIES``, then scores every roster, bench
+excluded, with:
+
+* ``PROJ_pts``: the players' projected points
+* ``ACTUAL_pts``: the players' mean Thanksgiving week points in the
+  warehouse (see ``StatsWarehouse.thanksgiving_pts``), 0.0 if unknown
+
+Drafts are spread over a process pool in chunks. Each draft seeds its
+own ``random.Random`` from ``seed`` and its number, so the results don't
+depend on the number of workers. ``summarize`` reports the distribution
+of the totals by draft slot.
+"""
+
+import logging
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import pandas as pd
+
+from turkey_bowl.draft import ROSTER_SLOTS
+from turkey_bowl.draft_engine import DraftEngine
+from turkey_bowl.lineup import BENCH_SLOTS
+from turkey_bowl.reconcile import slot_type
+from turkey_bowl.search import PlayerEntry
+
+logger = logging.getLogger(__name__)
+
+Strategy = Callable[[DraftEngine, str, random.Random], Optional[str]]
+
+PERCENTILES = (0.1, 0.5, 0.9)
+
+
+def best_available(engine: DraftEngine, participant: str, rng: random.Random) -> Optional[str]:
+    """The player with the most projected points fitting an open slot."""
+    recommendations = engine.recommend(participant, limit=1)
+    return recommendations[0].entry.player_id if recommendations else None
+
+
+def noisy(engine: DraftEngine, participant: str, rng: random.Random) -> Optional[str]:
+    """Any of the three best available players (a less disciplined drafter)."""
+    recommendations = engine.recommend(participant, limit=3)
+    return rng.choice(recommendations).entry.player_id if recommendations else None
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    'best_available': best_available,
+    'noisy': noisy,
+}
+
+
+def get_strategy(name: str) -> Strategy:
+    """Return the pick strategy registered for ``name`` (e.g. 'noisy')."""
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unrecognized strategy: '{name}'. Expected one of {list(STRATEGIES)}."
+        ) from None
+
+
+def mock_draft(
+    players: Sequence[PlayerEntry],
+    strategies: Sequence[str],
+    rng: random.Random,
+    slots: Sequence[str] = ROSTER_SLOTS,
+) -> DraftEngine:
+    """Run one draft in which draft slot ``i`` (from 1) picks with ``strategies[i - 1]``."""
+    draft_order = [str(i) for i in range(1, len(strategies) + 1)]
+    pickers = {
+        participant: get_strategy(name) for participant, name in zip(draft_order, strategies)
+    }
+    engine = DraftEngine(draft_order, players, slots=slots)
+
+    while not engine.is_complete:
+        participant = engine.on_the_clock
+        player_id = pickers[participant](engine, participant, rng)
+        if player_id is None:
+            raise ValueError(
+                f'Not enough players for {len(draft_order)} rosters of {len(engine.slots)}.'
+            )
+        engine.pick(participant, player_id)
+
+    return engine
+
+
+def roster_pts(engine: DraftEngine, pts: Mapping[str, float]) -> Dict[str, float]:
+    """Total ``pts`` (by player id) of each roster, bench excluded."""
+    return {
+        participant: sum(
+            pts.get(pid, 0.0)
+            for slot, pid in roster.items()
+            if pid is not None and slot_type(slot) not in BENCH_SLOTS
+        )
+        for participant, roster in engine.rosters.items()
+    }
+
+
+def _run_drafts(
+    sims: Sequence[int],
+    players: Sequence[PlayerEntry],
+    strategies: Sequence[str],
+    seed: int,
+    actual_pts: Mapping[str, float],
+    slots: Sequence[str],
+) -> List[Dict[str, Union[int, float, str]]]:
+    """Worker: run the drafts numbered ``sims``, one row per draft slot."""
+    proj_pts = {entry.player_id: entry.proj_pts for entry in players}
+    rows = []
+
+    for sim in sims:
+        engine = mock_draft(players, strategies, random.Random(f'{seed}:{sim}'), slots)
+        proj_totals = roster_pts(engine, proj_pts)
+        actual_totals = roster_pts(engine, actual_pts)
+
+        for draft_slot, strategy in enumerate(strategies, 1):
+            rows.append(
+                {
+                    'sim': sim,
+                    'draft_slot': draft_slot,
+                    'strategy': strategy,
+                    'PROJ_pts': round(proj_totals[str(draft_slot)], 2),
+                    'ACTUAL_pts': round(actual_totals[str(draft_slot)], 2),
+                }
+            )
+
+    return rows
+
+
+def simulate(
+    players: Iterable[PlayerEntry],
+    strategies: Sequence[str],
+    n_sims: int = 1000,
+    seed: int = 0,
+    actual_pts: Optional[Mapping[str, float]] = None,
+    slots: Sequence[str] = ROSTER_SLOTS,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 100,
+) -> pd.DataFrame:
+    """
+    Run ``n_sims`` mock drafts, one participant per strategy in
+    ``strategies`` (in draft slot order), and return one row per draft
+    and draft slot with the roster's ``PROJ_pts`` and ``ACTUAL_pts``.
+
+    ``max_workers=1`` runs the drafts in this process.
+    """
+    for name in strategies:
+        get_strategy(name)  # fail fast on an unknown strategy
+
+    # Only players with a projection are worth drafting
+    players = [entry for entry in players if entry.proj_pts > 0]
+    actual_pts = {} if actual_pts is None else dict(actual_pts)
+    chunks = [
+        range(start, min(start + chunk_size, n_sims)) for start in range(0, n_sims, chunk_size)
+    ]
+    run = partial(
+        _run_drafts,
+        players=players,
+        strategies=list(strategies),
+        seed=seed,
+        actual_pts=actual_pts,
+        slots=list(slots),
+    )
+
+    logger.info(
+        f'Simulating {n_sims} drafts of {len(strategies)} participants '
+        + f'from {len(players)} players...'
+    )
+    if max_workers == 1:
+        results = [run(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            results = list(executor.map(run, chunks))
+
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Distribution of roster totals by draft slot: mean, standard deviation,
+    percentiles and win rate (share of drafts with the best total, ties
+    shared) of ``PROJ_pts`` and ``ACTUAL_pts``.
+    """
+    summary = {}
+    by_slot = results.groupby('draft_slot')
+
+    for col in ('PROJ_pts', 'ACTUAL_pts'):
+        best = results.groupby('sim')[col].transform('max')
+        is_best = results[col] == best
+        n_best = is_best.groupby(results['sim']).transform('sum')
+        wins = (is_best / n_best).groupby(results['draft_slot']).sum()
+
+        prefix = col.replace('pts', '')
+        summary[f'{prefix}mean'] = by_slot[col].mean()
+        summary[f'{prefix}std'] = by_slot[col].std()
+        for q in PERCENTILES:
+            summary[f'{prefix}p{int(q * 100)}'] = by_slot[col].quantile(q)
+        summary[f'{prefix}win_rate'] = wins / results['sim'].nunique()
+
+    return pd.DataFrame(summary).round(3)
@@ -0,0 +1,358 @@
+"""
+Player data sources
+
+A source provides the three things ``Scraper`` needs: PROJECTED points,
+ACTUAL points and individual player metadata. Sources are chosen by name
+(``get_source``), from the ``TURKEY_BOWL_SOURCE`` environment variable or
+the CLI ``--source`` option:
+
+- ``nfl``: api.fantasy.nfl.com (the default)
+- ``replay[:<base url>]``: a local ``replay.ReplayServer``
+- ``file[:<directory>]``: weeks stored in a directory (by default the
+  backfill archive) so dry runs and benchmarks never touch the network
+
+ESPN changed its API in 2019 and broke everything; a new provider only
+needs a new ``Source`` subclass.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from urllib.parse import urlencode
+
+import ijson
+import requests
+
+from turkey_bowl import utils
+from turkey_bowl.metrics import METRICS, endpoint_for
+
+logger = logging.getLogger(__name__)
+
+SOURCE_ENV_VAR = 'TURKEY_BOWL_SOURCE'
+
+# The NFL.com base url can also be pointed elsewhere (e.g. a
+# ``replay.ReplayServer``) for the whole process with the environment variable
+BASE_URL = 'https://api.fantasy.nfl.com/v2'
+BASE_URL_ENV_VAR = 'TURKEY_BOWL_BASE_URL'
+REPLAY_BASE_URL = 'http://127.0.0.1:8080/v2'
+
+PROJECTED_PTS_PATH = '/players/weekprojectedstats?'
+ACTUAL_PTS_PATH = '/players/weekstats?'
+PLAYER_NGS_CONTENT_PATH = '/player/ngs-content?'
+GAME_STATS_PATH = '/game/stats?'
+
+PROJECTED_PTS_URL = f'{BASE_URL}{PROJECTED_PTS_PATH}'
+ACTUAL_PTS_URL = f'{BASE_URL}{ACTUAL_PTS_PATH}'
+
+# (player id, player points) as found under ``games[currentGameId].players``
+PlayerPts = Tuple[str, Dict[str, Any]]
+
+# Metadata as returned by ngs-content, or its error message
+PlayerMetadata = Union[Dict[str, Any], str]
+
+
+def iter_player_pts(json_file: IO[bytes]) -> Iterator[PlayerPts]:
+    """
+    Incrementally parse a weekstats/weekprojectedstats payload, yielding
+    each player of ``games[systemConfig.currentGameId].players`` as soon
+    as it has been read.
+
+    Only one player record is built at a time. The API sends
+    ``systemConfig`` before ``games``; should a game come first, its
+    players are held until the current game id is known. Raises a
+    ``ValueError`` if the payload has no current game id.
+    """
+    game_id = None
+    held: Dict[str, List[PlayerPts]] = {}
+    builder = None
+    depth = 0
+    pid = game = None
+
+    for prefix, event, value in ijson.parse(json_file, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+
+            if depth == 0:
+                player_pts = (pid, builder.value)
+                builder = None
+                if game == game_id:
+                    yield player_pts
+                elif game_id is None:
+                    held.setdefault(game, []).append(player_pts)
+
+        elif prefix == 'systemConfig.currentGameId' and event in ('string', 'number'):
+            game_id = value if isinstance(value, str) else str(int(value))
+            yield from held.pop(game_id, [])
+            held.clear()
+
+        elif event == 'map_key' and prefix.startswith('games.') and prefix.endswith('.players'):
+            game = prefix[len('games.') : -len('.players')]
+            if '.' not in game and (game_id is None or game == game_id):
+                pid = value
+                builder = ijson.ObjectBuilder()
+                depth = 0
+
+    if game_id is None:
+        raise ValueError('Unrecognized player points payload: no systemConfig.currentGameId.')
+
+
+def _log_response(response: requests.Response, query_url: str) -> None:
+    if response.status_code == requests.codes.ok:
+        logger.info(f'Successful API response obtained for: {query_url}')
+    else:
+        logger.info(f'WARNING: API response unsuccessful for: {query_url}')
+
+
+def get_json(query_url: str, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Send a GET request for the query url provided.
+    Return the json dictionary received from the request.
+    """
+    start = time.perf_counter()
+    response = requests.get(query_url)
+    METRICS.observe(
+        endpoint_for(query_url),
+        response.status_code,
+        time.perf_counter() - start,
+        len(response.content),
+    )
+
+    if verbose:
+        _log_response(response, query_url)
+
+    return response.json()
+
+
+class _CountingReader:
+    """File-like wrapper counting the bytes read through it."""
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        self.raw = raw
+        self.bytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.bytes += len(data)
+        return data
+
+
+def stream_player_pts(query_url: str, verbose: bool = True) -> Iterator[PlayerPts]:
+    """
+    Send a streaming GET request for the query url provided and yield
+    (player id, player points) pairs while the response downloads
+    (see ``iter_player_pts``).
+
+    The request is recorded in ``metrics.METRICS`` once the body has been
+    read (or abandoned).
+    """
+    start = time.perf_counter()
+    with requests.get(query_url, stream=True) as response:
+        if verbose:
+            _log_response(response, query_url)
+
+        response.raw.decode_content = True
+        body = _CountingReader(response.raw)
+        try:
+            yield from iter_player_pts(body)
+        finally:
+            METRICS.observe(
+                endpoint_for(query_url),
+                response.status_code,
+                time.perf_counter() - start,
+                body.bytes,
+            )
+
+
+def week_path(directory: Path, season: int, week: int, stats_type: str) -> Path:
+    """Location of a stored week (``<season>/<season>_<week>_<stats_type>.json``)."""
+    return Path(directory).joinpath(f'{season}/{season}_{week}_{stats_type}.json')
+
+
+class Source:
+    """
+    Base class for player data sources.
+
+    Subclasses set ``name`` and implement ``pts_url``,
+    ``iter_player_pts``, ``get_player_metadata`` and ``get_game_stats``.
+    """
+
+    name = ''
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+    def pts_url(self, season: int, week: int, projected: bool = False) -> str:
+        """Where a week of player points comes from (for logging)."""
+        raise NotImplementedError
+
+    def iter_player_pts(
+        self, season: int, week: int, projected: bool = False
+    ) -> Iterator[PlayerPts]:
+        """(player id, player points) pairs of a week, as they are read."""
+        raise NotImplementedError
+
+    def get_player_pts(self, season: int, week: int, projected: bool = False) -> Dict[str, Any]:
+        """A week of player points, keyed by player id."""
+        return dict(self.iter_player_pts(season, week, projected))
+
+    def get_player_metadata(self, player_id: str) -> PlayerMetadata:
+        """
+        A player's ngs-content metadata (``name``, ``position``,
+        ``nflTeamAbbr``, ``injuryGameStatus``) or an error message.
+        """
+        raise NotImplementedError
+
+    def get_game_stats(self, season: int, week: int) -> Dict[str, Any]:
+        """A week's ``gameStats`` payload (see ``polling.parse_game_stats``)."""
+        raise NotImplementedError
+
+
+class NFLSource(Source):
+    """api.fantasy.nfl.com (or anything serving the same API)."""
+
+    name = 'nfl'
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        if base_url is None:
+            base_url = os.environ.get(BASE_URL_ENV_VAR, BASE_URL)
+        self.base_url = base_url.rstrip('/')
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self.base_url}')"
+
+    def pts_url(self, season: int, week: int, projected: bool = False) -> str:
+        path = PROJECTED_PTS_PATH if projected else ACTUAL_PTS_PATH
+        params_encoded = urlencode({'season': season, 'week': week})
+        return f'{self.base_url}{path}{params_encoded}'
+
+    def iter_player_pts(
+        self, season: int, week: int, projected: bool = False
+    ) -> Iterator[PlayerPts]:
+        return stream_player_pts(self.pts_url(season, week, projected))
+
+    def get_player_metadata(self, player_id: str) -> PlayerMetadata:
+        url = f"{self.base_url}{PLAYER_NGS_CONTENT_PATH}{urlencode({'playerId': player_id})}"
+        response_json = get_json(url, verbose=False)
+        if 'errors' in response_json:
+            return response_json['errors'][0]['message']
+
+        # This is a unique identifier not truly a GAME identifier
+        game_id = list(response_json['games'].keys())[0]
+        return response_json['games'][game_id]['players'].get(player_id)
+
+    def get_game_stats(self, season: int, week: int) -> Dict[str, Any]:
+        params_encoded = urlencode({'season': season, 'week': week})
+        return get_json(f'{self.base_url}{GAME_STATS_PATH}{params_encoded}', verbose=False)
+
+
+class ReplaySource(NFLSource):
+    """A local ``replay.ReplayServer`` (by default ``turkey-bowl replay``)."""
+
+    name = 'replay'
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        super().__init__(REPLAY_BASE_URL if base_url is None else base_url)
+
+
+class FileSource(Source):
+    """
+    Weeks stored in a directory in the ``backfill.JSONWeekStore`` layout
+    (either the players or a full API payload per file), player metadata
+    from a ``player_ids.json`` and game stats from
+    ``<season>/<season>_<week>_gameStats.json``.
+    """
+
+    name = 'file'
+
+    def __init__(self, directory: Path, player_ids_path: Optional[Path] = None) -> None:
+        self.directory = Path(directory)
+        if player_ids_path is None:
+            player_ids_path = self.directory.joinpath('player_ids.json')
+        self.player_ids_path = Path(player_ids_path)
+        self._player_ids: Optional[Dict[str, Any]] = None
+
+    def __repr__(self):
+        return f"FileSource('{self.directory}')"
+
+    def pts_url(self, season: int, week: int, projected: bool = False) -> str:
+        stats_type = 'projectedStats' if projected else 'stats'
+        return week_path(self.directory, season, week, stats_type).resolve().as_uri()
+
+    def iter_player_pts(
+        self, season: int, week: int, projected: bool = False
+    ) -> Iterator[PlayerPts]:
+        stats_type = 'projectedStats' if projected else 'stats'
+        path = week_path(self.directory, season, week, stats_type)
+        if not path.exists():
+            raise ValueError(f'No {stats_type} stored for {season} week {week} at {path}')
+
+        logger.info(f'Loading player points from {path}')
+        player_pts = utils.load_from_json(path)
+
+        if 'systemConfig' in player_pts:
+            # A recorded API payload rather than just its players
+            game_id = player_pts['systemConfig'].get('currentGameId')
+            player_pts = player_pts['games'][game_id].get('players') or {}
+
+        yield from player_pts.items()
+
+    def get_player_metadata(self, player_id: str) -> PlayerMetadata:
+        if self._player_ids is None:
+            exists = self.player_ids_path.exists()
+            self._player_ids = utils.load_from_json(self.player_ids_path) if exists else {}
+
+        player_record = self._player_ids.get(player_id)
+        if not isinstance(player_record, dict):
+            return 'PLAYER_INVALID'
+
+        return {
+            'playerId': player_id,
+            'name': player_record.get('name'),
+            'position': player_record.get('position'),
+            'nflTeamAbbr': player_record.get('team'),
+            'injuryGameStatus': player_record.get('injury'),
+        }
+
+    def get_game_stats(self, season: int, week: int) -> Dict[str, Any]:
+        path = week_path(self.directory, season, week, 'gameStats')
+        if not path.exists():
+            raise ValueError(f'No gameStats stored for {season} week {week} at {path}')
+        return utils.load_from_json(path)
+
+
+SOURCES: Dict[str, Type[Source]] = {
+    source.name: source for source in (NFLSource, ReplaySource, FileSource)
+}
+
+
+def get_source(spec: Optional[str] = None, dir_config: Optional[SimpleNamespace] = None) -> Source:
+    """
+    Source for ``spec`` (``'<name>[:<argument>]'``), by default the
+    ``TURKEY_BOWL_SOURCE`` environment variable or else NFL.com.
+
+    ``file`` without a directory reads the backfill archive and player
+    ids of ``dir_config``.
+    """
+    if spec is None:
+        spec = os.environ.get(SOURCE_ENV_VAR) or NFLSource.name
+
+    name, _, argument = spec.partition(':')
+
+    if name not in SOURCES:
+        raise ValueError(f"Unrecognized source: '{spec}'. Expected one of {list(SOURCES)}.")
+
+    if name == FileSource.name:
+        if argument:
+            return FileSource(Path(argument))
+        if dir_config is None:
+            raise ValueError("The 'file' source needs a directory, e.g. 'file:archive/backfill'.")
+        return FileSource(dir_config.backfill_dir, dir_config.player_ids_json_path)
+
+    return SOURCES[name](argument or None)
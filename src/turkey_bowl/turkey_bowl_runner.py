@@ -8,7 +8,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from turkey_bowl import aggregate, utils
+from turkey_bowl import aggregate, leagues, utils
 from turkey_bowl.draft import Draft
 from turkey_bowl.leader_board import LeaderBoard
 from turkey_bowl.scrape import Scraper
@@ -34,36 +34,46 @@ def main():
     projected_player_pts_path = Path(
         f'{draft.dir_config.output_dir}/{year}_{week}_projected_player_pts.csv'
     )
-    if aggregate.projected_player_pts_pulled(year, week, savepath=projected_player_pts_path):
+    projected_pulled = aggregate.projected_player_pts_pulled(
+        year, week, savepath=projected_player_pts_path
+    )
+    if projected_pulled:
         projected_player_pts_df = pd.read_csv(projected_player_pts_path, index_col=0)
 
-    else:
-        projected_player_pts = scraper.get_projected_player_pts()
-        scraper.update_player_ids(projected_player_pts)
-        projected_player_pts_df = aggregate.create_player_pts_df(
-            year=year,
-            week=week,
-            player_pts=projected_player_pts,
-            savepath=projected_player_pts_path,
-        )
+    # Actual points are only needed once the draft is complete.
+    # Projected points are still pulled during the draft.
+    all_drafted = draft.check_players_have_been_drafted(participant_teams)
+
+    # Projected (and player ids) and actual points are pulled concurrently
+    # and each is aggregated as soon as it arrives
+    actual_player_pts_df = None
+    for stats_kind, player_pts in scraper.fetch_player_pts(
+        projected=not projected_pulled, actual=all_drafted
+    ):
+        if stats_kind == 'projected':
+            projected_player_pts_df = aggregate.create_player_pts_df(
+                year=year,
+                week=week,
+                player_pts=player_pts,
+                savepath=projected_player_pts_path,
+            )
+        elif player_pts:
+            actual_player_pts_df = aggregate.create_player_pts_df(
+                year=year, week=week, player_pts=player_pts, savepath=None, names=False
+            )
 
     # If all teams are blank, exit
-    # Check done after projected_player_pts so that projected points
-    #   are pulled during draft.
-    if not draft.check_players_have_been_drafted(participant_teams):
+    if not all_drafted:
         logger.info(f'Not all players have been drafted yet! Please complete the draft for {year}.')
         sys.exit()
 
-    actual_player_pts = scraper.get_actual_player_pts()
-
-    if actual_player_pts:
-        actual_player_pts_df = aggregate.create_player_pts_df(
-            year=year, week=week, player_pts=actual_player_pts, savepath=None
-        )
-    else:
-        actual_player_pts_df = projected_player_pts_df[['Player', 'Team']].copy()
+    if actual_player_pts_df is None:
+        actual_player_pts_df = projected_player_pts_df.filter(['Player_ID', 'Player', 'Team'])
         actual_player_pts_df['ACTUAL_pts'] = 0.0
 
+    # Match drafted rows to player ids so points are merged on Player_ID
+    participant_teams = leagues.reconcile_league(draft, participant_teams, projected_player_pts_df)
+
     # Merge points to teams
     participant_teams = aggregate.merge_points(
         participant_teams, projected_player_pts_df, verbose=False
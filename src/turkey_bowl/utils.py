@@ -4,39 +4,114 @@ Utility functions
 
 import json
 import logging
+import os
+import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    """
+    Yield a temporary path (same name, hidden sibling directory) to write to.
+
+    On success the temporary file (or directory) is renamed over ``path``
+    so readers never see a half-written output. On failure it is removed
+    and ``path`` is left untouched.
+    """
+    path = Path(path)
+    tmp_dir = path.with_name(f'.{path.name}.tmp-{os.getpid()}')
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = tmp_dir.joinpath(path.name)
+
+    try:
+        yield tmp_path
+
+        if tmp_path.is_dir() and path.is_dir():
+            # Directories can't be replaced in one step; swap them instead
+            old_path = tmp_dir.joinpath(f'{path.name}.old')
+            os.replace(path, old_path)
+
+        os.replace(tmp_path, path)
+
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
 def get_current_year() -> int:
     return datetime.now().year
 
 
-def load_dir_config(year: int, root: Optional[str] = None) -> SimpleNamespace:
+def _root(root: Optional[str] = None) -> Path:
     # 3 levels up (zero indexed)
-    root = Path(__file__).parents[2] if root is None else Path(root)
-
-    output_dir = root.joinpath(f'archive/{year}')
+    return Path(__file__).parents[2] if root is None else Path(root)
+
+
+def load_dir_config(
+    year: int, root: Optional[str] = None, league: Optional[str] = None
+) -> SimpleNamespace:
+    """
+    Paths of a year's draft and of the shared data (points, player ids,
+    warehouse, snapshots and breakers).
+
+    A ``league``'s draft and outputs live in ``archive/<year>/leagues/<league>``
+    rather than ``archive/<year>`` (the ``season_dir``, where scraped
+    points are kept for every league).
+    """
+    root = _root(root)
+
+    season_dir = root.joinpath(f'archive/{year}')
+    output_dir = season_dir if league is None else season_dir.joinpath(f'leagues/{league}')
+    backfill_dir = root.joinpath('archive/backfill')
+    warehouse_dir = root.joinpath('archive/warehouse')
+    snapshot_dir = root.joinpath('archive/snapshots')
+    breaker_dir = root.joinpath('archive/breakers')
     draft_order_path = output_dir.joinpath(f'{year}_draft_order.json')
     draft_sheet_path = output_dir.joinpath(f'{year}_draft_sheet.xlsx')
+    draft_sheet_csv_dir = output_dir.joinpath(f'{year}_draft_sheets')
+    draft_sheet_json_path = output_dir.joinpath(f'{year}_draft_sheet.json')
+    draft_reconciled_path = output_dir.joinpath(f'{year}_draft_reconciled.json')
+    draft_picks_path = output_dir.joinpath(f'{year}_draft_picks.jsonl')
     player_ids_json_path = root.joinpath('assets/player_ids.json')
+    player_ids_log_path = root.joinpath('assets/player_ids.jsonl')
+    player_ids_journal_path = root.joinpath('assets/player_ids_refresh.jsonl')
     stat_ids_json_path = root.joinpath('assets/stat_ids.json')
 
     dir_config = SimpleNamespace(
+        season_dir=season_dir.resolve(),
         output_dir=output_dir.resolve(),
+        backfill_dir=backfill_dir.resolve(),
+        warehouse_dir=warehouse_dir.resolve(),
+        snapshot_dir=snapshot_dir.resolve(),
+        breaker_dir=breaker_dir.resolve(),
         draft_order_path=draft_order_path.resolve(),
         draft_sheet_path=draft_sheet_path.resolve(),
+        draft_sheet_csv_dir=draft_sheet_csv_dir.resolve(),
+        draft_sheet_json_path=draft_sheet_json_path.resolve(),
+        draft_reconciled_path=draft_reconciled_path.resolve(),
+        draft_picks_path=draft_picks_path.resolve(),
         player_ids_json_path=player_ids_json_path.resolve(),
+        player_ids_log_path=player_ids_log_path.resolve(),
+        player_ids_journal_path=player_ids_journal_path.resolve(),
         stat_ids_json_path=stat_ids_json_path.resolve(),
     )
 
     return dir_config
 
 
+def list_leagues(year: int, root: Optional[str] = None) -> List[str]:
+    """Names of the leagues set up for ``year`` (see ``load_dir_config``)."""
+    leagues_dir = _root(root).joinpath(f'archive/{year}/leagues')
+    if not leagues_dir.exists():
+        return []
+    return sorted(path.name for path in leagues_dir.iterdir() if path.is_dir())
+
+
 def load_from_json(filename: Path) -> Dict[str, Any]:
     with open(filename, 'r') as json_file:
         json_dict = json.load(json_file)
@@ -0,0 +1,292 @@
+"""
+Local warehouse of historical player-week stats
+
+Player week stats are stored as parquet, partitioned by season and week::
+
+    <warehouse_dir>/season=2023/week=12/actual.parquet
+    <warehouse_dir>/season=2023/week=12/projected.parquet
+
+Each file has one row per player with ``player_id``, ``Player``,
+``Team``, ``Position``, ``pts`` and one column per stat (named from
+``stat_ids.json``, without the ``PROJ_``/``ACTUAL_`` prefix). Queries
+only open the partitions (and read only the columns) they need.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from turkey_bowl import aggregate, utils
+from turkey_bowl.season_calendar import season_calendars
+
+logger = logging.getLogger(__name__)
+
+STATS_TYPES = {'stats': 'actual', 'projectedStats': 'projected'}
+ID_COLS = ['player_id', 'Player', 'Team', 'Position']
+
+
+def load_stat_defns(stat_ids_json_path: Path) -> Dict[str, str]:
+    """Map stat ids to column names (e.g. '5' -> 'Passing_Yards')."""
+    stat_ids_dict = utils.load_from_json(stat_ids_json_path)
+    return {k: v['name'].replace(' ', '_') for k, v in stat_ids_dict.items()}
+
+
+def frame_from_player_pts(
+    season: int,
+    week: int,
+    player_pts: Dict[str, Any],
+    player_ids: Dict[str, Any],
+    stat_defns: Dict[str, str],
+) -> pd.DataFrame:
+    """
+    Build a warehouse frame from a raw weekstats/weekprojectedstats
+    payload (as returned by ``Scraper.get_week_player_pts``).
+
+    Players missing from ``player_ids`` keep their id but no name, team
+    or position.
+    """
+    points = {
+        pid: aggregate._unpack_player_pts(season, week, player_pts_dict) or {}
+        for pid, player_pts_dict in player_pts.items()
+    }
+    stats_df = pd.DataFrame.from_dict(points, orient='index', dtype='float64')
+    stats_df = stats_df.rename(columns=stat_defns)
+
+    pids = list(points)
+    player_df = pd.DataFrame(
+        {
+            'player_id': pd.array([int(pid) for pid in pids], dtype='int64'),
+            'Player': [player_ids.get(pid, {}).get('name') for pid in pids],
+            'Team': [player_ids.get(pid, {}).get('team') for pid in pids],
+            'Position': [player_ids.get(pid, {}).get('position') for pid in pids],
+        },
+        index=pids,
+    )
+
+    frame = pd.concat([player_df, stats_df], axis=1).reset_index(drop=True)
+    return _order_columns(frame)
+
+
+def frame_from_player_pts_df(
+    player_pts_df: pd.DataFrame, player_ids: Optional[Sequence[int]] = None
+) -> pd.DataFrame:
+    """
+    Build a warehouse frame from a ``create_player_pts_df`` output and the
+    player ids of its rows (its ``Player_ID`` column if not given).
+    """
+    frame = player_pts_df.rename(columns={'PROJ_Position': 'Position'})
+    frame = frame.rename(columns=lambda c: c.replace('PROJ_', '').replace('ACTUAL_', ''))
+    if 'Player_ID' in frame:
+        row_ids = frame.pop('Player_ID')
+        player_ids = row_ids if player_ids is None else player_ids
+    frame.insert(0, 'player_id', pd.array(player_ids, dtype='int64'))
+
+    return _order_columns(frame.reset_index(drop=True))
+
+
+def _order_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    if 'pts' not in frame:
+        frame['pts'] = 0.0
+    stat_cols = [c for c in frame.columns if c not in ID_COLS and c != 'pts']
+    return frame[[*ID_COLS, 'pts', *stat_cols]]
+
+
+class StatsWarehouse:
+    def __init__(self, warehouse_dir: Path) -> None:
+        self.warehouse_dir = Path(warehouse_dir)
+
+    def __repr__(self):
+        return f"StatsWarehouse('{self.warehouse_dir}')"
+
+    @staticmethod
+    def _kind(stats_type: str) -> str:
+        """Accept either the API stats type ('stats') or its kind ('actual')."""
+        kind = STATS_TYPES.get(stats_type, stats_type)
+        if kind not in STATS_TYPES.values():
+            raise ValueError(
+                f"Unrecognized stats type: '{stats_type}'. "
+                + f'Expected one of {[*STATS_TYPES, *STATS_TYPES.values()]}.'
+            )
+        return kind
+
+    def path(self, season: int, week: int, stats_type: str) -> Path:
+        kind = self._kind(stats_type)
+        return self.warehouse_dir.joinpath(f'season={season}/week={week}/{kind}.parquet')
+
+    def partitions(
+        self,
+        stats_type: str = 'actual',
+        seasons: Optional[Iterable[int]] = None,
+        weeks: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[int, int, Path]]:
+        """(season, week, path) of the stored partitions, optionally filtered."""
+        kind = self._kind(stats_type)
+        seasons = None if seasons is None else set(seasons)
+        weeks = None if weeks is None else set(weeks)
+        found = []
+
+        for path in self.warehouse_dir.glob(f'season=*/week=*/{kind}.parquet'):
+            season = int(path.parent.parent.name.split('=')[1])
+            week = int(path.parent.name.split('=')[1])
+
+            if (seasons is None or season in seasons) and (weeks is None or week in weeks):
+                found.append((season, week, path))
+
+        return sorted(found)
+
+    def write_week(self, season: int, week: int, stats_type: str, frame: pd.DataFrame) -> Path:
+        """Store (replacing) one season/week partition."""
+        path = self.path(season, week, stats_type)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with utils.atomic_path(path) as tmp_path:
+            frame.to_parquet(tmp_path, index=False)
+
+        logger.debug(f'Wrote {len(frame)} players to {path}')
+        return path
+
+    def write_player_pts_df(
+        self,
+        season: int,
+        week: int,
+        stats_type: str,
+        player_pts_df: pd.DataFrame,
+        player_ids: Optional[Sequence[int]] = None,
+    ) -> Path:
+        """Store a ``create_player_pts_df`` output (see ``frame_from_player_pts_df``)."""
+        frame = frame_from_player_pts_df(player_pts_df, player_ids)
+        return self.write_week(season, week, stats_type, frame)
+
+    def sink(self, player_ids: Dict[str, Any], stat_defns: Dict[str, str]):
+        """
+        A ``backfill.backfill`` sink writing each fetched week straight
+        into the warehouse.
+        """
+
+        def _sink(season: int, week: int, stats_type: str, player_pts: Dict[str, Any]) -> None:
+            frame = frame_from_player_pts(season, week, player_pts, player_ids, stat_defns)
+            self.write_week(season, week, stats_type, frame)
+
+        return _sink
+
+    def query(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        stats_type: str = 'actual',
+        seasons: Optional[Iterable[int]] = None,
+        weeks: Optional[Iterable[int]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read player-week rows with ``season`` and ``week`` columns added.
+
+        Only partitions matching ``seasons``/``weeks`` are opened and only
+        ``columns`` are read; ``filters`` (pyarrow row filters, e.g.
+        ``[('Position', '==', 'QB')]``) are pushed down into the read.
+        Stats missing from a partition come back as NaN.
+        """
+        frames = []
+
+        for season, week, path in self.partitions(stats_type, seasons, weeks):
+            read_columns = None
+            if columns is not None:
+                # Schema comes from the file footer only
+                available = set(pq.read_schema(path).names)
+                read_columns = [c for c in columns if c in available]
+
+            frame = pd.read_parquet(path, columns=read_columns, filters=filters)
+            frame.insert(0, 'week', week)
+            frame.insert(0, 'season', season)
+            frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=['season', 'week', *(columns or [])])
+
+        result = pd.concat(frames, ignore_index=True)
+        if columns is not None:
+            result = result.reindex(columns=['season', 'week', *columns])
+
+        return result
+
+    def top_n(
+        self,
+        season: int,
+        week: int,
+        n: int = 10,
+        position: Optional[str] = None,
+        stats_type: str = 'actual',
+        by: str = 'pts',
+    ) -> pd.DataFrame:
+        """Top ``n`` players of a week (optionally for one position) by ``by``."""
+        filters = None if position is None else [('Position', '==', position)]
+        frame = self.query(
+            columns=[*ID_COLS, by],
+            stats_type=stats_type,
+            seasons=[season],
+            weeks=[week],
+            filters=filters,
+        )
+
+        return frame.nlargest(n, by).reset_index(drop=True)
+
+    def _thanksgiving_weeks(self, stats_type: str) -> Dict[int, int]:
+        """Thanksgiving week of each stored season."""
+        seasons = sorted({season for season, _, _ in self.partitions(stats_type)})
+        return {
+            season: calendar.thanksgiving_week
+            for season, calendar in season_calendars(seasons).items()
+        }
+
+    def thanksgiving_pts(self, stats_type: str = 'actual') -> pd.Series:
+        """Mean Thanksgiving week ``pts`` of each player (by ``player_id``) over the seasons."""
+        thanksgiving_weeks = self._thanksgiving_weeks(stats_type)
+        frame = self.query(
+            columns=['player_id', 'pts'],
+            stats_type=stats_type,
+            seasons=thanksgiving_weeks,
+            weeks=set(thanksgiving_weeks.values()),
+        )
+        frame = frame[frame['week'] == frame['season'].map(thanksgiving_weeks)]
+
+        return frame.groupby('player_id')['pts'].mean()
+
+    def player_history(
+        self,
+        player: Union[int, str],
+        thanksgiving_only: bool = True,
+        stats_type: str = 'actual',
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Weekly rows for one player (by id or exact name).
+
+        By default only each season's Thanksgiving week partition is read.
+        """
+        weeks = None
+        seasons = None
+        if thanksgiving_only:
+            thanksgiving_weeks = self._thanksgiving_weeks(stats_type)
+            seasons = sorted(thanksgiving_weeks)
+            weeks = set(thanksgiving_weeks.values())
+
+        if isinstance(player, str):
+            filters = [('Player', '==', player)]
+        else:
+            filters = [('player_id', '==', int(player))]
+
+        frame = self.query(
+            columns=None if columns is None else [*ID_COLS, 'pts', *columns],
+            stats_type=stats_type,
+            seasons=seasons,
+            weeks=weeks,
+            filters=filters,
+        )
+
+        if thanksgiving_only and not frame.empty:
+            is_thanksgiving = frame['week'] == frame['season'].map(thanksgiving_weeks)
+            frame = frame[is_thanksgiving]
+
+        return frame.reset_index(drop=True)
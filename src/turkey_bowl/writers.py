@@ -0,0 +1,244 @@
+"""
+Output writers
+
+Every output (robust participant scores, leader board) is a collection of
+named "sheets" (DataFrames). A writer decides how those sheets land on
+disk. Excel is the historical default, but it is by far the slowest
+option; JSON, CSV, Parquet and static HTML are available for quick
+polling runs.
+
+Writes are skipped when the content digest of the sheets matches the
+digest stored beside the previous output (``<output>.sha256``), and
+otherwise go to a temporary file that is atomically renamed into place.
+"""
+
+import hashlib
+import html
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Sequence, Type
+
+import pandas as pd
+
+from turkey_bowl import utils
+
+logger = logging.getLogger(__name__)
+
+# Columns that are left aligned (i.e. not centered) in Excel output
+TEXT_COLS = ('Position', 'Player', 'Team')
+
+
+class OutputWriter:
+    """
+    Base class for writing a collection of named DataFrames ("sheets").
+
+    Subclasses set ``suffix`` and implement ``_write``.
+    """
+
+    name = ''
+    suffix = ''
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+    def path_for(self, savepath: Path) -> Path:
+        """Location this writer actually writes to for ``savepath``."""
+        return Path(savepath).with_suffix(self.suffix)
+
+    @staticmethod
+    def digest_path(path: Path) -> Path:
+        """Location of the content digest stored beside ``path``."""
+        return path.with_name(f'{path.name}.sha256')
+
+    def digest(self, sheets: Dict[str, pd.DataFrame], index_sheets: Sequence[str] = ()) -> str:
+        """
+        Content digest of ``sheets`` as this writer would write them.
+
+        Covers the format, sheet names, column names, dtypes, index and
+        values, so any change that would alter the output changes the
+        digest.
+        """
+        sha = hashlib.sha256(self.name.encode())
+
+        for sheet_name, df in sheets.items():
+            index = sheet_name in index_sheets
+            header = [sheet_name, index, [str(c) for c in df.columns], list(df.dtypes.astype(str))]
+            sha.update(json.dumps(header).encode())
+            sha.update(pd.util.hash_pandas_object(df, index=index).to_numpy().tobytes())
+
+        return sha.hexdigest()
+
+    def write(
+        self,
+        sheets: Dict[str, pd.DataFrame],
+        savepath: Path,
+        index_sheets: Sequence[str] = (),
+    ) -> Path:
+        """
+        Write ``sheets`` to ``savepath`` (suffix swapped for this format).
+
+        Sheets named in ``index_sheets`` are written with their index.
+        Nothing is written if the content is unchanged since the last
+        write. Returns the path written to.
+        """
+        path = self.path_for(savepath)
+        digest_path = self.digest_path(path)
+        digest = self.digest(sheets, index_sheets)
+
+        if path.exists() and digest_path.exists() and digest_path.read_text().strip() == digest:
+            logger.info(f'Content unchanged, skipping write to {path}')
+            return path
+
+        with utils.atomic_path(path) as tmp_path:
+            self._write(sheets, tmp_path, index_sheets)
+
+        with utils.atomic_path(digest_path) as tmp_digest_path:
+            tmp_digest_path.write_text(f'{digest}\n')
+
+        return path
+
+    def _write(
+        self, sheets: Dict[str, pd.DataFrame], path: Path, index_sheets: Sequence[str]
+    ) -> None:
+        raise NotImplementedError
+
+
+class ExcelOutputWriter(OutputWriter):
+    """One workbook, one worksheet per sheet, with auto-sized columns."""
+
+    name = 'xlsx'
+    suffix = '.xlsx'
+
+    def _write(
+        self, sheets: Dict[str, pd.DataFrame], path: Path, index_sheets: Sequence[str]
+    ) -> None:
+        with pd.ExcelWriter(path, engine='xlsxwriter') as writer:
+            # Center columns
+            workbook = writer.book
+            center = workbook.add_format()
+            center.set_align('center')
+            center.set_align('vcenter')
+
+            for sheet_name, df in sheets.items():
+                index = sheet_name in index_sheets
+                df.to_excel(writer, sheet_name=sheet_name, index=index)
+
+                # Auto-format column lengths and center columns
+                worksheet = writer.sheets[sheet_name]
+
+                # Start enumerate at 1 if index written
+                for i, col in enumerate(df, int(index)):
+                    series = df[col]
+                    max_len = max(series.astype(str).map(len).max(), len(str(series.name)))
+
+                    # Add a little extra spacing
+                    if index:
+                        worksheet.set_column(i, i, max_len + 1, center)
+                    elif col in TEXT_COLS:
+                        worksheet.set_column(i, i, max_len + 2)
+                    else:
+                        worksheet.set_column(i, i, max_len + 2, center)
+
+
+class JSONOutputWriter(OutputWriter):
+    """
+    One JSON document keyed by sheet name.
+
+    Indexed sheets are written as ``{index: {col: value}}``, all others as
+    a list of row records.
+    """
+
+    name = 'json'
+    suffix = '.json'
+
+    def _write(
+        self, sheets: Dict[str, pd.DataFrame], path: Path, index_sheets: Sequence[str]
+    ) -> None:
+        orients = {s: 'index' if s in index_sheets else 'records' for s in sheets}
+        body = ','.join(
+            f'{json.dumps(s)}:{df.to_json(orient=orients[s])}' for s, df in sheets.items()
+        )
+
+        with open(path, 'w') as json_file:
+            json_file.write(f'{{{body}}}\n')
+
+
+class CSVOutputWriter(OutputWriter):
+    """A directory holding one ``<sheet>.csv`` file per sheet."""
+
+    name = 'csv'
+    suffix = ''
+
+    def _write(
+        self, sheets: Dict[str, pd.DataFrame], path: Path, index_sheets: Sequence[str]
+    ) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+        for sheet_name, df in sheets.items():
+            df.to_csv(path.joinpath(f'{sheet_name}.csv'), index=sheet_name in index_sheets)
+
+
+class ParquetOutputWriter(OutputWriter):
+    """
+    A directory holding one ``<sheet>.parquet`` file per sheet.
+
+    Requires ``pyarrow`` (or ``fastparquet``) to be installed.
+    """
+
+    name = 'parquet'
+    suffix = ''
+
+    def _write(
+        self, sheets: Dict[str, pd.DataFrame], path: Path, index_sheets: Sequence[str]
+    ) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+        for sheet_name, df in sheets.items():
+            df.to_parquet(path.joinpath(f'{sheet_name}.parquet'), index=sheet_name in index_sheets)
+
+
+class HTMLOutputWriter(OutputWriter):
+    """A single static HTML page with one table per sheet."""
+
+    name = 'html'
+    suffix = '.html'
+
+    def _write(
+        self, sheets: Dict[str, pd.DataFrame], path: Path, index_sheets: Sequence[str]
+    ) -> None:
+        title = html.escape(path.stem)
+        tables = '\n'.join(
+            f'<h2>{html.escape(sheet_name)}</h2>\n'
+            + df.to_html(index=sheet_name in index_sheets, na_rep='', border=0)
+            for sheet_name, df in sheets.items()
+        )
+
+        with open(path, 'w') as html_file:
+            html_file.write(
+                '<!DOCTYPE html>\n'
+                f'<html>\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n</head>\n'
+                f'<body>\n<h1>{title}</h1>\n{tables}\n</body>\n</html>\n'
+            )
+
+
+WRITERS: Dict[str, Type[OutputWriter]] = {
+    w.name: w
+    for w in (
+        ExcelOutputWriter,
+        JSONOutputWriter,
+        CSVOutputWriter,
+        ParquetOutputWriter,
+        HTMLOutputWriter,
+    )
+}
+
+
+def get_writer(output_format: str) -> OutputWriter:
+    """Return the writer registered for ``output_format`` (e.g. 'xlsx', 'json')."""
+    try:
+        return WRITERS[output_format.lower()]()
+    except KeyError:
+        raise ValueError(
+            f"Unrecognized output format: '{output_format}'. Expected one of {list(WRITERS)}."
+        ) from None
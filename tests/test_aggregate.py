@@ -4,7 +4,6 @@ Unit tests for aggregate.py
 
 import json
 import logging
-from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -12,6 +11,7 @@ import pytest
 import responses
 
 from turkey_bowl import aggregate, utils
+from turkey_bowl.player_store import PlayerStore
 
 
 @pytest.fixture
@@ -94,101 +94,35 @@ def mock_actual_player_pts():
     return player_pts
 
 
-def test__get_player_pts_stats_type_raises_error_for_multi_types(
-    mock_proj_player_pts, mock_actual_player_pts
-):
-    # Setup
-    proj_player_pts = mock_proj_player_pts
-    actual_player_pts = mock_actual_player_pts
+@pytest.mark.parametrize(
+    'unique_type, expected_error',
+    [
+        ({'projectedStats', 'stats'}, 'More than one unique stats type detected'),
+        ({'bad_stats'}, "Unrecognized stats type: 'bad_stats'. Expected either"),
+    ],
+    ids=['multi_types', 'unrecognized_type'],
+)
+def test__check_stats_types_raises_error(unique_type, expected_error):
+    # Setup - none necessary
 
-    # Intentionally mix proj and actual to raise an error
-    player_pts = {
-        '2504211': proj_player_pts['2504211'],
-        '310': actual_player_pts['310'],
-    }
-
-    expected_error1 = "More than one unique stats type detected: {'stats', 'projectedStats'}"
-    expected_error2 = "More than one unique stats type detected: {'projectedStats', 'stats'}"
     # Exercise
-    with pytest.raises(ValueError) as error_info:
-        aggregate._get_player_pts_stat_type(player_pts)
-
-    # Verify
-    assert str(error_info.value) in (expected_error1, expected_error2)
-
-    # Verify
-
-    # Cleanup - none necessary
-
-
-def test__get_player_pts_stats_type_raises_error_for_unrecognized_type():
-    # Setup
-    player_pts = {
-        '2504211': {
-            'bad_stats': {
-                'week': {
-                    '2020': {
-                        '12': {
-                            '1': '1',
-                            '14': '0.05',
-                            '20': '1.1',
-                            '21': '13.11',
-                            '22': '0.09',
-                            'pts': '2.96',
-                        }
-                    }
-                }
-            }
-        },
-        '310': {
-            'bad_stats': {
-                'week': {
-                    '2020': {
-                        '12': {
-                            '1': '1',
-                            '14': '5.5',
-                            '20': '3.3',
-                            '21': '17.11',
-                            '22': '0.07',
-                            'pts': '9.96',
-                        }
-                    }
-                }
-            }
-        },
-    }
-
-    expected_error = (
-        "Unrecognized stats type: 'bad_stats'. Expected either 'projectedStats' or 'stats'."
-    )
-    # Exercise
-    with pytest.raises(ValueError) as error_info:
-        aggregate._get_player_pts_stat_type(player_pts)
-
-    # Verify
-    assert str(error_info.value) == expected_error
-
-    # Verify
+    with pytest.raises(ValueError, match=expected_error):
+        aggregate._check_stats_types(unique_type)
 
+    # Verify - none necessary
     # Cleanup - none necessary
 
 
 @pytest.mark.parametrize('stat_type', ['projectedStats', 'stats'], ids=['projected', 'actual'])
-def test__get_player_pts_stats_type(stat_type, mock_proj_player_pts, mock_actual_player_pts):
-    # Setup
-    if stat_type == 'projectedStats':
-        player_pts = mock_proj_player_pts
-    else:
-        player_pts = mock_actual_player_pts
+def test__check_stats_types(stat_type):
+    # Setup - none necessary
 
     # Exercise
-    result = aggregate._get_player_pts_stat_type(player_pts)
+    result = aggregate._check_stats_types({stat_type})
 
     # Verify
     assert result == stat_type
 
-    # Verify
-
     # Cleanup - none necessary
 
 
@@ -256,6 +190,69 @@ def test_create_player_pts_df_raises_error_when_projected_and_no_savepath():
     # Cleanup - none necessary
 
 
+def test_create_player_pts_df_accepts_streamed_pairs():
+    # Setup
+    year = 2023
+    week = 12
+    player_pts = {
+        '2555334': {'stats': {'week': {'2023': {'12': {'5': '296.77', 'pts': '20.01'}}}}},
+        '2568216': {'stats': {'week': {'2023': {'12': {'5': '16.93', 'pts': '0.84'}}}}},
+    }
+    expected = aggregate.create_player_pts_df(year, week, player_pts)
+
+    def stream():
+        yield from player_pts.items()
+
+    # Exercise
+    result = aggregate.create_player_pts_df(year, week, stream())
+
+    # Verify
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Cleanup - none necessary
+
+
+def test_create_player_pts_df_without_names():
+    # Setup
+    year = 2023
+    week = 12
+    player_pts = {
+        '2555334': {'stats': {'week': {'2023': {'12': {'5': '296.77', 'pts': '20.01'}}}}},
+        '2568216': {'stats': {'week': {'2023': {'12': {'5': '16.93', 'pts': '0.84'}}}}},
+    }
+    expected = aggregate.create_player_pts_df(year, week, player_pts)
+
+    # Exercise
+    result = aggregate.create_player_pts_df(year, week, player_pts, names=False)
+
+    # Verify - the same points keyed by Player_ID alone
+    assert result.columns.tolist()[:2] == ['Player_ID', 'ACTUAL_pts']
+    pd.testing.assert_frame_equal(
+        result, expected.drop(columns=['Player', 'Team', 'PROJ_Position'])
+    )
+
+    # Cleanup - none necessary
+
+
+def test_create_player_pts_df_streamed_raises_error_on_first_player():
+    # Setup
+    consumed = []
+
+    def stream():
+        for pid in ('252', '310', '382'):
+            consumed.append(pid)
+            yield pid, {'projectedStats': {}}
+
+    # Exercise
+    with pytest.raises(ValueError, match='``savepath`` must be specified'):
+        aggregate.create_player_pts_df(2020, 12, stream())
+
+    # Verify
+    assert consumed == ['252']
+
+    # Cleanup - none necessary
+
+
 def test_projected_player_pts_pulled_true(tmp_path, caplog):
     # Setup
     caplog.set_level(logging.INFO)
@@ -424,6 +421,7 @@ def test_create_player_pts_df_projected_doesnt_exists(tmp_path, caplog):
     }
 
     player_pts_df_data = {
+        'Player_ID': {0: 2555260, 1: 2555334, 2: 2568216},
         'Player': {0: 'Dak Prescott', 1: 'Jared Goff', 2: 'Brock Purdy'},
         'Team': {0: 'DAL', 1: 'DET', 2: 'SF'},
         'PROJ_Position': {0: 'QB', 1: 'QB', 2: 'QB'},
@@ -441,6 +439,7 @@ def test_create_player_pts_df_projected_doesnt_exists(tmp_path, caplog):
     expected = pd.DataFrame(player_pts_df_data)
     expected = expected.fillna(0.0)
     expected_dtypes = {
+        'Player_ID': np.dtype('int64'),
         'Player': np.dtype('O'),
         'Team': np.dtype('O'),
         'PROJ_Position': np.dtype('O'),
@@ -643,6 +642,7 @@ def test_create_player_pts_df_actual(tmp_path):
     }
 
     player_pts_df_data = {
+        'Player_ID': {0: 2555260, 1: 2555334, 2: 2568216},
         'Player': {0: 'Dak Prescott', 1: 'Jared Goff', 2: 'Brock Purdy'},
         'Team': {0: 'DAL', 1: 'DET', 2: 'SF'},
         'PROJ_Position': {0: 'QB', 1: 'QB', 2: 'QB'},
@@ -660,6 +660,7 @@ def test_create_player_pts_df_actual(tmp_path):
     expected = pd.DataFrame(player_pts_df_data)
     expected = expected.fillna(0.0)
     expected_dtypes = {
+        'Player_ID': np.dtype('int64'),
         'Player': np.dtype('O'),
         'Team': np.dtype('O'),
         'PROJ_Position': np.dtype('O'),
@@ -785,6 +786,46 @@ def test_create_player_pts_df_actual(tmp_path):
     # Cleanup - none necessary
 
 
+@responses.activate
+def test_create_player_pts_df_undocumented_players_under_root(tmp_path):
+    # Setup
+    year = 2020
+    week = 12
+    undocumented_player_id = '123456789'
+    assets_dir = tmp_path.joinpath('assets')
+    assets_dir.mkdir()
+    stat_ids_json_path = utils.load_dir_config(year).stat_ids_json_path
+    assets_dir.joinpath('stat_ids.json').write_text(stat_ids_json_path.read_text())
+    utils.write_to_json(
+        {'year': year, '310': {'name': 'Matt Ryan', 'position': 'QB', 'team': 'ATL'}},
+        assets_dir.joinpath('player_ids.json'),
+    )
+
+    player_pts = {
+        pid: {'stats': {'week': {str(year): {str(week): {'pts': '4.2'}}}}}
+        for pid in ('310', undocumented_player_id)
+    }
+    url = f'https://api.fantasy.nfl.com/v2/player/ngs-content?playerId={undocumented_player_id}'
+    player = {'name': 'Logan Thomas', 'position': 'TE', 'nflTeamAbbr': 'WAS'}
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json={'games': {'102022': {'players': {undocumented_player_id: player}}}},
+    )
+
+    # Exercise
+    result = aggregate.create_player_pts_df(year, week, player_pts, root=tmp_path)
+
+    # Verify - resolved into the assets of root, not of the package
+    assert result['Player'].tolist() == ['Matt Ryan', 'Logan Thomas']
+    tmp_player_ids = utils.load_from_json(assets_dir.joinpath('player_ids.json'))
+    assert tmp_player_ids[undocumented_player_id]['name'] == 'Logan Thomas'
+    package_player_ids = utils.load_from_json(utils.load_dir_config(year).player_ids_json_path)
+    assert undocumented_player_id not in package_player_ids
+
+    # Cleanup - none necessary
+
+
 @pytest.fixture
 def standard_scoring_factors():
     scoring_factors = {
@@ -910,9 +951,8 @@ def test_create_player_pts_df_undocumented_players(tmp_path, caplog, mocker):
     # that doesn't exist in the current player_ids.json nor projected_player_pts.csv
     undocumented_player_id = '123456789'  # fake pid for Logan Thomas
 
-    player_ids_json_path = Path('assets/player_ids.json')
-    current_player_ids = utils.load_from_json(player_ids_json_path)
-    assert undocumented_player_id not in current_player_ids
+    player_store = PlayerStore.from_dir_config(utils.load_dir_config(year))
+    assert undocumented_player_id not in player_store
 
     player_pts = {
         # "2555260": {
@@ -1028,14 +1068,23 @@ def test_create_player_pts_df_undocumented_players(tmp_path, caplog, mocker):
     _ = aggregate.create_player_pts_df(year, week, player_pts, tmp_projected_player_pts_path)
 
     # Verify
-    updated_player_ids = utils.load_from_json(player_ids_json_path)
-    assert undocumented_player_id in updated_player_ids
-    del updated_player_ids[undocumented_player_id]
-    utils.write_to_json(updated_player_ids, player_ids_json_path)
+    updated_player_store = PlayerStore.from_dir_config(utils.load_dir_config(year))
+    assert updated_player_store.get(undocumented_player_id) == {
+        'name': 'Logan Thomas',
+        'position': 'TE',
+        'team': 'WAS',
+        'injury': None,
+    }
+
+    updated_player_ids = utils.load_from_json(updated_player_store.json_path)
+    assert updated_player_ids[undocumented_player_id]['name'] == 'Logan Thomas'
 
     assert f'Undocumented player {undocumented_player_id}: Logan Thomas' in caplog.text
+    assert len(responses.calls) == 1  # metadata fetched once per undocumented player
 
-    # Cleanup - none necessary
+    # Cleanup
+    updated_player_store.delete(undocumented_player_id)
+    updated_player_store.export_json()
 
 
 @pytest.fixture
@@ -1346,6 +1395,84 @@ def test_merge_points_prints_warning_if_player_not_found(mock_participant_teams,
     assert "WARNING: Dodd has players with NaN values: ['Josh Alle']" in caplog.text
     assert "WARNING: Becca has players with NaN values: ['Dak Prescot']" in caplog.text
     assert "WARNING: Logan has players with NaN values: ['Matt Rya']" in caplog.text
+    assert "WARNING: No Player_ID to merge points on for ['Dodd', 'Becca', 'Logan']" in caplog.text
+
+    # Cleanup - none necessary
+
+
+def test_merge_points_on_player_id():
+    # Setup - two players named Josh Johnson on the same team
+    participant_teams = {
+        'Logan': pd.DataFrame(
+            {
+                'Position': ['QB', 'Defense (Team Name)', 'Bench (RB/WR/TE)'],
+                'Player': ['Josh Johnson', 'Chicago Bears', 'Nobody'],
+                'Team': ['BAL', 'CHI', 'KC'],
+                'Player_ID': pd.array([264, 100005, None], dtype='Int64'),
+            }
+        )
+    }
+    pts_df = pd.DataFrame(
+        {
+            'Player_ID': [2505100, 264, 100005],
+            'Player': ['Josh Johnson', 'Josh Johnson', 'Bears'],
+            'Team': ['BAL', 'BAL', 'CHI'],
+            'PROJ_Position': ['DB', 'QB', 'DEF'],
+            'PROJ_pts': [3.5, 12.25, 7.0],
+        }
+    )
+
+    # Exercise
+    result = aggregate.merge_points(participant_teams, pts_df, verbose=False)['Logan']
+
+    # Verify
+    assert list(result.columns) == [
+        'Position',
+        'Player',
+        'Team',
+        'Player_ID',
+        'PROJ_Position',
+        'PROJ_pts',
+    ]
+    assert result['Player'].tolist() == ['Josh Johnson', 'Chicago Bears', 'Nobody']
+    assert result['PROJ_Position'].tolist()[:2] == ['QB', 'DEF']
+    assert result['PROJ_pts'].tolist()[:2] == [12.25, 7.0]
+    assert result['PROJ_pts'].isna().tolist() == [False, False, True]
+
+    # Cleanup - none necessary
+
+
+def test_merge_points_on_player_id_then_actual():
+    # Setup
+    participant_teams = {
+        'Logan': pd.DataFrame(
+            {
+                'Position': ['QB', 'Bench (RB/WR/TE)'],
+                'Player': ['Josh Johnson', 'Travis Kelce'],
+                'Team': ['BAL', 'KC'],
+                'Player_ID': pd.array([264, 2540258], dtype='Int64'),
+            }
+        )
+    }
+    projected = pd.DataFrame(
+        {
+            'Player_ID': [264, 2540258],
+            'Player': ['Josh Johnson', 'Travis Kelce'],
+            'Team': ['BAL', 'KC'],
+            'PROJ_Position': ['QB', 'TE'],
+            'PROJ_pts': [12.25, 9.5],
+        }
+    )
+    actual = projected.drop(columns='PROJ_pts').assign(ACTUAL_pts=[20.0, 0.0])
+
+    # Exercise
+    participant_teams = aggregate.merge_points(participant_teams, projected, verbose=False)
+    result = aggregate.merge_points(participant_teams, actual, verbose=True)['Logan']
+
+    # Verify
+    assert len(result) == 2
+    assert result['ACTUAL_pts'].tolist() == [20.0, 0.0]
+    assert result['PROJ_Position'].tolist() == ['QB', 'TE']
 
     # Cleanup - none necessary
 
@@ -0,0 +1,158 @@
+"""
+Unit tests for backfill.py
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+import responses
+
+from turkey_bowl import backfill
+from turkey_bowl.scrape import ACTUAL_PTS_URL, PROJECTED_PTS_URL
+
+
+def _mock_week_payload(season, week, stats_type):
+    """Helper function for a minimal weekstats/weekprojectedstats payload."""
+    player_pts = {str(week): {stats_type: {'week': {str(season): {str(week): {'pts': '1.0'}}}}}}
+    return {
+        'systemConfig': {'currentGameId': '102020'},
+        'games': {'102020': {'players': player_pts}},
+    }
+
+
+@pytest.mark.parametrize(
+    'spec, expected',
+    [
+        ('2020', [2020]),
+        ('2019-2021', [2019, 2020, 2021]),
+        ('1-3,12', [1, 2, 3, 12]),
+        ('12, 1,1', [1, 12]),
+    ],
+)
+def test_parse_range(spec, expected):
+    # Setup - none necessary
+
+    # Exercise
+    result = backfill.parse_range(spec)
+
+    # Verify
+    assert result == expected
+
+    # Cleanup - none necessary
+
+
+def test_parse_range_raises_error_for_reversed_range():
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match="Invalid range: '5-1'"):
+        backfill.parse_range('5-1')
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_backfill_streams_each_week_to_sink(tmp_path):
+    # Setup
+    seasons = [2019, 2020]
+    weeks = [11, 12]
+
+    for season in seasons:
+        for week in weeks:
+            for url, stats_type in (
+                (ACTUAL_PTS_URL, 'stats'),
+                (PROJECTED_PTS_URL, 'projectedStats'),
+            ):
+                responses.add(
+                    method=responses.GET,
+                    url=f'{url}season={season}&week={week}',
+                    json=_mock_week_payload(season, week, stats_type),
+                )
+
+    received = []
+    lock = threading.Lock()
+
+    def sink(season, week, stats_type, player_pts):
+        with lock:
+            received.append((season, week, stats_type, player_pts))
+
+    # Exercise
+    errors = backfill.backfill(seasons, weeks, sink, max_workers=4, root=tmp_path)
+
+    # Verify
+    assert errors == {}
+    assert len(received) == 8
+    assert len(responses.calls) == 8
+
+    for season, week, stats_type, player_pts in received:
+        assert (
+            player_pts == _mock_week_payload(season, week, stats_type)['games']['102020']['players']
+        )
+
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_backfill_reports_errors_and_skips(tmp_path, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    responses.add(
+        method=responses.GET,
+        url=f'{ACTUAL_PTS_URL}season=2020&week=1',
+        json=_mock_week_payload(2020, 1, 'stats'),
+    )
+    responses.add(method=responses.GET, url=f'{ACTUAL_PTS_URL}season=2020&week=2', json={})
+
+    store = backfill.JSONWeekStore(tmp_path.joinpath('backfill'))
+    store(2020, 3, 'stats', {'already': 'stored'})
+
+    # Exercise
+    errors = backfill.backfill(
+        [2020], [1, 2, 3], store, stats_types=['stats'], skip=store.exists, root=tmp_path
+    )
+
+    # Verify
+    assert list(errors) == [(2020, 2, 'stats')]
+    assert 'Failed to backfill 2020 week 2 stats' in caplog.text
+    assert len(responses.calls) == 2  # week 3 skipped
+
+    assert store.exists(2020, 1, 'stats')
+    assert not store.exists(2020, 2, 'stats')
+    assert store.load(2020, 1, 'stats') == {
+        '1': {'stats': {'week': {'2020': {'1': {'pts': '1.0'}}}}}
+    }
+    assert store.load(2020, 3, 'stats') == {'already': 'stored'}
+
+    # Cleanup - none necessary
+
+
+def test_backfill_raises_error_for_unrecognized_stats_type(tmp_path):
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match="Unrecognized stats type: 'bogus'"):
+        backfill.backfill([2020], [1], lambda *args: None, stats_types=['bogus'], root=tmp_path)
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+def test_JSONWeekStore(tmp_path):
+    # Setup
+    store = backfill.JSONWeekStore(tmp_path)
+    player_pts = {'310': {'stats': {}}}
+
+    # Exercise
+    store(2020, 12, 'stats', player_pts)
+
+    # Verify
+    path = tmp_path.joinpath('2020/2020_12_stats.json')
+    assert store.path(2020, 12, 'stats') == path
+    with open(path, 'r') as f:
+        assert json.load(f) == player_pts
+    assert store.__repr__() == f"JSONWeekStore('{tmp_path}')"
+
+    # Cleanup - none necessary
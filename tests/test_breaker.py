@@ -0,0 +1,195 @@
+"""
+Unit tests for breaker.py
+"""
+
+import logging
+
+import pytest
+
+from turkey_bowl.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    Snapshot,
+    SnapshotStore,
+)
+from turkey_bowl.scrape import Scraper
+
+PLAYER_PTS = {'2555334': {'stats': {'week': {'2023': {'12': {'pts': '20.01'}}}}}}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail():
+    """Helper function for a failing request."""
+    raise ValueError('Unrecognized player points payload')
+
+
+def test_CircuitBreaker_opens_after_failures():
+    # Setup
+    clock = FakeClock()
+    breaker = CircuitBreaker('nfl', failure_threshold=2, reset_timeout=60, clock=clock)
+    calls = []
+
+    # Exercise
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            breaker.call(_fail)
+
+    # Verify
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError, match='Circuit nfl is open after 2 failures'):
+        breaker.call(calls.append, 'not called')
+    assert calls == []
+
+    # Cleanup - none necessary
+
+
+def test_CircuitBreaker_half_open_trial():
+    # Setup
+    clock = FakeClock()
+    breaker = CircuitBreaker('nfl', failure_threshold=1, reset_timeout=60, clock=clock)
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+
+    # Exercise - a failed trial re-opens the circuit
+    clock.now += 61
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+    reopened = breaker.state
+
+    clock.now += 61
+    result = breaker.call(lambda: 'ok')
+
+    # Verify
+    assert reopened == OPEN
+    assert result == 'ok'
+    assert breaker.state == CLOSED
+
+    # Cleanup - none necessary
+
+
+def test_CircuitBreaker_success_resets_failures():
+    # Setup
+    breaker = CircuitBreaker('nfl', failure_threshold=2)
+
+    # Exercise
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+    breaker.call(lambda: None)
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+
+    # Verify
+    assert breaker.state == CLOSED
+    assert breaker.__repr__() == "CircuitBreaker('nfl', failure_threshold=2, reset_timeout=300.0)"
+
+    # Cleanup - none necessary
+
+
+def test_CircuitBreaker_state_is_shared_across_runs(tmp_path, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    clock = FakeClock()
+    state_path = tmp_path.joinpath('breakers/nfl.json')
+
+    # Exercise
+    for _ in range(3):
+        breaker = CircuitBreaker('nfl', state_path=state_path, clock=clock)
+        with pytest.raises(ValueError):
+            breaker.call(_fail)
+
+    # Verify
+    assert CircuitBreaker('nfl', state_path=state_path, clock=clock).state == OPEN
+    assert state_path.exists()
+    assert 'Circuit nfl opened after 3 failures' in caplog.text
+
+    # Cleanup - none necessary
+
+
+def test_SnapshotStore(tmp_path):
+    # Setup
+    store = SnapshotStore(tmp_path)
+
+    # Exercise
+    saved = store.save(2023, 12, PLAYER_PTS)
+    result = store.load(2023, 12)
+
+    # Verify
+    assert store.path(2023, 12) == tmp_path.joinpath('2023/2023_12_stats.json')
+    assert saved == Snapshot(PLAYER_PTS, saved.as_of, stale=False)
+    assert result == Snapshot(PLAYER_PTS, saved.as_of, stale=True)
+    assert store.load(2023, 13) is None
+
+    # Cleanup - none necessary
+
+
+def test_Scraper_get_actual_snapshot_falls_back_to_last_good(tmp_path, monkeypatch, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    scraper = Scraper(2023, root=tmp_path)
+    pulls = []
+
+    def get_actual_player_pts():
+        pulls.append(1)
+        if len(pulls) > 1:
+            _fail()
+        return PLAYER_PTS
+
+    monkeypatch.setattr(scraper, 'get_actual_player_pts', get_actual_player_pts)
+
+    # Exercise
+    fresh = scraper.get_actual_snapshot()
+    stale = [scraper.get_actual_snapshot() for _ in range(5)]
+
+    # Verify
+    assert fresh.player_pts == PLAYER_PTS and not fresh.stale
+    assert all(snapshot == fresh._replace(stale=True) for snapshot in stale)
+    assert len(pulls) == 4  # the circuit opened after 3 failures
+    assert scraper.breaker.state == OPEN
+    assert 'serving the last good snapshot' in caplog.text
+
+    # Cleanup - none necessary
+
+
+def test_Scraper_get_actual_snapshot_without_snapshot(tmp_path, monkeypatch):
+    # Setup
+    scraper = Scraper(2023, root=tmp_path)
+    monkeypatch.setattr(scraper, 'get_actual_player_pts', _fail)
+
+    # Exercise
+    result = scraper.get_actual_snapshot()
+
+    # Verify
+    assert result == Snapshot({}, None, stale=True)
+
+    # Cleanup - none necessary
+
+
+def test_Scraper_get_actual_snapshot_empty_response(tmp_path, monkeypatch, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    scraper = Scraper(2023, root=tmp_path)
+    responses = [{}, PLAYER_PTS, {}]
+    monkeypatch.setattr(scraper, 'get_actual_player_pts', lambda: responses.pop(0))
+
+    # Exercise
+    without_snapshot = scraper.get_actual_snapshot()
+    fresh = scraper.get_actual_snapshot()
+    result = scraper.get_actual_snapshot()
+
+    # Verify
+    assert without_snapshot == Snapshot({}, None)
+    assert result == fresh._replace(stale=True)
+    assert 'No actual player points were returned' in caplog.text
+
+    # Cleanup - none necessary
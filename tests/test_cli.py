@@ -0,0 +1,121 @@
+"""
+Unit tests for cli.py
+"""
+
+import json
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from turkey_bowl import cli
+from turkey_bowl.breaker import Snapshot
+from turkey_bowl.draft import Draft, write_draft_sheet
+
+PLAYER_IDS = {
+    '1': {'name': 'QB One', 'position': 'QB', 'team': 'KC'},
+    '2': {'name': 'QB Two', 'position': 'QB', 'team': 'DET'},
+}
+
+
+class MockScraper:
+    nfl_thanksgiving_calendar_week = 12
+
+    def __init__(self, year):
+        self.year = year
+
+    def get_actual_snapshot(self):
+        return Snapshot({}, None)
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    assets_dir = tmp_path.joinpath('assets')
+    assets_dir.mkdir()
+    with open(assets_dir.joinpath('player_ids.json'), 'w') as written_json:
+        json.dump(PLAYER_IDS, written_json)
+
+    draft = Draft(2023, root=tmp_path)
+    draft.dir_config.output_dir.mkdir(parents=True)
+    with open(draft.dir_config.draft_order_path, 'w') as written_json:
+        json.dump({'logan': 1, 'dodd': 2}, written_json)
+    write_draft_sheet(
+        {
+            'logan': pd.DataFrame({'Position': ['QB'], 'Player': ['QB One'], 'Team': ['KC']}),
+            'dodd': pd.DataFrame({'Position': ['QB'], 'Player': ['QB Two'], 'Team': ['DET']}),
+        },
+        draft.dir_config.draft_sheet_path,
+    )
+    pd.DataFrame(
+        {
+            'Player_ID': [1, 2],
+            'Player': ['QB One', 'QB Two'],
+            'Team': ['KC', 'DET'],
+            'PROJ_Position': ['QB', 'QB'],
+            'PROJ_pts': [20.0, 18.0],
+        }
+    ).to_csv(draft.dir_config.output_dir.joinpath('2023_12_projected_player_pts.csv'))
+
+    monkeypatch.setattr(cli, 'YEAR', 2023)
+    monkeypatch.setattr(cli, 'Draft', lambda year: Draft(year, root=tmp_path))
+    monkeypatch.setattr(cli, 'Scraper', MockScraper)
+    monkeypatch.setattr(cli.utils, 'setup_logger', lambda *args, **kwargs: None)
+    return tmp_path
+
+
+def test_watch_writes_json_by_default(root, monkeypatch):
+    # Setup
+    def mock_watch(scraper, on_update, fetch, **kwargs):
+        on_update(fetch())
+        return 1
+
+    monkeypatch.setattr(cli.polling, 'watch', mock_watch)
+    output_dir = root.joinpath('archive/2023')
+
+    # Exercise
+    result = CliRunner().invoke(cli.app, ['watch', '--no-warehouse'])
+
+    # Verify
+    assert result.exit_code == 0, result.output
+    assert output_dir.joinpath('2023_leader_board.json').exists()
+    assert output_dir.joinpath('2023_12_robust_participant_player_pts.json').exists()
+    assert not output_dir.joinpath('2023_leader_board.xlsx').exists()
+
+    # Cleanup - none necessary
+
+
+def test_pick_refuses_ambiguous_query(root):
+    # Setup
+    draft_picks_path = root.joinpath('archive/2023/2023_draft_picks.jsonl')
+
+    # Exercise
+    result = CliRunner().invoke(cli.app, ['pick', 'qb'])
+
+    # Verify
+    assert result.exit_code == 1
+    assert '"qb" is ambiguous' in result.output
+    assert 'QB One' in result.output and 'QB Two' in result.output
+    assert len(draft_picks_path.read_text().splitlines()) == 1  # header, no picks
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'args, expected',
+    [
+        (['pick', 'qb two'], 'logan drafts QB Two (DET)'),
+        (['pick', 'qb', '--yes'], 'logan drafts QB One (KC)'),
+    ],
+    ids=['exact_name', 'yes'],
+)
+def test_pick(root, args, expected):
+    # Setup - none necessary
+
+    # Exercise
+    result = CliRunner().invoke(cli.app, args)
+
+    # Verify
+    assert result.exit_code == 0, result.output
+    assert expected in result.output
+
+    # Cleanup - none necessary
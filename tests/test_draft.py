@@ -8,8 +8,10 @@ import random
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
-from turkey_bowl.draft import Draft
+from turkey_bowl import draft as draft_module
+from turkey_bowl.draft import ROSTER_SLOTS, Draft, read_draft_sheet, write_draft_sheet
 
 
 def test_Draft_instantiation():
@@ -457,3 +459,121 @@ def test_Draft_check_players_have_been_drafted_true():
     assert result is True
 
     # Cleanup - none necessary
+
+
+@pytest.mark.parametrize('sheet_format', ['xlsx', 'csv', 'json'])
+def test_write_draft_sheet_round_trip(tmp_path, sheet_format):
+    # Setup
+    participant_teams = {
+        'Dodd': pd.DataFrame(
+            {
+                'Position': ROSTER_SLOTS,
+                'Player': ['Tom Brady'] + [' '] * 9,
+                'Team': ['TB'] + [' '] * 9,
+            }
+        ),
+    }
+    participant_teams['Logan'] = participant_teams['Dodd'].iloc[::-1].reset_index(drop=True)
+    savepath = tmp_path.joinpath({'csv': 'sheets'}.get(sheet_format, f'sheet.{sheet_format}'))
+
+    # Exercise
+    write_draft_sheet(participant_teams, savepath)
+    result = read_draft_sheet(savepath)
+
+    # Verify
+    assert list(result) == ['Dodd', 'Logan']
+    for participant, participant_team in participant_teams.items():
+        pd.testing.assert_frame_equal(result[participant], participant_team)
+
+    # Cleanup - none necessary
+
+
+def test_read_draft_sheet_raises_error():
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match="Unrecognized draft sheet format: 'xls'"):
+        read_draft_sheet(Path('draft_sheet.xls'))
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+def test_read_xlsx_sheet_engines_agree(tmp_path):
+    # Setup
+    savepath = tmp_path.joinpath('draft_sheet.xlsx')
+    draft_df = pd.DataFrame({'Position': ROSTER_SLOTS, 'Player': [' '] * 10, 'Team': [' '] * 10})
+    write_draft_sheet({'logan': draft_df, 'dodd': draft_df}, savepath)
+
+    # Exercise
+    result = draft_module.read_xlsx_sheet(savepath)
+    expected = draft_module.read_xlsx_sheet(savepath, engine='openpyxl')
+
+    # Verify
+    assert list(result) == ['Logan', 'Dodd']
+    for participant in expected:
+        pd.testing.assert_frame_equal(result[participant], expected[participant])
+
+    # Cleanup - none necessary
+
+
+def test_read_xlsx_sheet_falls_back_to_openpyxl(tmp_path, monkeypatch, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    savepath = tmp_path.joinpath('draft_sheet.xlsx')
+    draft_df = pd.DataFrame({'Position': ROSTER_SLOTS, 'Player': [' '] * 10, 'Team': [' '] * 10})
+    write_draft_sheet({'logan': draft_df}, savepath)
+    read_excel = pd.read_excel
+
+    def mock_read_excel(path, sheet_name, engine):
+        # pandas < 2.2
+        if engine == 'calamine':
+            raise ValueError(f'Unknown engine: {engine}')
+        return read_excel(path, sheet_name=sheet_name, engine=engine)
+
+    monkeypatch.setattr(draft_module.pd, 'read_excel', mock_read_excel)
+
+    # Exercise
+    result = draft_module.read_xlsx_sheet(savepath, engine='calamine')
+
+    # Verify
+    assert list(result) == ['Logan']
+    assert 'has no calamine engine; using openpyxl' in caplog.text
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize('sheet_format', ['csv', 'json'])
+def test_Draft_setup_and_load_sheet_format(tmp_path, sheet_format):
+    # Setup
+    draft = Draft(2005, root=tmp_path, sheet_format=sheet_format)
+    draft.dir_config.output_dir.mkdir(parents=True)
+    with open(draft.dir_config.draft_order_path, 'w') as written_json:
+        json.dump({'logan': 1, 'dodd': 2}, written_json)
+
+    # Exercise
+    draft.setup()
+    result = draft.load()
+
+    # Verify
+    assert draft.dir_config.draft_sheet_path.exists() is False
+    assert draft.sheet_path.exists() is True
+    assert list(result) == ['Logan', 'Dodd'] if sheet_format == 'json' else ['Dodd', 'Logan']
+    assert result['Logan']['Position'].tolist() == ROSTER_SLOTS
+    assert result['Logan']['Player'].tolist() == [''] * 10
+
+    # Format found from the existing draft sheet
+    assert Draft(2005, root=tmp_path).sheet_format == sheet_format
+
+    # Cleanup - none necessary
+
+
+def test_Draft_sheet_format_raises_error():
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match="Unrecognized draft sheet format: 'xls'"):
+        Draft(2005, sheet_format='xls')
+
+    # Verify - none necessary
+    # Cleanup - none necessary
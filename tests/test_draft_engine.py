@@ -0,0 +1,224 @@
+"""
+Unit tests for draft_engine.py
+"""
+
+import json
+import logging
+
+import pandas as pd
+import pytest
+
+from turkey_bowl import utils
+from turkey_bowl.draft import Draft
+from turkey_bowl.draft_engine import DraftEngine, InvalidPickError, Pick
+from turkey_bowl.search import PlayerEntry
+
+PLAYERS = [
+    PlayerEntry('2558125', 'Patrick Mahomes', 'KC', 'QB', 21.3),
+    PlayerEntry('2560757', 'Jared Goff', 'DET', 'QB', 18.4),
+    PlayerEntry('2566073', 'Amon-Ra St. Brown', 'DET', 'WR', 16.5),
+    PlayerEntry('2562238', 'A.J. Brown', 'PHI', 'WR', 18.2),
+    PlayerEntry('2540258', 'Travis Kelce', 'KC', 'TE', 12.1),
+    PlayerEntry('2558116', 'Aaron Jones', 'GB', 'RB', 11.0),
+    PlayerEntry('100005', 'Chicago Bears', 'CHI', 'DEF', 6.0),
+]
+
+SLOTS = ['QB', 'WR_1', 'Flex (RB/WR/TE)']
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return DraftEngine(['dodd', 'logan'], PLAYERS, tmp_path.joinpath('picks.jsonl'), slots=SLOTS)
+
+
+def test_DraftEngine_snake_order(engine):
+    # Setup - none necessary
+
+    # Exercise
+    result = [engine.participant_for(number) for number in range(1, engine.n_picks + 1)]
+
+    # Verify
+    assert result == ['dodd', 'logan', 'logan', 'dodd', 'dodd', 'logan']
+    assert engine.on_the_clock == 'dodd'
+    assert engine.__repr__() == "DraftEngine(['dodd', 'logan'], pick 1 of 6)"
+
+    # Cleanup - none necessary
+
+
+def test_DraftEngine_pick(engine, caplog):
+    # Setup
+    caplog.set_level(logging.DEBUG)
+
+    # Exercise
+    first = engine.pick('dodd', '2558125')
+    engine.pick('logan', '2562238')
+    flex = engine.pick('logan', '2566073')
+
+    # Verify
+    assert first == Pick(1, 'dodd', 'QB', '2558125')
+    assert flex == Pick(3, 'logan', 'Flex (RB/WR/TE)', '2566073')
+    assert engine.rosters['logan'] == {
+        'QB': None,
+        'WR_1': '2562238',
+        'Flex (RB/WR/TE)': '2566073',
+    }
+    assert engine.drafted == {'2558125', '2562238', '2566073'}
+    assert [entry.name for entry in engine.available('WR')] == []
+    assert [entry.name for entry in engine.available()][:2] == ['Jared Goff', 'Travis Kelce']
+    assert engine.on_the_clock == 'dodd'
+    assert 'Pick 1: dodd drafts Patrick Mahomes (KC) at QB' in caplog.text
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'participant, player_id, slot, expected_error',
+    [
+        ('logan', '2560757', None, r'logan is not on the clock \(dodd has pick 4\)'),
+        ('becca', '2560757', None, "Unrecognized participant: 'becca'"),
+        ('dodd', '999', None, "Unrecognized player id: '999'"),
+        ('dodd', '2558125', None, r'Patrick Mahomes \(KC\) has already been drafted'),
+        ('dodd', '2560757', None, r'dodd has no open slot for Jared Goff \(QB\)'),
+        ('dodd', '2558116', 'QB', 'dodd has already filled QB'),
+        ('dodd', '2540258', 'WR_1', r'WR_1 can not hold Travis Kelce \(TE\)'),
+        ('dodd', '2540258', 'K', "Unrecognized slot: 'K'"),
+    ],
+)
+def test_DraftEngine_pick_raises_error(engine, participant, player_id, slot, expected_error):
+    # Setup
+    engine.pick('dodd', '2558125')
+    engine.pick('logan', '2562238')
+    engine.pick('logan', '2566073')
+    log = engine.pick_log_path.read_text()
+
+    # Exercise
+    with pytest.raises(InvalidPickError, match=expected_error):
+        engine.pick(participant, player_id, slot)
+
+    # Verify - nothing was logged
+    assert engine.pick_log_path.read_text() == log
+    assert engine.pick_number == 4
+
+    # Cleanup - none necessary
+
+
+def test_DraftEngine_undo(engine):
+    # Setup
+    engine.pick('dodd', '2558125')
+
+    # Exercise
+    result = engine.undo()
+
+    # Verify
+    assert result == Pick(1, 'dodd', 'QB', '2558125')
+    assert engine.drafted == set()
+    assert engine.available('QB')[0].name == 'Patrick Mahomes'
+    assert engine.on_the_clock == 'dodd'
+    with pytest.raises(InvalidPickError, match='There are no picks to undo'):
+        engine.undo()
+
+    # Cleanup - none necessary
+
+
+def test_DraftEngine_recovers_from_pick_log(engine, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    engine.pick('dodd', '2558125')
+    engine.pick('logan', '2562238')
+    engine.undo()
+    engine.pick('logan', '2540258', 'Flex (RB/WR/TE)')
+
+    # Interrupted append
+    with open(engine.pick_log_path, 'a') as log_file:
+        log_file.write('{"number": 3, "partici')
+
+    # Exercise
+    result = DraftEngine(['dodd', 'logan'], PLAYERS, engine.pick_log_path, slots=SLOTS)
+
+    # Verify
+    assert result.picks == engine.picks
+    assert result.rosters == engine.rosters
+    assert result.drafted == {'2558125', '2540258'}
+    assert result.on_the_clock == 'logan'
+    assert engine.pick_log_path.read_text().endswith('"player_id": "2540258"}\n')
+    assert 'Resuming draft from' in caplog.text
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'header', ['', '{"draft_order": ["dodd", "lo', '\n'], ids=['empty', 'torn', 'blank_line']
+)
+def test_DraftEngine_recovers_from_torn_header(tmp_path, header):
+    # Setup
+    pick_log_path = tmp_path.joinpath('picks.jsonl')
+    pick_log_path.write_text(header)
+
+    # Exercise
+    result = DraftEngine(['dodd', 'logan'], PLAYERS, pick_log_path, slots=SLOTS)
+    result.pick('dodd', '2558125')
+
+    # Verify - a fresh log that the next start resumes
+    assert result.picks == DraftEngine(['dodd', 'logan'], PLAYERS, pick_log_path, slots=SLOTS).picks
+    assert pick_log_path.read_text().startswith(
+        '{"draft_order": ["dodd", "logan"], "snake": true}\n'
+    )
+
+    # Cleanup - none necessary
+
+
+def test_DraftEngine_pick_log_with_bad_header_and_picks(engine):
+    # Setup
+    engine.pick('dodd', '2558125')
+    lines = engine.pick_log_path.read_text().splitlines(keepends=True)
+    engine.pick_log_path.write_text('{"draft_or\n' + ''.join(lines[1:]))
+
+    # Exercise
+    with pytest.raises(ValueError, match='is for another draft'):
+        DraftEngine(['dodd', 'logan'], PLAYERS, engine.pick_log_path, slots=SLOTS)
+
+    # Verify - nothing else to verify
+
+    # Cleanup - none necessary
+
+
+def test_DraftEngine_pick_log_for_another_draft(engine):
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match='is for another draft'):
+        DraftEngine(['logan', 'dodd'], PLAYERS, engine.pick_log_path, slots=SLOTS)
+
+    # Verify - nothing else to verify
+
+    # Cleanup - none necessary
+
+
+def test_DraftEngine_export(tmp_path):
+    # Setup
+    dir_config = utils.load_dir_config(2023, tmp_path)
+    dir_config.output_dir.mkdir(parents=True)
+    with open(dir_config.draft_order_path, 'w') as draft_order_file:
+        json.dump({'logan': 2, 'dodd': 1}, draft_order_file)
+
+    engine = DraftEngine.from_dir_config(dir_config, PLAYERS)
+    engine.pick('dodd', '2566073')
+    engine.pick('logan', '100005')
+
+    # Exercise
+    engine.export(dir_config.draft_sheet_path)
+    result = Draft(2023, root=tmp_path).load()
+
+    # Verify
+    assert engine.pick_log_path == dir_config.draft_picks_path
+    assert list(result) == ['Dodd', 'Logan']
+    expected = engine.to_participant_teams()
+    for participant, participant_team in result.items():
+        participant_team = participant_team.fillna('')
+        pd.testing.assert_frame_equal(
+            participant_team, expected[participant].drop(columns='Player_ID')
+        )
+    assert expected['Logan'].loc[8, 'Player'] == 'Chicago Bears'
+    assert expected['Logan']['Player_ID'].tolist()[8] == 100005
+
+    # Cleanup - none necessary
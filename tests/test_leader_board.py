@@ -2,8 +2,10 @@
 Unit tests for leader_board.py
 """
 
+import json
 import logging
 import textwrap
+from datetime import datetime, timezone
 
 import pandas as pd
 import pytest
@@ -1493,3 +1495,60 @@ def test_LeaderBoard_save(mock_participant_teams, tmp_path, caplog):
     assert expected_out in caplog.text
 
     # Cleanup - none necessary
+
+
+def test_LeaderBoard_save_json(mock_participant_teams, tmp_path, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    year = 2020
+    participant_teams = mock_participant_teams
+    for participant_team in participant_teams.values():
+        participant_team['ACTUAL_pts'] = 1.0
+
+    tmp_leader_board_path = tmp_path.joinpath(f'{year}_leader_board.xlsx')
+    expected_path = tmp_path.joinpath(f'{year}_leader_board.json')
+    expected_out = f'Saving LeaderBoard to {expected_path}...'
+
+    # Exercise
+    board = LeaderBoard(year, participant_teams)
+    result = board.save(tmp_leader_board_path, output_format='json')
+
+    # Verify
+    assert result == expected_path
+    assert not tmp_leader_board_path.exists()
+
+    with open(expected_path, 'r') as f:
+        written = json.load(f)
+
+    assert list(written) == ['Leader Board', *participant_teams]
+    assert written['Leader Board']['Dodd']['PTS'] == 9.0
+    assert list(written['Dodd'][0]) == ['Position', 'Player', 'Team', 'ACTUAL_pts', 'PROJ_pts']
+    assert expected_out in caplog.text
+
+    # Cleanup - none necessary
+
+
+def test_LeaderBoard_save_stale(mock_participant_teams, tmp_path, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    year = 2020
+    participant_teams = mock_participant_teams
+    for participant_team in participant_teams.values():
+        participant_team['ACTUAL_pts'] = 1.0
+    as_of = datetime(2020, 11, 26, 18, 30, tzinfo=timezone.utc)
+
+    # Exercise
+    board = LeaderBoard(year, participant_teams, stale=True, as_of=as_of)
+    board.display()
+    result = board.save(tmp_path.joinpath(f'{year}_leader_board.xlsx'), output_format='json')
+
+    # Verify
+    with open(result, 'r') as f:
+        written = json.load(f)
+
+    assert written['Leader Board']['Dodd']['stale_as_of'] == '2020-11-26T18:30:00+00:00'
+    assert 'stale_as_of' not in board.data
+    assert 'STALE leader board (points as of 2020-11-26T18:30:00+00:00)' in caplog.text
+    assert LeaderBoard(year, participant_teams).stale_as_of is None
+
+    # Cleanup - none necessary
@@ -0,0 +1,146 @@
+"""
+Unit tests for leagues.py
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from turkey_bowl import leagues, utils
+from turkey_bowl.draft import Draft, write_draft_sheet
+
+PLAYER_IDS = {
+    '1': {'name': 'QB One', 'position': 'QB', 'team': 'KC'},
+    '2': {'name': 'QB Two', 'position': 'QB', 'team': 'DET'},
+    '3': {'name': 'WR One', 'position': 'WR', 'team': 'DET'},
+    '4': {'name': 'WR Two', 'position': 'WR', 'team': 'PHI'},
+    '5': {'name': 'TE One', 'position': 'TE', 'team': 'KC'},
+    '6': {'name': 'TE Two', 'position': 'TE', 'team': 'DAL'},
+}
+
+SLOTS = ['QB', 'WR_1', 'Bench (RB/WR/TE)']
+
+LEAGUE_DRAFTS = {
+    'family': {'logan': ['1', '3', '5'], 'dodd': ['2', '4', '6']},
+    'office': {'becca': ['2', '3', '6'], 'emily': ['1', '4', '5']},
+    'friends': {'yeager': ['1', '3', '5'], 'cindy': [None, None, None]},
+}
+
+
+def _team(pids):
+    return pd.DataFrame(
+        {
+            'Position': SLOTS,
+            'Player': [' ' if pid is None else PLAYER_IDS[pid]['name'] for pid in pids],
+            'Team': [' ' if pid is None else PLAYER_IDS[pid]['team'] for pid in pids],
+        }
+    )
+
+
+@pytest.fixture
+def root(tmp_path):
+    assets_dir = tmp_path.joinpath('assets')
+    assets_dir.mkdir()
+    with open(assets_dir.joinpath('player_ids.json'), 'w') as written_json:
+        json.dump(PLAYER_IDS, written_json)
+
+    for league, teams in LEAGUE_DRAFTS.items():
+        draft = Draft(2023, root=tmp_path, league=league)
+        draft.dir_config.output_dir.mkdir(parents=True)
+        with open(draft.dir_config.draft_order_path, 'w') as written_json:
+            json.dump({participant: i for i, participant in enumerate(teams, 1)}, written_json)
+        write_draft_sheet(
+            {participant: _team(pids) for participant, pids in teams.items()},
+            draft.dir_config.draft_sheet_path,
+        )
+
+    return tmp_path
+
+
+@pytest.fixture
+def player_pts_dfs():
+    pids = list(PLAYER_IDS)
+    players = pd.DataFrame(
+        {
+            'Player_ID': pd.array([int(pid) for pid in pids], dtype='int64'),
+            'Player': [PLAYER_IDS[pid]['name'] for pid in pids],
+            'Team': [PLAYER_IDS[pid]['team'] for pid in pids],
+            'PROJ_Position': [PLAYER_IDS[pid]['position'] for pid in pids],
+        }
+    )
+    projected = players.assign(PROJ_pts=[20.0, 18.0, 15.0, 14.0, 10.0, 8.0])
+    actual = players.assign(ACTUAL_pts=[25.0, 10.0, 5.0, 20.0, 30.0, 2.0])
+    return projected, actual
+
+
+def test_load_dir_config_league(tmp_path):
+    # Setup - none necessary
+
+    # Exercise
+    result = utils.load_dir_config(2023, root=tmp_path, league='office')
+
+    # Verify
+    assert result.season_dir == tmp_path.joinpath('archive/2023')
+    assert result.output_dir == tmp_path.joinpath('archive/2023/leagues/office')
+    assert result.draft_sheet_path == result.output_dir.joinpath('2023_draft_sheet.xlsx')
+    assert result.warehouse_dir == tmp_path.joinpath('archive/warehouse')
+    assert result.player_ids_json_path == tmp_path.joinpath('assets/player_ids.json')
+    assert utils.load_dir_config(2023, root=tmp_path).output_dir == result.season_dir
+
+    # Cleanup - none necessary
+
+
+def test_list_leagues(root):
+    # Setup - none necessary
+
+    # Exercise
+    result = utils.list_leagues(2023, root=root)
+
+    # Verify
+    assert result == ['family', 'friends', 'office']
+    assert utils.list_leagues(2024, root=root) == []
+    assert repr(Draft(2023, root=root, league='office')) == "Draft(2023, league='office')"
+
+    # Cleanup - none necessary
+
+
+def test_score_leagues(root, player_pts_dfs):
+    # Setup
+    projected, actual = player_pts_dfs
+
+    # Exercise
+    result = leagues.score_leagues(
+        2023, 12, ['family', 'office', 'friends'], projected, actual, root=root, max_workers=1
+    )
+
+    # Verify - bench excluded
+    assert list(result) == ['family', 'office', 'friends']
+    assert result['family'].data['PTS'].to_dict() == {'Logan': 30.0, 'Dodd': 30.0}
+    assert result['office'].data['PTS'].to_dict() == {'Emily': 45.0, 'Becca': 15.0}
+    assert result['friends'] is None
+
+    league_dir = root.joinpath('archive/2023/leagues/office')
+    assert league_dir.joinpath('2023_leader_board.xlsx').exists()
+    assert league_dir.joinpath('2023_12_robust_participant_player_pts.xlsx').exists()
+    assert league_dir.joinpath('2023_draft_reconciled.json').exists()
+    assert not root.joinpath('archive/2023/2023_leader_board.xlsx').exists()
+
+    # Cleanup - none necessary
+
+
+def test_score_leagues_in_worker_processes(root, player_pts_dfs):
+    # Setup
+    projected, actual = player_pts_dfs
+
+    # Exercise
+    result = leagues.score_leagues(
+        2023, 12, ['family', 'office'], projected, actual, root=root, max_workers=2
+    )
+
+    # Verify
+    assert result['family'].data['PTS'].to_dict() == {'Logan': 30.0, 'Dodd': 30.0}
+    assert result['office'].data['PTS'].to_dict() == {'Emily': 45.0, 'Becca': 15.0}
+    assert leagues._shared == {}
+
+    # Cleanup - none necessary
@@ -0,0 +1,130 @@
+"""
+Unit tests for lineup.py
+"""
+
+import pandas as pd
+import pytest
+
+from turkey_bowl import lineup
+from turkey_bowl.draft import ROSTER_SLOTS
+from turkey_bowl.leader_board import LeaderBoard
+
+POSITIONS = ['QB', 'RB', 'RB', 'WR', 'WR', 'TE', 'TE', 'K', 'DEF', 'WR']
+
+
+@pytest.fixture
+def participant_teams():
+    return {
+        'Dodd': pd.DataFrame(
+            {
+                'Position': ROSTER_SLOTS,
+                'Player': [f'Dodd {i}' for i in range(10)],
+                'PROJ_Position': POSITIONS,
+                'ACTUAL_pts': [20.0, 10.0, 2.0, 8.0, 6.0, 5.0, 1.0, 7.0, 3.0, 15.0],
+            }
+        ),
+        # Rows out of order (Bench in the middle) and a missing score
+        'Logan': pd.DataFrame(
+            {
+                'Position': ROSTER_SLOTS[::-1],
+                'Player': [f'Logan {i}' for i in range(10)],
+                'PROJ_Position': POSITIONS[::-1],
+                'ACTUAL_pts': [30.0, 1.0, 2.0, 3.0, 4.0, None, 6.0, 7.0, 8.0, 9.0],
+            }
+        ),
+    }
+
+
+def test_roster_table(participant_teams):
+    # Setup - none necessary
+
+    # Exercise
+    result = lineup.roster_table(participant_teams)
+
+    # Verify
+    assert len(result) == 20
+    assert result['Participant'].tolist() == ['Dodd'] * 10 + ['Logan'] * 10
+    assert result.loc[[1, 6, 9], 'Slot_Type'].tolist() == [
+        'RB',
+        'Flex (RB/WR/TE)',
+        'Bench (RB/WR/TE)',
+    ]
+    assert result['Starter'].sum() == 18
+
+    # Cleanup - none necessary
+
+
+def test_roster_table_no_teams():
+    # Setup - none necessary
+
+    # Exercise
+    result = lineup.roster_table({})
+
+    # Verify
+    assert result.empty
+    assert result.columns.tolist() == lineup.ROSTER_COLS
+    assert lineup.score({}).empty
+    assert lineup.best_ball({}).empty
+
+    # Cleanup - none necessary
+
+
+def test_score(participant_teams):
+    # Setup - none necessary
+
+    # Exercise
+    result = lineup.score(participant_teams)
+
+    # Verify
+    assert result.to_dict() == {'Dodd': 62.0, 'Logan': 40.0}
+
+    # Cleanup - none necessary
+
+
+def test_lineup_requirements():
+    # Setup - none necessary
+
+    # Exercise
+    result = lineup.lineup_requirements()
+
+    # Verify
+    assert result == [
+        (frozenset({'DEF'}), 1),
+        (frozenset({'K'}), 1),
+        (frozenset({'QB'}), 1),
+        (frozenset({'RB'}), 2),
+        (frozenset({'TE'}), 1),
+        (frozenset({'WR'}), 2),
+        (frozenset({'RB', 'TE', 'WR'}), 1),
+    ]
+
+    # Cleanup - none necessary
+
+
+def test_best_ball(participant_teams):
+    # Setup - none necessary
+
+    # Exercise
+    result = lineup.best_ball(participant_teams)
+
+    # Verify - the benched WRs start (a WR moves to Dodd's flex)
+    assert result.to_dict() == {'Dodd': 76.0, 'Logan': 70.0}
+    assert (result >= lineup.score(participant_teams)).all()
+
+    # Cleanup - none necessary
+
+
+def test_LeaderBoard_best_ball(participant_teams):
+    # Setup - none necessary
+
+    # Exercise
+    result = LeaderBoard(2023, participant_teams, best_ball=True).data
+
+    # Verify
+    assert result['PTS'].to_dict() == {'Dodd': 76.0, 'Logan': 70.0}
+    assert LeaderBoard(2023, participant_teams).data['PTS'].to_dict() == {
+        'Dodd': 62.0,
+        'Logan': 40.0,
+    }
+
+    # Cleanup - none necessary
@@ -0,0 +1,209 @@
+"""
+Unit tests for metrics.py
+"""
+
+import json
+
+import pytest
+import responses
+
+from turkey_bowl import sources
+from turkey_bowl.metrics import METRICS, ScrapeMetrics, endpoint_for
+from turkey_bowl.resolve import PlayerResolver
+from turkey_bowl.scrape import Scraper
+
+
+@pytest.fixture
+def scrape_metrics():
+    METRICS.reset()
+    yield METRICS
+    METRICS.reset()
+
+
+@pytest.mark.parametrize(
+    'url, expected',
+    [
+        (
+            'https://api.fantasy.nfl.com/v2/players/weekstats?season=2023&week=12',
+            'players/weekstats',
+        ),
+        ('http://127.0.0.1:8080/v2/game/stats?season=2023', 'game/stats'),
+        ('/player/ngs-content?', 'player/ngs-content'),
+        ('http://localhost/other', 'other'),
+    ],
+)
+def test_endpoint_for(url, expected):
+    # Setup - none necessary
+
+    # Exercise
+    result = endpoint_for(url)
+
+    # Verify
+    assert result == expected
+
+    # Cleanup - none necessary
+
+
+def test_ScrapeMetrics_to_dict():
+    # Setup
+    metrics = ScrapeMetrics(buckets=(0.1, 1.0))
+
+    # Exercise
+    for i in range(1, 101):
+        metrics.observe('players/weekstats', 200, i / 100, nbytes=10)
+    metrics.observe('players/weekstats', 503, 2.0)
+    metrics.observe('player/ngs-content', 404, 0.05, nbytes=5)
+    metrics.record_retry('player/ngs-content', 3)
+    metrics.record_cache('player_resolver', hit=True)
+    metrics.record_cache('player_resolver', hit=False)
+    result = metrics.to_dict()
+
+    # Verify
+    weekstats = result['endpoints']['players/weekstats']
+    assert weekstats['requests'] == 101
+    assert weekstats['statuses'] == {'200': 100, '503': 1}
+    assert (weekstats['errors_4xx'], weekstats['errors_5xx']) == (0, 1)
+    assert weekstats['bytes'] == 1000
+    assert weekstats['latency_seconds']['p50'] == pytest.approx(0.51)
+    assert weekstats['latency_seconds']['p99'] == pytest.approx(1.0)
+    assert weekstats['latency_seconds']['buckets'] == {'0.1': 10, '1.0': 100}
+
+    ngs_content = result['endpoints']['player/ngs-content']
+    assert (ngs_content['errors_4xx'], ngs_content['retries']) == (1, 3)
+    assert result['cache'] == {'player_resolver': {'hits': 1, 'misses': 1}}
+
+    # Cleanup - none necessary
+
+
+def test_ScrapeMetrics_to_dict_empty_endpoint():
+    # Setup
+    metrics = ScrapeMetrics()
+
+    # Exercise
+    metrics.record_retry('player/ngs-content')
+    result = metrics.to_dict()['endpoints']['player/ngs-content']
+
+    # Verify
+    assert result['requests'] == 0
+    assert result['latency_seconds']['p95'] is None
+
+    # Cleanup - none necessary
+
+
+def test_ScrapeMetrics_bounds_latency_reservoir():
+    # Setup
+    metrics = ScrapeMetrics(buckets=(0.5, 1.0), reservoir_size=10)
+
+    # Exercise
+    for i in range(1, 101):
+        metrics.observe('players/weekstats', 200, i / 100)
+    result = metrics.to_dict()['endpoints']['players/weekstats']['latency_seconds']
+
+    # Verify - percentiles of the last 10 requests, counts of all of them
+    assert len(metrics._endpoints['players/weekstats'].latencies) == 10
+    assert result['p50'] == pytest.approx(0.955)
+    assert result['count'] == 100
+    assert result['sum'] == pytest.approx(50.5)
+    assert result['buckets'] == {'0.5': 50, '1.0': 100}
+
+    # Cleanup - none necessary
+
+
+def test_ScrapeMetrics_to_prometheus():
+    # Setup
+    metrics = ScrapeMetrics(buckets=(0.5, 1.0))
+    metrics.observe('players/weekstats', 200, 0.25, nbytes=100)
+    metrics.observe('players/weekstats', 500, 0.75)
+    metrics.record_cache('player_resolver', hit=False)
+
+    # Exercise
+    result = metrics.to_prometheus().splitlines()
+
+    # Verify
+    assert '# TYPE turkey_bowl_scrape_latency_seconds histogram' in result
+    assert (
+        'turkey_bowl_scrape_requests_total{endpoint="players/weekstats",status="200"} 1' in result
+    )
+    assert (
+        'turkey_bowl_scrape_requests_total{endpoint="players/weekstats",status="500"} 1' in result
+    )
+    assert 'turkey_bowl_scrape_bytes_total{endpoint="players/weekstats"} 100' in result
+    assert 'turkey_bowl_scrape_errors_5xx_total{endpoint="players/weekstats"} 1' in result
+    assert (
+        'turkey_bowl_scrape_latency_seconds_bucket{endpoint="players/weekstats",le="0.5"} 1'
+        in result
+    )
+    assert (
+        'turkey_bowl_scrape_latency_seconds_bucket{endpoint="players/weekstats",le="+Inf"} 2'
+        in result
+    )
+    assert 'turkey_bowl_scrape_latency_seconds_sum{endpoint="players/weekstats"} 1.0' in result
+    assert 'turkey_bowl_cache_requests_total{cache="player_resolver",result="miss"} 1' in result
+
+    # Cleanup - none necessary
+
+
+def test_ScrapeMetrics_write(tmp_path):
+    # Setup
+    metrics = ScrapeMetrics()
+    metrics.observe('game/stats', 200, 0.1, nbytes=42)
+
+    # Exercise
+    metrics.write(tmp_path.joinpath('metrics.json'))
+    metrics.write(tmp_path.joinpath('metrics.prom'))
+
+    # Verify
+    result = json.loads(tmp_path.joinpath('metrics.json').read_text())
+    assert result['endpoints']['game/stats']['bytes'] == 42
+    assert tmp_path.joinpath('metrics.prom').read_text() == metrics.to_prometheus()
+
+    with pytest.raises(ValueError, match="Unrecognized metrics file suffix: '.csv'"):
+        metrics.write(tmp_path.joinpath('metrics.csv'))
+
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_scraping_is_recorded(scrape_metrics, tmp_path):
+    # Setup
+    scraper = Scraper(2023, root=tmp_path, base_url='https://nfl.test/v2')
+    payload = {
+        'systemConfig': {'currentGameId': '1'},
+        'games': {'1': {'players': {'2555334': {'stats': {}}}}},
+    }
+    body = json.dumps(payload)
+    responses.add(responses.GET, scraper.actual_pts_url, body=body, status=200)
+    responses.add(
+        responses.GET,
+        f'https://nfl.test/v2{sources.PLAYER_NGS_CONTENT_PATH}playerId=999',
+        json={'errors': [{'message': 'PLAYER_INVALID'}]},
+        status=400,
+    )
+
+    # Exercise
+    scraper.get_actual_player_pts()
+    scraper._get_player_metadata('999')
+    result = scrape_metrics.to_dict()['endpoints']
+
+    # Verify
+    assert result['players/weekstats']['statuses'] == {'200': 1}
+    assert result['players/weekstats']['bytes'] == len(body)
+    assert result['player/ngs-content']['errors_4xx'] == 1
+
+    # Cleanup - none necessary
+
+
+def test_PlayerResolver_cache_is_recorded(scrape_metrics, tmp_path, monkeypatch):
+    # Setup
+    resolver = PlayerResolver(Scraper(2023, root=tmp_path))
+    monkeypatch.setattr(resolver.scraper, '_get_player_record', lambda pid: {'name': pid})
+
+    # Exercise
+    resolver.resolve_many(['1', '2'])
+    resolver.resolve_many(['1', '2', '3'])
+    resolver.shutdown()
+
+    # Verify
+    assert scrape_metrics.to_dict()['cache'] == {'player_resolver': {'hits': 2, 'misses': 3}}
+
+    # Cleanup - none necessary
@@ -0,0 +1,245 @@
+"""
+Unit tests for player_store.py
+"""
+
+import json
+import os
+
+import pytest
+
+from turkey_bowl.player_store import PlayerStore, RefreshJournal
+
+
+@pytest.fixture
+def mock_player_ids():
+    player_ids = {
+        'year': 2020,
+        '252': {'name': 'Chad Henne', 'position': 'QB', 'team': 'KC', 'injury': None},
+        '310': {'name': 'Matt Ryan', 'position': 'QB', 'team': 'ATL', 'injury': 'Questionable'},
+        '382': {'name': 'Joe Flacco', 'position': 'QB', 'team': 'NYJ', 'injury': None},
+    }
+    return player_ids
+
+
+@pytest.fixture
+def mock_player_ids_json_path(tmp_path, mock_player_ids):
+    json_path = tmp_path.joinpath('player_ids.json')
+    with open(json_path, 'w') as f:
+        json.dump(mock_player_ids, f)
+    return json_path
+
+
+def test_PlayerStore_seeds_from_json(tmp_path, mock_player_ids, mock_player_ids_json_path):
+    # Setup
+    log_path = tmp_path.joinpath('player_ids.jsonl')
+
+    # Exercise
+    store = PlayerStore(log_path, mock_player_ids_json_path)
+
+    # Verify
+    assert log_path.exists()
+    assert len(store) == 4
+    assert store.year == 2020
+    assert '310' in store
+    assert store.get('310') == mock_player_ids['310']
+    assert store.get('999') is None
+    assert store.to_dict() == mock_player_ids
+    assert list(store.to_dict()) == list(mock_player_ids)
+    assert store.__repr__() == f"PlayerStore('{log_path}')"
+
+    # Cleanup - none necessary
+
+
+def test_PlayerStore_upsert_appends_only(tmp_path, mock_player_ids_json_path):
+    # Setup
+    log_path = tmp_path.joinpath('player_ids.jsonl')
+    store = PlayerStore(log_path, mock_player_ids_json_path)
+    original_log = log_path.read_bytes()
+    new_record = {'name': 'Matt Ryan', 'position': 'QB', 'team': 'IND', 'injury': None}
+
+    # Exercise
+    store.upsert('310', new_record)
+    store.upsert('999', {'name': 'Logan Thomas', 'position': 'TE', 'team': 'WAS', 'injury': None})
+    store.delete('252')
+
+    # Verify
+    assert log_path.read_bytes().startswith(original_log)
+    assert len(log_path.read_bytes().splitlines()) == 7
+    assert store.get('310') == new_record
+    assert '252' not in store
+    assert store.dead_records == 3
+
+    # Index is rebuilt identically from the log alone
+    reloaded = PlayerStore(log_path, mock_player_ids_json_path)
+    assert reloaded.to_dict() == store.to_dict()
+    assert list(reloaded) == ['year', '310', '382', '999']
+
+    # Cleanup - none necessary
+
+
+def test_PlayerStore_drops_partial_record(tmp_path, mock_player_ids, mock_player_ids_json_path):
+    # Setup
+    log_path = tmp_path.joinpath('player_ids.jsonl')
+    PlayerStore(log_path, mock_player_ids_json_path)
+
+    with open(log_path, 'ab') as f:
+        f.write(b'{"pid": "999", "da')
+
+    # Exercise
+    store = PlayerStore(log_path, mock_player_ids_json_path)
+    store.upsert('999', {'name': 'Logan Thomas'})
+
+    # Verify
+    assert store.to_dict() == {**mock_player_ids, '999': {'name': 'Logan Thomas'}}
+    assert PlayerStore(log_path).to_dict() == store.to_dict()
+
+    # Cleanup - none necessary
+
+
+def test_PlayerStore_compact(tmp_path, mock_player_ids_json_path):
+    # Setup
+    log_path = tmp_path.joinpath('player_ids.jsonl')
+    store = PlayerStore(log_path, mock_player_ids_json_path, compact_ratio=1.0)
+    expected = store.to_dict()
+
+    # Exercise
+    for _ in range(4):
+        store.upsert('252', expected['252'])
+        assert store.maybe_compact() is False  # dead records don't yet exceed live ones
+
+    store.upsert('252', expected['252'])
+    compacted = store.maybe_compact()
+
+    # Verify
+    assert compacted is True
+    assert store.dead_records == 0
+    assert len(log_path.read_bytes().splitlines()) == 4
+    assert store.to_dict() == expected
+
+    store.compact(order=['382', 'year'])
+    assert list(store) == ['382', 'year', '252', '310']
+    assert list(PlayerStore(log_path)) == ['382', 'year', '252', '310']
+
+    # Cleanup - none necessary
+
+
+def test_PlayerStore_export_json(tmp_path, mock_player_ids, mock_player_ids_json_path):
+    # Setup
+    log_path = tmp_path.joinpath('player_ids.jsonl')
+    store = PlayerStore(log_path, mock_player_ids_json_path)
+    store.upsert('999', {'name': 'Logan Thomas'})
+
+    # Exercise
+    store.export_json()
+
+    # Verify
+    with open(mock_player_ids_json_path, 'r') as f:
+        written = json.load(f)
+
+    assert written == {**mock_player_ids, '999': {'name': 'Logan Thomas'}}
+    assert mock_player_ids_json_path.read_text().endswith('}\n')
+
+    # Log stays authoritative after the export
+    assert PlayerStore(log_path, mock_player_ids_json_path).to_dict() == written
+
+    # Cleanup - none necessary
+
+
+def test_PlayerStore_rebuilds_from_newer_json(tmp_path, mock_player_ids, mock_player_ids_json_path):
+    # Setup
+    log_path = tmp_path.joinpath('player_ids.jsonl')
+    store = PlayerStore(log_path, mock_player_ids_json_path)
+    store.upsert('999', {'name': 'Logan Thomas'})
+
+    # Simulate pulling a new player_ids.json
+    mock_player_ids['year'] = 2021
+    with open(mock_player_ids_json_path, 'w') as f:
+        json.dump(mock_player_ids, f)
+    log_mtime = log_path.stat().st_mtime_ns
+    os.utime(mock_player_ids_json_path, ns=(log_mtime + 1, log_mtime + 1))
+
+    # Exercise
+    result = PlayerStore(log_path, mock_player_ids_json_path)
+
+    # Verify
+    assert result.year == 2021
+    assert result.to_dict() == mock_player_ids
+
+    # Cleanup - none necessary
+
+
+def test_PlayerStore_empty(tmp_path):
+    # Setup
+    log_path = tmp_path.joinpath('player_ids.jsonl')
+
+    # Exercise
+    store = PlayerStore(log_path, tmp_path.joinpath('player_ids.json'))
+
+    # Verify
+    assert len(store) == 0
+    assert store.year is None
+    assert store.to_dict() == {}
+
+    # Cleanup - none necessary
+
+
+def test_RefreshJournal_records_and_resumes(tmp_path):
+    # Setup
+    journal_path = tmp_path.joinpath('player_ids_refresh.jsonl')
+    journal = RefreshJournal(journal_path, 2020)
+
+    # Exercise
+    journal.record('252')
+    journal.record('310', error="ConnectionError('timeout')")
+    journal.record('382', error="ConnectionError('timeout')")
+    journal.record('382')
+    resumed = RefreshJournal(journal_path, 2020)
+
+    # Verify
+    assert resumed.completed == {'252', '382'}
+    assert resumed.failed == {'310': "ConnectionError('timeout')"}
+    assert resumed.__repr__() == f"RefreshJournal('{journal_path}', 2020)"
+
+    resumed.clear()
+    assert not journal_path.exists()
+
+    # Cleanup - none necessary
+
+
+def test_RefreshJournal_gives_up_on_permanent_failures(tmp_path):
+    # Setup
+    journal_path = tmp_path.joinpath('player_ids_refresh.jsonl')
+    journal = RefreshJournal(journal_path, 2020, max_attempts=2)
+
+    # Exercise
+    journal.record('252', error="PlayerNotFoundError('No metadata')", permanent=True)
+    journal.record('310', error="ConnectionError('timeout')")
+    journal.record('310', error="ConnectionError('timeout')")  # second attempt
+    journal.record('382', error="ConnectionError('timeout')")
+    resumed = RefreshJournal(journal_path, 2020, max_attempts=2)
+
+    # Verify
+    assert resumed.given_up == {
+        '252': "PlayerNotFoundError('No metadata')",
+        '310': "ConnectionError('timeout')",
+    }
+    assert resumed.failed == {'382': "ConnectionError('timeout')"}
+    assert '"failed": true' in journal_path.read_text().splitlines()[1]
+
+    # Cleanup - none necessary
+
+
+def test_RefreshJournal_discards_other_year(tmp_path):
+    # Setup
+    journal_path = tmp_path.joinpath('player_ids_refresh.jsonl')
+    journal = RefreshJournal(journal_path, 2019)
+    journal.record('252')
+
+    # Exercise
+    result = RefreshJournal(journal_path, 2020)
+
+    # Verify
+    assert result.completed == set()
+    assert journal_path.read_text() == '{"year": 2020}\n'
+
+    # Cleanup - none necessary
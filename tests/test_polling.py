@@ -0,0 +1,299 @@
+"""
+Unit tests for polling.py
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import responses
+
+from turkey_bowl import backfill, polling
+from turkey_bowl.polling import FINAL, HALFTIME, LIVE, SCHEDULED, GameStatus, PollPolicy
+from turkey_bowl.replay import ReplayServer
+from turkey_bowl.scrape import Scraper
+
+GAME_STATS = {
+    'games': {
+        '1001': {
+            'gameStatus': 'FINAL',
+            'homeTeam': {'abbr': 'DET'},
+            'awayTeam': {'abbr': 'GB'},
+            'gameTime': '2023-11-23T17:30:00Z',
+        },
+        '1002': {
+            'gameStatus': 'INPROGRESS',
+            'homeTeam': 'DAL',
+            'awayTeam': 'WAS',
+            'gameTime': '2023-11-23T21:30:00Z',
+        },
+        '1003': {
+            'gameStatus': 'PREGAME',
+            'homeTeamAbbr': 'SEA',
+            'awayTeamAbbr': 'SF',
+            'gameTime': '2023-11-24T01:20:00Z',
+        },
+        '1004': {'gameStatus': 'PREGAME', 'homeTeam': 'NYJ', 'gameTime': '2023-11-24T20:00:00Z'},
+    }
+}
+
+NOW = datetime(2023, 11, 23, 20, 0, tzinfo=timezone.utc)
+
+
+def _game(game_id, status, kickoff=None, home_team='DET', away_team='GB'):
+    """Helper function for a GameStatus."""
+    return GameStatus(game_id, status, home_team, away_team, kickoff)
+
+
+class FakeScraper:
+    """Replays a sequence of Thanksgiving game statuses."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.polls = 0
+        self.pulls = 0
+
+    def get_thanksgiving_games(self):
+        statuses = self.statuses[min(self.polls, len(self.statuses) - 1)]
+        self.polls += 1
+        if isinstance(statuses, Exception):
+            raise statuses
+        return [
+            _game('1', statuses[0], NOW + timedelta(hours=1)),
+            _game('2', statuses[1], NOW + timedelta(hours=4), 'DAL', 'WAS'),
+        ]
+
+    def get_actual_player_pts(self):
+        self.pulls += 1
+        return {'pull': self.pulls}
+
+
+def test_parse_game_stats():
+    # Setup - none necessary
+
+    # Exercise
+    result = polling.parse_game_stats(GAME_STATS)
+
+    # Verify
+    assert [game.status for game in result] == [FINAL, LIVE, SCHEDULED, SCHEDULED]
+    assert result[0].teams == {'DET', 'GB'}
+    assert result[2].teams == {'SEA', 'SF'}
+    assert result[3].teams == {'NYJ'}
+    assert result[1].kickoff == datetime(2023, 11, 23, 21, 30, tzinfo=timezone.utc)
+
+    # Cleanup - none necessary
+
+
+def test_parse_game_stats_unknown_status_is_live():
+    # Setup
+    game_stats = {'games': {'1': {'gameStatus': 'DELAYED'}, '2': {}}}
+
+    # Exercise
+    result = polling.parse_game_stats(game_stats)
+
+    # Verify
+    assert result == [GameStatus('1', LIVE), GameStatus('2', LIVE)]
+    assert polling.parse_game_stats({}) == []
+
+    # Cleanup - none necessary
+
+
+def test_on_day():
+    # Setup
+    games = polling.parse_game_stats(GAME_STATS)
+
+    # Exercise
+    result = polling.on_day(games, date(2023, 11, 23))
+
+    # Verify - the 8:20 PM Eastern game is Thanksgiving night in UTC terms the next day
+    assert [game.game_id for game in result] == ['1001', '1002', '1003']
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'games, expected',
+    [
+        ([], 60),
+        ([_game('1', FINAL), _game('2', FINAL)], None),
+        ([_game('1', FINAL), _game('2', LIVE)], 60),
+        ([_game('1', HALFTIME), _game('2', SCHEDULED, NOW + timedelta(hours=3))], 300),
+        ([_game('1', FINAL), _game('2', SCHEDULED, NOW + timedelta(hours=3))], 900),
+        ([_game('1', FINAL), _game('2', SCHEDULED, NOW + timedelta(minutes=10))], 600),
+        ([_game('1', SCHEDULED, NOW + timedelta(seconds=5))], 60),
+        ([_game('1', SCHEDULED)], 900),
+    ],
+)
+def test_PollPolicy_next_interval(games, expected):
+    # Setup
+    policy = PollPolicy(live_interval=60, halftime_interval=300, idle_interval=900)
+
+    # Exercise
+    result = policy.next_interval(games, NOW)
+
+    # Verify
+    assert result == expected
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'previous, current, expected',
+    [
+        ({}, {'1': SCHEDULED}, True),
+        ({'1': SCHEDULED}, {'1': SCHEDULED}, False),
+        ({'1': LIVE}, {'1': LIVE}, True),
+        ({'1': LIVE}, {'1': HALFTIME}, True),
+        ({'1': HALFTIME}, {'1': HALFTIME}, False),
+    ],
+)
+def test_PollPolicy_should_fetch(previous, current, expected):
+    # Setup - none necessary
+
+    # Exercise
+    result = PollPolicy.should_fetch(previous, current)
+
+    # Verify
+    assert result == expected
+
+    # Cleanup - none necessary
+
+
+def test_watch_pulls_only_while_games_are_live():
+    # Setup
+    scraper = FakeScraper(
+        [
+            (SCHEDULED, SCHEDULED),
+            (SCHEDULED, SCHEDULED),
+            (LIVE, SCHEDULED),
+            (LIVE, SCHEDULED),
+            (HALFTIME, SCHEDULED),
+            (HALFTIME, SCHEDULED),
+            (FINAL, SCHEDULED),
+            (FINAL, LIVE),
+            (FINAL, FINAL),
+        ]
+    )
+    updates = []
+    sleeps = []
+
+    # Exercise
+    result = polling.watch(
+        scraper,
+        updates.append,
+        policy=PollPolicy(live_interval=60, halftime_interval=300, idle_interval=900),
+        clock=lambda: NOW,
+        sleep=sleeps.append,
+    )
+
+    # Verify - first poll, two live, halftime, final, live and the final refresh
+    assert result == 7
+    assert [update['pull'] for update in updates] == list(range(1, 8))
+    assert scraper.polls == 9
+    assert sleeps == [900, 900, 60, 60, 300, 300, 900, 60]
+
+    # Cleanup - none necessary
+
+
+def test_watch_ignores_undrafted_teams():
+    # Setup
+    scraper = FakeScraper([(SCHEDULED, LIVE), (FINAL, LIVE)])
+    sleeps = []
+
+    # Exercise
+    result = polling.watch(
+        scraper, lambda _: None, teams={'DET'}, clock=lambda: NOW, sleep=sleeps.append
+    )
+
+    # Verify - DAL @ WAS being live never triggers a pull
+    assert result == 2
+    assert scraper.polls == 2
+    assert sleeps == [900]
+
+    # Cleanup - none necessary
+
+
+def test_watch_falls_back_to_polling_player_stats(caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    scraper = FakeScraper([ValueError('gameStats unavailable'), (FINAL, FINAL)])
+    sleeps = []
+
+    # Exercise
+    result = polling.watch(scraper, lambda _: None, clock=lambda: NOW, sleep=sleeps.append)
+
+    # Verify
+    assert result == 2
+    assert sleeps == [60]
+    assert 'Unable to get game statuses (gameStats unavailable)' in caplog.text
+
+    # Cleanup - none necessary
+
+
+def test_watch_polls_when_team_filter_matches_no_games(caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    scraper = FakeScraper([(FINAL, FINAL)])
+    updates = []
+    sleeps = []
+
+    class StopWatching(Exception):
+        pass
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 3:
+            raise StopWatching
+
+    # Exercise
+    with pytest.raises(StopWatching):
+        polling.watch(scraper, updates.append, teams={'KC'}, clock=lambda: NOW, sleep=sleep)
+
+    # Verify - a pull per poll (statuses unknown) rather than stopping at once
+    assert len(updates) == 3
+    assert sleeps == [60, 60, 60]
+    assert 'No game statuses found; polling player stats' in caplog.text
+
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_watch_polls_after_game_stats_error_payload(tmp_path):
+    # Setup
+    scraper = Scraper(2023, root=tmp_path)
+    url = f'{scraper.source.base_url}/game/stats'
+    responses.add(responses.GET, url, json={'error': 'Service Unavailable'}, status=503)
+    responses.add(responses.GET, url, json={'error': 'Service Unavailable'}, status=503)
+    responses.add(
+        responses.GET, url, json={'games': {'1001': GAME_STATS['games']['1001']}}, status=200
+    )
+    sleeps = []
+
+    # Exercise
+    result = polling.watch(
+        scraper, lambda _: None, clock=lambda: NOW, sleep=sleeps.append, fetch=lambda: {}
+    )
+
+    # Verify - the error payloads are polled through until the game is final
+    assert result == 3
+    assert sleeps == [60, 60]
+
+    # Cleanup - none necessary
+
+
+def test_Scraper_get_thanksgiving_games_from_replay_server(tmp_path):
+    # Setup
+    store = backfill.JSONWeekStore(tmp_path.joinpath('backfill'))
+    store(2023, 12, 'gameStats', GAME_STATS)
+
+    with ReplayServer(store.backfill_dir) as server:
+        scraper = Scraper(2023, root=tmp_path, base_url=server.base_url)
+
+        # Exercise
+        result = scraper.get_thanksgiving_games()
+
+    # Verify
+    assert [game.game_id for game in result] == ['1001', '1002', '1003']
+    assert server.counts['requests'] == 1
+
+    # Cleanup - none necessary
@@ -0,0 +1,151 @@
+"""
+Unit tests for recommend.py
+"""
+
+import random
+
+import pytest
+
+from turkey_bowl.draft import ROSTER_SLOTS
+from turkey_bowl.draft_engine import DraftEngine
+from turkey_bowl.recommend import Recommendation, Recommender, fill_slot
+from turkey_bowl.search import PlayerEntry
+
+PLAYERS = [
+    PlayerEntry('2558125', 'Patrick Mahomes', 'KC', 'QB', 21.3),
+    PlayerEntry('2560757', 'Jared Goff', 'DET', 'QB', 18.4),
+    PlayerEntry('2566073', 'Amon-Ra St. Brown', 'DET', 'WR', 16.5),
+    PlayerEntry('2562238', 'A.J. Brown', 'PHI', 'WR', 18.2),
+    PlayerEntry('2540258', 'Travis Kelce', 'KC', 'TE', 12.1),
+    PlayerEntry('2558116', 'Aaron Jones', 'GB', 'RB', 11.0),
+    PlayerEntry('2533031', 'Justin Tucker', 'BAL', 'K', 9.0),
+    PlayerEntry('100005', 'Chicago Bears', 'CHI', 'DEF', 6.0),
+]
+
+
+@pytest.fixture
+def recommender():
+    return Recommender(PLAYERS)
+
+
+@pytest.mark.parametrize(
+    'position, open_slots, expected',
+    [
+        ('WR', ['QB', 'WR_1', 'Flex (RB/WR/TE)'], 'WR_1'),
+        ('WR', ['QB', 'Flex (RB/WR/TE)', 'Bench (RB/WR/TE)'], 'Flex (RB/WR/TE)'),
+        ('TE', ['Bench (RB/WR/TE)'], 'Bench (RB/WR/TE)'),
+        ('QB', ['WR_1', 'Bench (RB/WR/TE)'], None),
+    ],
+)
+def test_fill_slot(position, open_slots, expected):
+    # Setup
+    entry = PlayerEntry('1', 'Someone', 'KC', position)
+
+    # Exercise
+    result = fill_slot(entry, open_slots)
+
+    # Verify
+    assert result == expected
+
+    # Cleanup - none necessary
+
+
+def test_Recommender_recommend(recommender):
+    # Setup - none necessary
+
+    # Exercise
+    result = recommender.recommend(ROSTER_SLOTS, limit=3)
+
+    # Verify
+    assert result == [
+        Recommendation(PLAYERS[0], 'QB'),
+        Recommendation(PLAYERS[1], 'QB'),
+        Recommendation(PLAYERS[3], 'WR_1'),
+    ]
+    assert recommender.__repr__() == 'Recommender(8 available players)'
+
+    # Cleanup - none necessary
+
+
+def test_Recommender_recommend_open_slots_only(recommender):
+    # Setup
+    recommender.remove('2562238')
+
+    # Exercise - QB, K and DEF slots are filled
+    result = recommender.recommend(['Flex (RB/WR/TE)', 'Bench (RB/WR/TE)'], limit=10)
+
+    # Verify
+    assert [rec.entry.name for rec in result] == [
+        'Amon-Ra St. Brown',
+        'Travis Kelce',
+        'Aaron Jones',
+    ]
+    assert {rec.slot for rec in result} == {'Flex (RB/WR/TE)'}
+
+    # Cleanup - none necessary
+
+
+def test_Recommender_remove_and_restore(recommender):
+    # Setup
+    recommender.remove('2558125')
+    recommender.remove('2560757')
+
+    # Exercise
+    without_qbs = list(recommender.best('QB'))
+    recommender.restore('2560757')
+    restored = list(recommender.best('QB'))
+    recommender.restore('2560757')  # restoring twice is harmless
+
+    # Verify
+    assert without_qbs == []
+    assert restored == [PLAYERS[1]]
+    assert list(recommender.best('QB')) == [PLAYERS[1]]
+    assert list(recommender.best('LB')) == []
+
+    # Cleanup - none necessary
+
+
+def test_Recommender_matches_sorting():
+    # Setup
+    rng = random.Random(42)
+    players = [
+        PlayerEntry(str(i), f'Player {i}', 'KC', rng.choice(['RB', 'WR', 'TE']), rng.random())
+        for i in range(200)
+    ]
+    recommender = Recommender(players)
+    drafted = set(rng.sample([entry.player_id for entry in players], 120))
+
+    # Exercise
+    for pid in drafted:
+        recommender.remove(pid)
+    result = recommender.recommend(['Flex (RB/WR/TE)'], limit=20)
+
+    # Verify
+    expected = sorted(
+        (entry for entry in players if entry.player_id not in drafted),
+        key=lambda entry: -entry.proj_pts,
+    )[:20]
+    assert [rec.entry for rec in result] == expected
+
+    # Cleanup - none necessary
+
+
+def test_DraftEngine_recommend():
+    # Setup
+    engine = DraftEngine(['dodd', 'logan'], PLAYERS, slots=['QB', 'WR_1', 'Flex (RB/WR/TE)'])
+
+    # Exercise
+    engine.pick('dodd', '2558125')
+    for_logan = engine.recommend(limit=2)
+    engine.pick('logan', '2560757')
+    engine.undo()
+
+    # Verify
+    assert for_logan == [
+        Recommendation(PLAYERS[1], 'QB'),
+        Recommendation(PLAYERS[3], 'WR_1'),
+    ]
+    assert engine.recommend(limit=2) == for_logan
+    assert engine.recommend('dodd', limit=1) == [Recommendation(PLAYERS[3], 'WR_1')]
+
+    # Cleanup - none necessary
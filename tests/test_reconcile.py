@@ -0,0 +1,149 @@
+"""
+Unit tests for reconcile.py
+"""
+
+import logging
+
+import pandas as pd
+import pytest
+
+from turkey_bowl import reconcile
+from turkey_bowl.reconcile import Reconciler
+from turkey_bowl.search import PlayerIndex
+
+PLAYER_IDS = {
+    'year': 2023,
+    '2566073': {'name': 'Amon-Ra St. Brown', 'position': 'WR', 'team': 'DET'},
+    '2562238': {'name': 'A.J. Brown', 'position': 'WR', 'team': 'PHI'},
+    '2540258': {'name': 'Travis Kelce', 'position': 'TE', 'team': 'KC'},
+    '2495454': {'name': 'Jason Kelce', 'position': 'OL', 'team': 'PHI'},
+    '2558116': {'name': 'Aaron Jones', 'position': 'RB', 'team': 'GB'},
+    '264': {'name': 'Josh Johnson', 'position': 'QB', 'team': 'BAL'},
+    '2505100': {'name': 'Josh Johnson', 'position': 'DB', 'team': 'NYJ'},
+    '100005': {'name': 'Chicago Bears', 'position': 'DEF', 'team': 'CHI'},
+}
+
+
+@pytest.fixture
+def reconciler():
+    return Reconciler(PlayerIndex.from_player_ids(PLAYER_IDS))
+
+
+@pytest.fixture
+def participant_teams():
+    return {
+        'Logan': pd.DataFrame(
+            {
+                'Position': ['QB', 'WR_1', 'TE', 'Defense (Team Name)', 'Bench (RB/WR/TE)'],
+                'Player': ['Josh Johnson', 'Aman Ra St Brown', 'Travis Kelce', 'Bears', 'Nobody'],
+                'Team': ['BAL', 'DET', 'KC', 'CHI', 'KC'],
+            }
+        )
+    }
+
+
+@pytest.mark.parametrize(
+    'slot, expected',
+    [
+        ('QB', {'QB'}),
+        ('RB_2', {'RB'}),
+        ('Flex (RB/WR/TE)', {'RB', 'WR', 'TE'}),
+        ('Defense (Team Name)', {'DEF'}),
+        ('Coach', None),
+        (None, None),
+    ],
+)
+def test_slot_positions(slot, expected):
+    # Setup - none necessary
+
+    # Exercise
+    result = reconcile.slot_positions(slot)
+
+    # Verify
+    assert result == expected
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'player, team, slot, expected_id, expected_score',
+    [
+        ('Amon-Ra St. Brown', 'DET', 'WR_1', '2566073', 1.0),
+        ('amon ra st brown', 'DET', 'WR_1', '2566073', 1.0),
+        ('Aman Ra St Brown', 'DET', 'WR_1', '2566073', 0.824),
+        ('Amon-Ra St. Brown', 'LV', 'WR_1', '2566073', 1.0),  # traded
+        ('Travis Kelsey', 'KC', 'TE', '2540258', 0.741),
+        ('Kelce', 'PHI', 'TE', None, None),  # Jason Kelce is no TE
+        ('Josh Johnson', 'BAL', 'QB', '264', 1.0),  # name collision
+        ('Josh Johnson', 'NYJ', 'QB', '264', 1.0),
+        ('Aaron Jones', 'GB', 'Flex (RB/WR/TE)', '2558116', 1.0),
+        ('Someone Else', 'KC', 'QB', None, None),
+        ('', 'KC', 'QB', None, None),
+    ],
+)
+def test_Reconciler_match(reconciler, player, team, slot, expected_id, expected_score):
+    # Setup - none necessary
+
+    # Exercise
+    result = reconciler.match(player, team, slot)
+
+    # Verify
+    if expected_id is None:
+        assert result is None
+    else:
+        assert result.entry.player_id == expected_id
+        assert result.score == expected_score
+
+    # Cleanup - none necessary
+
+
+def test_Reconciler_reconcile_team(reconciler, participant_teams, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+
+    # Exercise
+    result = reconciler.reconcile(participant_teams)['Logan']
+
+    # Verify
+    assert result['Player'].tolist() == [
+        'Josh Johnson',
+        'Amon-Ra St. Brown',
+        'Travis Kelce',
+        'Chicago Bears',
+        'Nobody',
+    ]
+    assert result['Team'].tolist() == ['BAL', 'DET', 'KC', 'CHI', 'KC']
+    assert result['Player_ID'].tolist() == [264, 2566073, 2540258, 100005, pd.NA]
+    assert 'Logan: Aman Ra St Brown (DET) -> Amon-Ra St. Brown (DET) [score 0.824]' in caplog.text
+    assert 'WARNING: Logan drafted unknown player Nobody (KC)' in caplog.text
+    assert participant_teams['Logan'].loc[1, 'Player'] == 'Aman Ra St Brown'
+
+    # Cleanup - none necessary
+
+
+def test_reconcile_draft_is_cached_per_sheet(participant_teams, tmp_path):
+    # Setup
+    draft_sheet_path = tmp_path.joinpath('draft_sheet.xlsx')
+    draft_sheet_path.write_bytes(b'draft v1')
+    cache_path = tmp_path.joinpath('draft_reconciled.json')
+    builds = []
+
+    def index_factory():
+        builds.append(1)
+        return PlayerIndex.from_player_ids(PLAYER_IDS)
+
+    # Exercise
+    first = reconcile.reconcile_draft(
+        participant_teams, draft_sheet_path, cache_path, index_factory
+    )
+    cached = reconcile.reconcile_draft(
+        participant_teams, draft_sheet_path, cache_path, index_factory
+    )
+    draft_sheet_path.write_bytes(b'draft v2')
+    reconcile.reconcile_draft(participant_teams, draft_sheet_path, cache_path, index_factory)
+
+    # Verify
+    assert len(builds) == 2
+    pd.testing.assert_frame_equal(cached['Logan'], first['Logan'])
+
+    # Cleanup - none necessary
@@ -0,0 +1,134 @@
+"""
+Unit tests for replay.py
+"""
+
+import time
+
+import pytest
+import requests
+
+from turkey_bowl import backfill
+from turkey_bowl.replay import ReplayServer, TokenBucket
+from turkey_bowl.scrape import Scraper
+
+PLAYER_IDS = {
+    'year': 2023,
+    '2555334': {'name': 'Jared Goff', 'position': 'QB', 'team': 'DET', 'injury': None},
+}
+WEEK_PLAYER_PTS = {
+    '2555334': {'stats': {'week': {'2023': {'12': {'5': '296.77', 'pts': '20.01'}}}}}
+}
+
+
+@pytest.fixture
+def backfill_dir(tmp_path):
+    store = backfill.JSONWeekStore(tmp_path.joinpath('backfill'))
+    store(2023, 12, 'stats', WEEK_PLAYER_PTS)
+    return store.backfill_dir
+
+
+def test_ReplayServer_serves_week_stats_to_scraper(backfill_dir, tmp_path):
+    # Setup
+    with ReplayServer(backfill_dir, PLAYER_IDS) as server:
+        scraper = Scraper(2023, root=tmp_path, base_url=server.base_url)
+
+        # Exercise
+        result = scraper.get_week_player_pts(2023, 12)
+        streamed = dict(scraper.iter_week_player_pts(2023, 12))
+
+    # Verify
+    assert result == WEEK_PLAYER_PTS
+    assert streamed == WEEK_PLAYER_PTS
+    assert server.counts['requests'] == 2
+    assert server.base_url.startswith('http://127.0.0.1:')
+
+    # Cleanup - none necessary
+
+
+def test_ReplayServer_serves_player_records(backfill_dir, tmp_path):
+    # Setup
+    with ReplayServer(backfill_dir, PLAYER_IDS) as server:
+        scraper = Scraper(2023, root=tmp_path, base_url=server.base_url)
+
+        # Exercise
+        result = scraper._get_player_record('2555334')
+
+        # Verify
+        assert result == PLAYER_IDS['2555334']
+        with pytest.raises(ValueError, match='No metadata for player 999: PLAYER_INVALID'):
+            scraper._get_player_record('999')
+
+    # Cleanup - none necessary
+
+
+def test_ReplayServer_base_url_from_environment(backfill_dir, tmp_path, monkeypatch):
+    # Setup
+    with ReplayServer(backfill_dir, PLAYER_IDS) as server:
+        monkeypatch.setenv('TURKEY_BOWL_BASE_URL', server.base_url)
+
+        # Exercise
+        errors = backfill.backfill(
+            [2023], [11, 12], lambda *args: None, stats_types=['stats'], root=tmp_path
+        )
+
+    # Verify
+    assert list(errors) == [(2023, 11, 'stats')]
+    assert server.counts['not_found'] == 1
+
+    # Cleanup - none necessary
+
+
+def test_ReplayServer_latency_and_errors(backfill_dir):
+    # Setup
+    server = ReplayServer(backfill_dir, latency=0.05, error_rate=1.0, seed=0)
+    url = f'{server.base_url}/players/weekstats?season=2023&week=12'
+
+    with server:
+        # Exercise
+        start = time.perf_counter()
+        response = requests.get(url)
+        elapsed = time.perf_counter() - start
+
+    # Verify
+    assert response.status_code == 503
+    assert response.json()['errors'][0]['message'] == 'SERVICE_UNAVAILABLE'
+    assert elapsed >= 0.05
+    assert server.counts == {'requests': 1, 'errors': 1, 'throttled': 0, 'not_found': 0}
+
+    # Cleanup - none necessary
+
+
+def test_ReplayServer_rate_limit(backfill_dir):
+    # Setup
+    server = ReplayServer(backfill_dir, rate_limit=0.001, burst=2)
+    url = f'{server.base_url}/players/weekstats?season=2023&week=12'
+
+    with server:
+        # Exercise
+        statuses = [requests.get(url).status_code for _ in range(3)]
+        retry_after = requests.get(url).headers['Retry-After']
+
+    # Verify
+    assert statuses == [200, 200, 429]
+    assert float(retry_after) > 0
+    assert server.counts['throttled'] == 2
+
+    # Cleanup - none necessary
+
+
+def test_TokenBucket():
+    # Setup
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+
+    # Exercise
+    results = [bucket.acquire() for _ in range(3)]
+    now[0] = 0.5
+    refilled = bucket.acquire()
+
+    # Verify
+    assert results == [0.0, 0.0, 0.5]
+    assert refilled == 0.0
+    assert bucket.__repr__() == 'TokenBucket(2.0, burst=2)'
+
+    # Cleanup - none necessary
@@ -0,0 +1,135 @@
+"""
+Unit tests for resolve.py
+"""
+
+import threading
+
+import pytest
+
+from turkey_bowl import resolve
+from turkey_bowl.resolve import PlayerResolver
+
+
+class MockScraper:
+    """Stand-in for Scraper that records lookups instead of hitting NFL.com."""
+
+    def __init__(self, fail=(), gate=None):
+        self.fail = set(fail)
+        self.gate = gate
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _get_player_record(self, pid):
+        with self.lock:
+            self.calls.append(pid)
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if pid in self.fail:
+            raise ValueError(f'No metadata for player {pid}: Invalid player')
+        return {'name': f'Player {pid}', 'position': 'WR', 'team': 'DAL', 'injury': None}
+
+
+def test_PlayerResolver_resolve():
+    # Setup
+    scraper = MockScraper()
+    resolver = PlayerResolver(scraper)
+
+    # Exercise
+    result = resolver.resolve('310')
+
+    # Verify
+    assert result == {'name': 'Player 310', 'position': 'WR', 'team': 'DAL', 'injury': None}
+    assert resolver.resolve('310') == result
+    assert scraper.calls == ['310']  # second lookup served from cache
+
+    # Cleanup
+    resolver.shutdown()
+
+
+def test_PlayerResolver_coalesces_inflight_requests():
+    # Setup
+    gate = threading.Event()
+    scraper = MockScraper(gate=gate)
+    resolver = PlayerResolver(scraper, max_workers=4)
+
+    # Exercise
+    futures = [resolver.submit('310') for _ in range(10)]
+    gate.set()
+    results = [f.result() for f in futures]
+
+    # Verify
+    assert all(f is futures[0] for f in futures)
+    assert all(r == results[0] for r in results)
+    assert scraper.calls == ['310']
+
+    # Cleanup
+    resolver.shutdown()
+
+
+def test_PlayerResolver_resolve_many_is_concurrent():
+    # Setup
+    pids = [str(pid) for pid in range(8)]
+    barrier = threading.Barrier(len(pids))
+
+    class BarrierScraper(MockScraper):
+        def _get_player_record(self, pid):
+            barrier.wait(timeout=5)  # only passes if all ids are in flight at once
+            return super()._get_player_record(pid)
+
+    scraper = BarrierScraper(fail={'3'})
+    resolver = PlayerResolver(scraper, max_workers=len(pids))
+
+    # Exercise
+    resolved, errors = resolver.resolve_many(pids + ['0', '1'])
+
+    # Verify
+    assert sorted(resolved) == [pid for pid in pids if pid != '3']
+    assert errors == {'3': 'No metadata for player 3: Invalid player'}
+    assert sorted(scraper.calls) == sorted(pids)
+
+    # Cleanup
+    resolver.shutdown()
+
+
+def test_PlayerResolver_negative_cache_ttl():
+    # Setup
+    now = [0.0]
+    scraper = MockScraper(fail={'999'})
+    resolver = PlayerResolver(scraper, negative_ttl=60.0, clock=lambda: now[0])
+
+    with pytest.raises(ValueError):
+        resolver.resolve('999')
+
+    # Exercise - within TTL the failure is served from the negative cache
+    now[0] = 59.0
+    with pytest.raises(LookupError, match='cached failure'):
+        resolver.resolve('999')
+
+    assert scraper.calls == ['999']
+
+    # Exercise - after TTL the id is requested again
+    now[0] = 61.0
+    scraper.fail.clear()
+    result = resolver.resolve('999')
+
+    # Verify
+    assert result['name'] == 'Player 999'
+    assert scraper.calls == ['999', '999']
+
+    # Cleanup
+    resolver.shutdown()
+
+
+def test_get_resolver_is_shared(tmp_path):
+    # Setup - none necessary
+
+    # Exercise
+    result = resolve.get_resolver(2020, root=tmp_path)
+
+    # Verify
+    assert resolve.get_resolver(2020, root=tmp_path) is result
+    assert resolve.get_resolver(2021, root=tmp_path) is not result
+    assert result.scraper.year == 2020
+    assert result.__repr__() == 'PlayerResolver(Scraper(2020), max_workers=8)'
+
+    # Cleanup - none necessary
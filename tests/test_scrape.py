@@ -3,16 +3,21 @@ Unit tests for scrape.py
 """
 
 import calendar
+import io
 import json
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import numpy as np
 import pytest
+import requests
 import responses
 
-from turkey_bowl.scrape import Scraper
+from turkey_bowl import utils
+from turkey_bowl.scrape import ACTUAL_PTS_URL, Scraper, iter_player_pts
 
 logger = logging.getLogger(__name__)
 
@@ -922,3 +927,296 @@ def test_Scraper_update_player_ids_dont_exist(tmp_path):
         'team': 'NYJ',
         'injury': None,
     }
+
+
+def _mock_ngs_content(player_id: str, name: str, position: str, team: str) -> dict:
+    """Helper function for a minimal ngs-content payload."""
+    player = {
+        'playerId': player_id,
+        'name': name,
+        'position': position,
+        'nflTeamAbbr': team,
+        'injuryGameStatus': None,
+    }
+    return {'games': {'102020': {'players': {player_id: player}}}}
+
+
+@responses.activate
+def test_Scraper_update_player_ids_resumes_after_failure(tmp_path, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    tmp_dir = tmp_path.joinpath('assets')
+    tmp_dir.mkdir()
+    tmp_player_ids_json_path = tmp_dir.joinpath('player_ids.json')
+
+    players = {
+        '252': ('Chad Henne', 'QB', 'KC'),
+        '310': ('Matt Ryan', 'QB', 'ATL'),
+        '382': ('Joe Flacco', 'QB', 'NYJ'),
+    }
+    projected_player_pts = {pid: {} for pid in ('382', '252', '310')}
+    url = 'https://api.fantasy.nfl.com/v2/player/ngs-content?playerId={}'
+
+    scraper = Scraper(2020, root=tmp_path)
+
+    # First refresh: 310 fails (network blip)
+    for pid, (name, position, team) in players.items():
+        if pid == '310':
+            body = requests.exceptions.ConnectionError('network blip')
+            responses.add(method=responses.GET, url=url.format(pid), body=body)
+        else:
+            payload = _mock_ngs_content(pid, name, position, team)
+            responses.add(method=responses.GET, url=url.format(pid), json=payload)
+
+    scraper.update_player_ids(projected_player_pts)
+
+    assert tmp_player_ids_json_path.exists() is False
+    assert scraper._player_ids_need_update() is True
+    assert "1 player ids failed to update ['310']" in caplog.text
+
+    # Exercise - second refresh only retries 310
+    responses.reset()
+    name, position, team = players['310']
+    payload = _mock_ngs_content('310', name, position, team)
+    responses.add(method=responses.GET, url=url.format('310'), json=payload)
+
+    scraper.update_player_ids(projected_player_pts)
+
+    # Verify
+    assert [call.request.url for call in responses.calls] == [url.format('310')]
+    assert scraper._player_ids_need_update() is False
+    assert not scraper.dir_config.player_ids_journal_path.exists()
+
+    with open(tmp_player_ids_json_path, 'r') as written_file:
+        result = json.load(written_file)
+
+    expected = {'year': 2020}
+    for pid, (name, position, team) in players.items():
+        expected[pid] = {'name': name, 'position': position, 'team': team, 'injury': None}
+
+    assert result == expected
+    assert list(result) == list(expected)
+
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_Scraper_update_player_ids_resumes_after_interrupt(tmp_path, monkeypatch):
+    # Setup
+    tmp_dir = tmp_path.joinpath('assets')
+    tmp_dir.mkdir()
+    tmp_player_ids_json_path = tmp_dir.joinpath('player_ids.json')
+
+    # Stale player from a previous year is dropped by the refresh
+    with open(tmp_player_ids_json_path, 'w') as tmp_file:
+        json.dump({'year': 2019, '999': {'name': 'Old Player'}}, tmp_file)
+
+    players = {
+        '252': ('Chad Henne', 'QB', 'KC'),
+        '310': ('Matt Ryan', 'QB', 'ATL'),
+        '382': ('Joe Flacco', 'QB', 'NYJ'),
+    }
+    projected_player_pts = {pid: {} for pid in players}
+    url = 'https://api.fantasy.nfl.com/v2/player/ngs-content?playerId={}'
+
+    for pid, (name, position, team) in players.items():
+        payload = _mock_ngs_content(pid, name, position, team)
+        responses.add(method=responses.GET, url=url.format(pid), json=payload)
+
+    scraper = Scraper(2020, root=tmp_path)
+    get_player_record = Scraper._get_player_record
+
+    def mock_get_player_record(self, pid):
+        if pid == '382':
+            raise KeyboardInterrupt
+        return get_player_record(self, pid)
+
+    monkeypatch.setattr('turkey_bowl.scrape.Scraper._get_player_record', mock_get_player_record)
+
+    with pytest.raises(KeyboardInterrupt):
+        scraper.update_player_ids(projected_player_pts)
+
+    # Exercise
+    monkeypatch.undo()
+    responses.calls.reset()
+    scraper.update_player_ids(projected_player_pts)
+
+    # Verify
+    assert [call.request.url for call in responses.calls] == [url.format('382')]
+
+    with open(tmp_player_ids_json_path, 'r') as written_file:
+        result = json.load(written_file)
+
+    assert list(result) == ['year', '252', '310', '382']
+    assert result['year'] == 2020
+    assert result['382']['name'] == 'Joe Flacco'
+
+    # Cleanup - none necessary
+
+
+def _player_pts_payload(game_id, players, games_first=False):
+    """Helper function for a weekstats payload (optionally with games first)."""
+    games = {
+        '999': {'players': {'1': {'stats': {}}}},
+        game_id: {'players': players},
+    }
+    system_config = {'currentGameId': game_id}
+    if games_first:
+        return {'games': games, 'systemConfig': system_config}
+    return {'systemConfig': system_config, 'games': games}
+
+
+@pytest.mark.parametrize('games_first', [False, True])
+def test_iter_player_pts(games_first):
+    # Setup
+    players = {
+        '310': {'stats': {'week': {'2020': {'12': {'5': '280', 'pts': '21.2'}}}}},
+        '382': {'stats': {'week': {'2020': {'12': {'pts': '3.5'}}}}},
+    }
+    payload = _player_pts_payload('102020', players, games_first=games_first)
+    json_file = io.BytesIO(json.dumps(payload).encode())
+
+    # Exercise
+    result = list(iter_player_pts(json_file))
+
+    # Verify
+    assert result == list(players.items())
+
+    # Cleanup - none necessary
+
+
+def test_iter_player_pts_yields_before_end_of_payload():
+    # Setup
+    payload = _player_pts_payload('102020', {'310': {'stats': {}}, '382': {'stats': {}}})
+    content = json.dumps(payload).encode()
+    # Truncate right after the first player so the document is incomplete
+    json_file = io.BytesIO(content[: content.index(b'"382"')])
+
+    # Exercise
+    result = iter_player_pts(json_file)
+
+    # Verify
+    assert next(result) == ('310', {'stats': {}})
+    with pytest.raises(Exception):
+        next(result)
+
+    # Cleanup - none necessary
+
+
+def test_iter_player_pts_raises_error_without_current_game_id():
+    # Setup
+    json_file = io.BytesIO(json.dumps({'errors': [{'message': 'INVALID'}]}).encode())
+
+    # Exercise
+    with pytest.raises(ValueError, match='no systemConfig.currentGameId'):
+        list(iter_player_pts(json_file))
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_Scraper_iter_week_player_pts(caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    players = {'310': {'stats': {'week': {'2019': {'5': {'pts': '21.2'}}}}}}
+    url = f'{ACTUAL_PTS_URL}season=2019&week=5'
+    responses.add(method=responses.GET, url=url, json=_player_pts_payload('102019', players))
+    scraper = Scraper(2020)
+
+    # Exercise
+    result = scraper.iter_week_player_pts(2019, 5)
+
+    # Verify
+    assert dict(result) == players
+    assert f'Successful API response obtained for: {url}' in caplog.text
+
+    # Cleanup - none necessary
+
+
+def test_Scraper_fetch_player_pts_is_concurrent(monkeypatch):
+    # Setup
+    barrier = threading.Barrier(2)
+    calls = []
+
+    def mock_get_projected_player_pts(self):
+        barrier.wait(timeout=5)  # only passes if both requests are in flight at once
+        return {'310': {'projectedStats': {}}}
+
+    def mock_get_actual_player_pts(self):
+        barrier.wait(timeout=5)
+        return {'310': {'stats': {}}}
+
+    def mock_update_player_ids(self, projected_player_pts):
+        # Actual points arrive first but must not be handed out before this
+        time.sleep(0.05)
+        calls.append(('update_player_ids', projected_player_pts))
+
+    monkeypatch.setattr(Scraper, 'get_projected_player_pts', mock_get_projected_player_pts)
+    monkeypatch.setattr(Scraper, 'get_actual_player_pts', mock_get_actual_player_pts)
+    monkeypatch.setattr(Scraper, 'update_player_ids', mock_update_player_ids)
+    scraper = Scraper(2020)
+
+    # Exercise
+    result = list(scraper.fetch_player_pts())
+
+    # Verify
+    assert result == [
+        ('projected', {'310': {'projectedStats': {}}}),
+        ('actual', {'310': {'stats': {}}}),
+    ]
+    assert calls == [('update_player_ids', {'310': {'projectedStats': {}}})]
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'projected, actual, expected',
+    [
+        (True, False, ['projected']),
+        (False, True, ['actual']),
+        (False, False, []),
+    ],
+)
+def test_Scraper_fetch_player_pts_subset(monkeypatch, projected, actual, expected):
+    # Setup
+    monkeypatch.setattr(Scraper, 'get_projected_player_pts', lambda self: {})
+    monkeypatch.setattr(Scraper, 'get_actual_player_pts', lambda self: None)
+    monkeypatch.setattr(Scraper, 'update_player_ids', lambda self, player_pts: None)
+    scraper = Scraper(2020)
+
+    # Exercise
+    result = scraper.fetch_player_pts(projected=projected, actual=actual)
+
+    # Verify
+    assert [stats_kind for stats_kind, _ in result] == expected
+
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_Scraper_update_player_ids_gives_up_on_missing_player(tmp_path, caplog):
+    # Setup
+    caplog.set_level(logging.INFO)
+    tmp_dir = tmp_path.joinpath('assets')
+    tmp_dir.mkdir()
+    url = 'https://api.fantasy.nfl.com/v2/player/ngs-content?playerId={}'
+
+    payload = _mock_ngs_content('252', 'Chad Henne', 'QB', 'KC')
+    responses.add(method=responses.GET, url=url.format('252'), json=payload)
+    # 310 is unknown to the API (a permanent failure)
+    errors = {'errors': [{'message': 'Player not found'}]}
+    responses.add(method=responses.GET, url=url.format('310'), json=errors)
+
+    scraper = Scraper(2020, root=tmp_path)
+
+    # Exercise
+    scraper.update_player_ids({'252': {}, '310': {}})
+
+    # Verify - the refresh completes without 310
+    assert scraper._player_ids_need_update() is False
+    assert not scraper.dir_config.player_ids_journal_path.exists()
+    assert list(utils.load_from_json(tmp_dir.joinpath('player_ids.json'))) == ['year', '252']
+    assert "Gave up on 1 player ids ['310']" in caplog.text
+
+    # Cleanup - none necessary
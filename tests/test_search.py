@@ -0,0 +1,186 @@
+"""
+Unit tests for search.py
+"""
+
+import pandas as pd
+import pytest
+
+from turkey_bowl import utils
+from turkey_bowl.search import Match, PlayerEntry, PlayerIndex, normalize_name, unambiguous_match
+
+PLAYER_IDS = {
+    'year': 2023,
+    '2566073': {'name': 'Amon-Ra St. Brown', 'position': 'WR', 'team': 'DET', 'injury': None},
+    '2562238': {'name': 'A.J. Brown', 'position': 'WR', 'team': 'PHI', 'injury': None},
+    '2566025': {'name': 'Baron Browning', 'position': 'LB', 'team': 'DEN', 'injury': None},
+    '2540258': {'name': 'Travis Kelce', 'position': 'TE', 'team': 'KC', 'injury': None},
+    '2495454': {'name': 'Jason Kelce', 'position': 'OL', 'team': 'PHI', 'injury': None},
+    '2543700': {'name': 'Odell Beckham Jr.', 'position': 'WR', 'team': 'BAL', 'injury': None},
+    '2558125': {'name': 'Patrick Mahomes', 'position': 'QB', 'team': 'KC', 'injury': None},
+}
+
+PROJECTED_PLAYER_PTS_DF = pd.DataFrame(
+    {
+        'Player': ['Amon-Ra St. Brown', 'A.J. Brown', 'Travis Kelce', 'Patrick Mahomes'],
+        'Team': ['DET', 'PHI', 'KC', 'KC'],
+        'PROJ_pts': [16.5, 18.2, 12.1, 21.3],
+    }
+)
+
+
+@pytest.fixture
+def player_index():
+    return PlayerIndex.from_player_ids(PLAYER_IDS, PROJECTED_PLAYER_PTS_DF)
+
+
+@pytest.mark.parametrize(
+    'name, expected',
+    [
+        ('Amon-Ra St. Brown', 'amon ra st brown'),
+        ('  AMON RA  st brown ', 'amon ra st brown'),
+        ('Odell Beckham Jr.', 'odell beckham'),
+        ("Ja'Marr Chase", 'jamarr chase'),
+        ('C.J. Stroud', 'cj stroud'),
+        ('Zoë Ramírez III', 'zoe ramirez'),
+        ('Jr.', 'jr'),
+    ],
+)
+def test_normalize_name(name, expected):
+    # Setup - none necessary
+
+    # Exercise
+    result = normalize_name(name)
+
+    # Verify
+    assert result == expected
+
+    # Cleanup - none necessary
+
+
+def test_PlayerIndex_from_player_ids(player_index):
+    # Setup - none necessary
+
+    # Exercise
+    result = {entry.name: entry.proj_pts for entry in player_index.entries}
+
+    # Verify
+    assert len(player_index) == 7
+    assert player_index.__repr__() == 'PlayerIndex(7 players)'
+    assert result['Patrick Mahomes'] == 21.3
+    assert result['Jason Kelce'] == 0.0
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'query, expected',
+    [
+        ('brown', ['A.J. Brown', 'Amon-Ra St. Brown', 'Baron Browning']),
+        ('st br', ['Amon-Ra St. Brown']),
+        ('KELCE', ['Travis Kelce', 'Jason Kelce']),
+        ('beckham jr', ['Odell Beckham Jr.']),
+        ('', []),
+        ('zzz', []),
+    ],
+)
+def test_PlayerIndex_prefix(player_index, query, expected):
+    # Setup - none necessary
+
+    # Exercise
+    result = player_index.prefix(query)
+
+    # Verify
+    assert [match.entry.name for match in result] == expected
+
+    # Cleanup - none necessary
+
+
+def test_PlayerIndex_prefix_filters(player_index):
+    # Setup - none necessary
+
+    # Exercise
+    result = player_index.prefix('kelce', team='PHI')
+
+    # Verify
+    assert [match.entry.player_id for match in result] == ['2495454']
+    assert player_index.prefix('brown', limit=1, position='WR')[0].entry.name == 'A.J. Brown'
+
+    # Cleanup - none necessary
+
+
+def test_PlayerIndex_fuzzy(player_index):
+    # Setup - none necessary
+
+    # Exercise
+    result = player_index.fuzzy('Aman Ra St Brown')
+
+    # Verify
+    assert result[0].entry.name == 'Amon-Ra St. Brown'
+    assert 0.4 <= result[-1].score < result[0].score < 1.0
+    assert player_index.fuzzy('Patrik Mahommes', limit=1)[0].entry.name == 'Patrick Mahomes'
+    assert player_index.fuzzy('Aman Ra St Brown', team='PHI', min_score=0.8) == []
+
+    # Cleanup - none necessary
+
+
+def test_PlayerIndex_find(player_index):
+    # Setup - none necessary
+
+    # Exercise
+    result = player_index.find('travis kelse')
+
+    # Verify - no prefix match, so fuzzy
+    assert [match.entry.name for match in result] == ['Travis Kelce']
+    assert [m.entry.name for m in player_index.find('brow', limit=2)] == [
+        'A.J. Brown',
+        'Amon-Ra St. Brown',
+    ]
+    assert [m.entry.name for m in player_index.find('mahomes')] == ['Patrick Mahomes']
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'query, scores, expected',
+    [
+        ('kelce', [1.0], 'Travis Kelce'),
+        ('kelce', [1.0, 1.0], None),
+        ('travis kelce', [1.0, 1.0], 'Travis Kelce'),
+        ('travis kelce', [0.8, 0.6], 'Travis Kelce'),
+        ('trav kelce', [0.8, 0.7], None),
+    ],
+    ids=['only_match', 'tie', 'exact_name', 'margin', 'within_margin'],
+)
+def test_unambiguous_match(query, scores, expected):
+    # Setup
+    entries = [
+        PlayerEntry('2540258', 'Travis Kelce', 'KC', 'TE'),
+        PlayerEntry('2495454', 'Jason Kelce', 'PHI', 'OL'),
+    ]
+    matches = [Match(entry, score) for entry, score in zip(entries, scores)]
+
+    # Exercise
+    result = unambiguous_match(query, matches)
+
+    # Verify
+    assert (result and result.entry.name) == expected
+
+    # Cleanup - none necessary
+
+
+def test_PlayerIndex_from_dir_config(tmp_path):
+    # Setup
+    dir_config = utils.load_dir_config(2023, tmp_path)
+    dir_config.player_ids_json_path.parent.mkdir(parents=True)
+    utils.write_to_json(PLAYER_IDS, dir_config.player_ids_json_path)
+    projected_path = tmp_path.joinpath('projected.csv')
+    PROJECTED_PLAYER_PTS_DF.to_csv(projected_path)
+
+    # Exercise
+    result = PlayerIndex.from_dir_config(dir_config, projected_path)
+
+    # Verify
+    assert result.prefix('brown', limit=1)[0].entry.proj_pts == 18.2
+    assert len(PlayerIndex.from_dir_config(dir_config, tmp_path.joinpath('missing.csv'))) == 7
+
+    # Cleanup - none necessary
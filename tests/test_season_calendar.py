@@ -0,0 +1,129 @@
+"""
+Unit tests for season_calendar.py
+"""
+
+import calendar
+import threading
+from datetime import date, datetime
+
+import pytest
+
+from turkey_bowl import season_calendar
+
+
+def _reference_thanksgiving_week(year):
+    """Helper function with the original ``calendar.monthcalendar`` computation."""
+    sept = calendar.Calendar(calendar.SUNDAY).monthdayscalendar(year, 9)
+    sept_first_monday = min(week[1] for week in sept if week[1] != 0)
+    nov = calendar.Calendar(calendar.SUNDAY).monthdayscalendar(year, 11)
+    thanksgiving_day = [week[4] for week in nov if week[4] != 0][3]
+
+    nfl_start = datetime(year, 9, sept_first_monday).isocalendar()[1]
+    thanksgiving_start = datetime(year, 11, thanksgiving_day).isocalendar()[1]
+
+    return nfl_start, thanksgiving_start, thanksgiving_start - nfl_start + 1
+
+
+@pytest.mark.parametrize(
+    'season, labor_day, thanksgiving_day, expected_week',
+    [
+        (2018, date(2018, 9, 3), date(2018, 11, 22), 12),
+        (2019, date(2019, 9, 2), date(2019, 11, 28), 13),
+        (2020, date(2020, 9, 7), date(2020, 11, 26), 12),
+        (2024, date(2024, 9, 2), date(2024, 11, 28), 13),
+    ],
+)
+def test_season_calendar(season, labor_day, thanksgiving_day, expected_week):
+    # Setup - none necessary
+
+    # Exercise
+    result = season_calendar.season_calendar(season)
+
+    # Verify
+    assert result.labor_day == labor_day
+    assert result.thanksgiving_day == thanksgiving_day
+    assert result.thanksgiving_week == expected_week
+    assert season_calendar.thanksgiving_week(season) == expected_week
+
+    # Cleanup - none necessary
+
+
+def test_compute_season_calendars_matches_calendar_module():
+    # Setup
+    seasons = range(1950, 2101)
+
+    # Exercise
+    result = season_calendar.compute_season_calendars(seasons)
+
+    # Verify
+    assert sorted(result) == list(seasons)
+    for season, cal in result.items():
+        assert (
+            cal.nfl_calendar_week_start,
+            cal.thanksgiving_calendar_week_start,
+            cal.thanksgiving_week,
+        ) == _reference_thanksgiving_week(season)
+
+    # Cleanup - none necessary
+
+
+def test_season_calendar_doesnt_change_firstweekday():
+    # Setup
+    calendar.setfirstweekday(calendar.MONDAY)
+
+    # Exercise
+    season_calendar.compute_season_calendars([2031])
+
+    # Verify
+    assert calendar.firstweekday() == calendar.MONDAY
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'day, expected_season, expected_week',
+    [
+        (date(2020, 9, 10), 2020, 1),
+        (datetime(2020, 11, 26, 12, 30), 2020, 12),
+        (date(2020, 12, 28), 2020, 17),
+        (date(2021, 1, 3), 2020, 17),
+        (date(2021, 1, 4), 2020, 18),
+        (date(2020, 8, 31), 2020, 0),
+    ],
+)
+def test_nfl_week(day, expected_season, expected_week):
+    # Setup - none necessary
+
+    # Exercise
+    result = season_calendar.nfl_week(day)
+
+    # Verify
+    assert season_calendar.season_for(day) == expected_season
+    assert result == expected_week
+
+    # Cleanup - none necessary
+
+
+def test_season_calendars_threadsafe():
+    # Setup
+    seasons = list(range(2100, 2140))
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait(timeout=5)
+        results.append(season_calendar.season_calendars(seasons))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+
+    # Exercise
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Verify
+    assert len(results) == 8
+    assert all(result == results[0] for result in results)
+
+    # Cleanup - none necessary
@@ -0,0 +1,111 @@
+"""
+Unit tests for shared_points.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from turkey_bowl import shared_points
+
+
+@pytest.fixture
+def player_pts_df():
+    return pd.DataFrame(
+        {
+            'Player_ID': pd.array([310, 2558116, 100005], dtype='int64'),
+            'Player': ['Matt Ryan', 'Aaron Jones', 'Chicago Bears'],
+            'Team': ['ATL', 'GB', 'CHI'],
+            'PROJ_Position': ['QB', 'RB', 'DEF'],
+            'PROJ_pts': [18.5, 12.25, 7.0],
+            'PROJ_Passing_Yards': [275.0, 0.0, 0.0],
+            'PROJ_Rushing_Yards': [3.0, 80.0, 0.0],
+        }
+    )
+
+
+def test_publish_and_attach(player_pts_df):
+    # Setup - none necessary
+
+    # Exercise
+    with shared_points.publish(player_pts_df) as handle:
+        table = shared_points.attach(handle)
+        result = table.frame()
+
+        # Verify
+        assert handle.shape == (3, 3)
+        assert handle.columns == ['PROJ_pts', 'PROJ_Passing_Yards', 'PROJ_Rushing_Yards']
+        assert handle.index.columns.tolist() == ['Player_ID', 'Player', 'Team', 'PROJ_Position']
+        pd.testing.assert_frame_equal(result, player_pts_df)
+        assert np.shares_memory(result['PROJ_pts'].to_numpy(), table.values)
+        assert len(table) == 3
+
+        del result
+        table.close()
+
+    # Cleanup - none necessary
+
+
+def test_SharedPointsTable_rows(player_pts_df):
+    # Setup - none necessary
+
+    # Exercise
+    with shared_points.publish(player_pts_df) as handle:
+        table = shared_points.attach(handle)
+        result = table.rows([100005, 310, 1])
+        table.close()
+
+    # Verify - table order, unknown ids ignored, rows outlive the shared block
+    assert result['Player'].tolist() == ['Matt Ryan', 'Chicago Bears']
+    assert result['PROJ_Rushing_Yards'].tolist() == [3.0, 0.0]
+    assert result.columns.tolist() == player_pts_df.columns.tolist()
+
+    # Cleanup - none necessary
+
+
+def test_publish_frees_shared_block(player_pts_df):
+    # Setup
+    with shared_points.publish(player_pts_df) as handle:
+        pass
+
+    # Exercise
+    with pytest.raises(FileNotFoundError):
+        shared_points.attach(handle)
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+def test_SharedPointsTable_close_with_live_view(player_pts_df):
+    # Setup
+    with shared_points.publish(player_pts_df) as handle:
+        table = shared_points.attach(handle)
+        pts = table.frame()['PROJ_pts'].to_numpy()
+
+        # Exercise
+        with pytest.raises(BufferError, match=r'1 view\(s\) of it still in use'):
+            table.close()
+
+        # Verify - the block is still mapped until the view is released
+        assert pts.tolist() == [18.5, 12.25, 7.0]
+        del pts
+        table.close()
+        assert table.n_views == 0
+
+    # Cleanup - none necessary
+
+
+def test_SharedPointsTable_index_with(player_pts_df):
+    # Setup - none necessary
+
+    # Exercise
+    with shared_points.publish(player_pts_df) as handle:
+        table = shared_points.attach(handle)
+        result = table.index_with(['PROJ_pts'])
+        table.close()
+
+    # Verify - copies, so they outlive the shared block
+    assert result.columns.tolist() == ['Player_ID', 'Player', 'Team', 'PROJ_Position', 'PROJ_pts']
+    assert result['PROJ_pts'].tolist() == [18.5, 12.25, 7.0]
+
+    # Cleanup - none necessary
@@ -0,0 +1,119 @@
+"""
+Unit tests for simulate.py
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from turkey_bowl import simulate
+from turkey_bowl.search import PlayerEntry
+
+SLOTS = ['QB', 'WR_1', 'Bench (RB/WR/TE)']
+
+PLAYERS = [
+    PlayerEntry('1', 'QB One', 'KC', 'QB', 20.0),
+    PlayerEntry('2', 'QB Two', 'DET', 'QB', 18.0),
+    PlayerEntry('3', 'QB Three', 'SF', 'QB', 15.0),
+    PlayerEntry('4', 'WR One', 'DET', 'WR', 17.0),
+    PlayerEntry('5', 'WR Two', 'PHI', 'WR', 16.0),
+    PlayerEntry('6', 'WR Three', 'DAL', 'WR', 12.0),
+    PlayerEntry('7', 'TE One', 'KC', 'TE', 11.0),
+    PlayerEntry('8', 'RB One', 'GB', 'RB', 10.0),
+    PlayerEntry('9', 'RB Two', 'GB', 'RB', 0.0),  # no projection
+]
+
+ACTUAL_PTS = {'1': 25.0, '2': 10.0, '4': 20.0, '5': 8.0, '7': 30.0}
+
+
+def test_get_strategy_raises_error():
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match="Unrecognized strategy: 'greedy'"):
+        simulate.get_strategy('greedy')
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+def test_mock_draft_best_available():
+    # Setup - none necessary
+
+    # Exercise
+    result = simulate.mock_draft(
+        PLAYERS, ['best_available', 'best_available'], random.Random(0), SLOTS
+    )
+
+    # Verify
+    assert result.rosters == {
+        '1': {'QB': '1', 'WR_1': '5', 'Bench (RB/WR/TE)': '6'},
+        '2': {'QB': '2', 'WR_1': '4', 'Bench (RB/WR/TE)': '7'},
+    }
+    assert simulate.roster_pts(result, ACTUAL_PTS) == {'1': 33.0, '2': 30.0}
+
+    # Cleanup - none necessary
+
+
+def test_mock_draft_raises_error_without_enough_players():
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match='Not enough players for 4 rosters of 3'):
+        simulate.mock_draft(PLAYERS[:8], ['noisy'] * 4, random.Random(0), SLOTS)
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+def test_simulate_is_deterministic():
+    # Setup
+    kwargs = dict(n_sims=30, seed=7, actual_pts=ACTUAL_PTS, slots=SLOTS)
+
+    # Exercise
+    inline = simulate.simulate(PLAYERS, ['noisy', 'best_available'], max_workers=1, **kwargs)
+    pooled = simulate.simulate(
+        PLAYERS, ['noisy', 'best_available'], max_workers=2, chunk_size=7, **kwargs
+    )
+
+    # Verify
+    pd.testing.assert_frame_equal(pooled, inline)
+    assert len(inline) == 60
+    assert inline.columns.tolist() == ['sim', 'draft_slot', 'strategy', 'PROJ_pts', 'ACTUAL_pts']
+    assert inline['PROJ_pts'].nunique() > 1
+    assert not inline.equals(simulate.simulate(PLAYERS, ['noisy'] * 2, max_workers=1, **kwargs))
+
+    # Cleanup - none necessary
+
+
+def test_summarize():
+    # Setup
+    results = pd.DataFrame(
+        {
+            'sim': [0, 0, 1, 1, 2, 2],
+            'draft_slot': [1, 2, 1, 2, 1, 2],
+            'PROJ_pts': [30.0, 20.0, 25.0, 25.0, 10.0, 40.0],
+            'ACTUAL_pts': [1.0, 0.0, 2.0, 0.0, 3.0, 0.0],
+        }
+    )
+
+    # Exercise
+    result = simulate.summarize(results)
+
+    # Verify
+    assert result.index.tolist() == [1, 2]
+    assert result['PROJ_mean'].tolist() == [21.667, 28.333]
+    assert result['PROJ_win_rate'].tolist() == [0.5, 0.5]  # tied in sim 1
+    assert result['ACTUAL_win_rate'].tolist() == [1.0, 0.0]
+    assert result['PROJ_p50'].tolist() == [25.0, 25.0]
+    assert result.columns.tolist()[:6] == [
+        'PROJ_mean',
+        'PROJ_std',
+        'PROJ_p10',
+        'PROJ_p50',
+        'PROJ_p90',
+        'PROJ_win_rate',
+    ]
+
+    # Cleanup - none necessary
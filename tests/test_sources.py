@@ -0,0 +1,142 @@
+"""
+Unit tests for sources.py
+"""
+
+import pytest
+import responses
+
+from turkey_bowl import sources, utils
+from turkey_bowl.scrape import Scraper
+from turkey_bowl.sources import FileSource, NFLSource, ReplaySource
+
+PLAYER_PTS = {'310': {'projectedStats': {'week': {'2020': {'12': {'pts': '9.96'}}}}}}
+PLAYER_IDS = {
+    'year': 2020,
+    '310': {'name': 'Matt Ryan', 'position': 'QB', 'team': 'ATL', 'injury': None},
+}
+
+
+@pytest.fixture
+def file_source_dir(tmp_path):
+    """Directory with one stored week of players and one recorded payload."""
+    projected_path = sources.week_path(tmp_path, 2020, 12, 'projectedStats')
+    projected_path.parent.mkdir(parents=True)
+    utils.write_to_json(PLAYER_PTS, projected_path)
+
+    payload = {
+        'systemConfig': {'currentGameId': '102020'},
+        'games': {'102020': {'players': {'310': {'stats': {}}}}},
+    }
+    utils.write_to_json(payload, sources.week_path(tmp_path, 2020, 12, 'stats'))
+    utils.write_to_json(PLAYER_IDS, tmp_path.joinpath('player_ids.json'))
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    'spec, expected_type, expected_repr',
+    [
+        ('nfl', NFLSource, "NFLSource('https://api.fantasy.nfl.com/v2')"),
+        ('nfl:http://localhost:1/v2/', NFLSource, "NFLSource('http://localhost:1/v2')"),
+        ('replay', ReplaySource, "ReplaySource('http://127.0.0.1:8080/v2')"),
+        ('replay:http://localhost:9/v2', ReplaySource, "ReplaySource('http://localhost:9/v2')"),
+        ('file:fixtures', FileSource, "FileSource('fixtures')"),
+    ],
+)
+def test_get_source(spec, expected_type, expected_repr):
+    # Setup - none necessary
+
+    # Exercise
+    result = sources.get_source(spec)
+
+    # Verify
+    assert type(result) is expected_type
+    assert result.__repr__() == expected_repr
+
+    # Cleanup - none necessary
+
+
+def test_get_source_from_environment(tmp_path, monkeypatch):
+    # Setup
+    monkeypatch.setenv('TURKEY_BOWL_SOURCE', 'file')
+    dir_config = utils.load_dir_config(2020, tmp_path)
+
+    # Exercise
+    result = sources.get_source(dir_config=dir_config)
+
+    # Verify
+    assert isinstance(result, FileSource)
+    assert result.directory == dir_config.backfill_dir
+    assert result.player_ids_path == dir_config.player_ids_json_path
+    assert isinstance(Scraper(2020, root=tmp_path).source, FileSource)
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize(
+    'spec, expected_error',
+    [
+        ('espn', "Unrecognized source: 'espn'. Expected one of ['nfl', 'replay', 'file']."),
+        ('file', "The 'file' source needs a directory"),
+    ],
+)
+def test_get_source_raises_error(spec, expected_error):
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError) as error_info:
+        sources.get_source(spec)
+
+    # Verify
+    assert str(error_info.value).startswith(expected_error)
+
+    # Cleanup - none necessary
+
+
+def test_NFLSource_base_url_from_environment(monkeypatch):
+    # Setup
+    monkeypatch.setenv('TURKEY_BOWL_BASE_URL', 'http://127.0.0.1:1234/v2')
+
+    # Exercise
+    result = NFLSource().pts_url(2020, 12, projected=True)
+
+    # Verify
+    assert result == 'http://127.0.0.1:1234/v2/players/weekprojectedstats?season=2020&week=12'
+
+    # Cleanup - none necessary
+
+
+@responses.activate
+def test_FileSource_scraper_never_touches_network(file_source_dir):
+    # Setup
+    scraper = Scraper(2020, root=file_source_dir, source=f'file:{file_source_dir}')
+
+    # Exercise
+    projected = scraper.get_projected_player_pts()
+    actual = dict(scraper.iter_week_player_pts())
+    player_record = scraper._get_player_record('310')
+
+    # Verify
+    assert projected == PLAYER_PTS
+    assert actual == {'310': {'stats': {}}}
+    assert player_record == PLAYER_IDS['310']
+    assert scraper.projected_pts_url.startswith('file://')
+    assert len(responses.calls) == 0
+
+    # Cleanup - none necessary
+
+
+def test_FileSource_missing_data(file_source_dir):
+    # Setup
+    source = FileSource(file_source_dir)
+
+    # Exercise
+    with pytest.raises(ValueError, match='No stats stored for 2020 week 13'):
+        source.get_player_pts(2020, 13)
+
+    # Verify
+    assert source.get_player_metadata('999') == 'PLAYER_INVALID'
+    assert source.get_player_metadata('year') == 'PLAYER_INVALID'
+    assert source.get_player_metadata('310')['nflTeamAbbr'] == 'ATL'
+
+    # Cleanup - none necessary
@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from turkey_bowl import aggregate
+from turkey_bowl import aggregate, utils
 from turkey_bowl.turkey_bowl_runner import main
 
 logger = logging.getLogger(__name__)
@@ -283,6 +283,7 @@ def test_MockDraft(
     freezer,
     tmp_path,
     monkeypatch,
+    caplog,
     mock_participant_teams,
     mock_projected_player_pts_df,
     mock_actual_player_pts_df,
@@ -319,6 +320,34 @@ def test_MockDraft(
         for participant, participant_team in participant_teams.items():
             participant_team.to_excel(writer, sheet_name=participant.title(), index=False)
 
+    # Player ids of the projected players (positions from the slots they were drafted in)
+    positions = {
+        (row.Player, row.Team): row.Position.split('_')[0].replace('Defense (Team Name)', 'DEF')
+        for participant_team in participant_teams.values()
+        for row in participant_team.itertuples()
+    }
+    player_ids = {'year': 2005}
+    for pid, row in enumerate(projected_player_pts_df.itertuples(), start=1):
+        position = positions.get((row.Player, row.Team), 'WR')
+        player_ids[str(pid)] = {
+            'name': row.Player,
+            'position': 'WR' if position.startswith(('Flex', 'Bench')) else position,
+            'team': row.Team,
+        }
+    pids = {(v['name'], v['team']): int(k) for k, v in player_ids.items() if k != 'year'}
+
+    # Randall Cobb (drafted for DAL, projected for HOU) is left out so his
+    # row stays unmatched and scores NaN
+    player_ids = {k: v for k, v in player_ids.items() if k == 'year' or v['name'] != 'Randall Cobb'}
+    tmp_path.joinpath('assets').mkdir()
+    with open(tmp_path.joinpath('assets/player_ids.json'), 'w') as f:
+        json.dump(player_ids, f)
+
+    for player_pts_df in (projected_player_pts_df, actual_player_pts_df):
+        player_pts_df.insert(
+            0, 'Player_ID', [pids[key] for key in zip(player_pts_df.Player, player_pts_df.Team)]
+        )
+
     projected_player_pts_df.to_csv(
         tmp_archive_year_path.joinpath('2005_12_projected_player_pts.csv')
     )
@@ -327,11 +356,7 @@ def test_MockDraft(
     # Mock Draft.__init__ so data saved to tmp_path
     def mock_init(self, year):
         self.year = year
-        self.dir_config = SimpleNamespace(
-            output_dir=tmp_archive_year_path,
-            draft_order_path=tmp_archive_year_path.joinpath('2005_draft_order.json'),
-            draft_sheet_path=tmp_archive_year_path.joinpath('2005_draft_sheet.xlsx'),
-        )
+        self.dir_config = utils.load_dir_config(year, root=tmp_path)
 
     monkeypatch.setattr('turkey_bowl.draft.Draft.__init__', mock_init)
 
@@ -355,8 +380,8 @@ def test_MockDraft(
     # monkeypatch.setattr("scrape.Scraper.update_player_ids", mock_update_player_ids)
 
     # Mock aggregate.create_players_pts_df to return testing dataframe asset
-    def mock_create_player_pts_df(year, week, player_pts, savepath):
-        stats_type = aggregate._get_player_pts_stat_type(player_pts)
+    def mock_create_player_pts_df(year, week, player_pts, savepath, names=True):
+        stats_type = aggregate._check_stats_types({next(iter(v)) for v in player_pts.values()})
 
         # if stats_type == "projectedStats":
         #     player_pts_df = pd.read_csv(
@@ -375,11 +400,15 @@ def test_MockDraft(
     monkeypatch.setattr('turkey_bowl.aggregate.create_player_pts_df', mock_create_player_pts_df)
 
     # Exercise
+    caplog.set_level(logging.INFO)
     main()
 
     # Verify pandas display
     assert pd.options.display.width is None
 
+    # Verify points were merged on the reconciled Player_ID
+    assert 'No Player_ID to merge points on' not in caplog.text
+
     # Verify draft order
     assert tmp_archive_year_path.joinpath('2005_draft_order.json').exists()
     with open(tmp_archive_year_path.joinpath('2005_draft_order.json'), 'r') as f:
@@ -412,6 +441,8 @@ def test_MockDraft(
         engine='openpyxl',
     )
     for p, df in written_robust_participant_player_pts.items():
+        # Player_ID is the key reconcile adds to the drafted rows
+        df = df.drop(columns='Player_ID')
         col_types = {}
         for c in df.columns:
             if c in ('Player', 'Team', 'Position'):
@@ -195,3 +195,57 @@ def test_logger_format_INFO(tmp_path, freezer, caplog):
 
     # Verify
     assert caplog.record_tuples == [('test_utils', logging.INFO, 'testing')]
+
+
+def test_atomic_path(tmp_path):
+    # Setup
+    tmp_file_path = tmp_path.joinpath('test.txt')
+    tmp_file_path.write_text('old')
+
+    # Exercise
+    with utils.atomic_path(tmp_file_path) as tmp_write_path:
+        tmp_write_path.write_text('new')
+        assert tmp_write_path.name == 'test.txt'
+        assert tmp_file_path.read_text() == 'old'  # untouched until the block exits
+
+    # Verify
+    assert tmp_file_path.read_text() == 'new'
+    assert list(tmp_path.iterdir()) == [tmp_file_path]
+
+    # Cleanup - none necessary
+
+
+def test_atomic_path_replaces_directory(tmp_path):
+    # Setup
+    tmp_dir_path = tmp_path.joinpath('outputs')
+    tmp_dir_path.mkdir()
+    tmp_dir_path.joinpath('stale.csv').write_text('old')
+
+    # Exercise
+    with utils.atomic_path(tmp_dir_path) as tmp_write_path:
+        tmp_write_path.mkdir()
+        tmp_write_path.joinpath('fresh.csv').write_text('new')
+
+    # Verify
+    assert [p.name for p in tmp_dir_path.iterdir()] == ['fresh.csv']
+    assert list(tmp_path.iterdir()) == [tmp_dir_path]
+
+    # Cleanup - none necessary
+
+
+def test_atomic_path_failure(tmp_path):
+    # Setup
+    tmp_file_path = tmp_path.joinpath('test.txt')
+    tmp_file_path.write_text('old')
+
+    # Exercise
+    with pytest.raises(RuntimeError):
+        with utils.atomic_path(tmp_file_path) as tmp_write_path:
+            tmp_write_path.write_text('half')
+            raise RuntimeError('interrupted')
+
+    # Verify
+    assert tmp_file_path.read_text() == 'old'
+    assert list(tmp_path.iterdir()) == [tmp_file_path]
+
+    # Cleanup - none necessary
@@ -0,0 +1,231 @@
+"""
+Unit tests for warehouse.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from turkey_bowl import aggregate, backfill, warehouse
+from turkey_bowl.warehouse import StatsWarehouse
+
+PLAYER_IDS = {
+    '2555334': {'name': 'Jared Goff', 'position': 'QB', 'team': 'DET', 'injury': None},
+    '2568216': {'name': 'Brock Purdy', 'position': 'QB', 'team': 'SF', 'injury': None},
+    '2560757': {'name': 'CeeDee Lamb', 'position': 'WR', 'team': 'DAL', 'injury': None},
+}
+STAT_DEFNS = {'5': 'Passing_Yards', '20': 'Receiving_Yards'}
+
+
+def _mock_player_pts(season, week, stats_type='stats', scale=1.0):
+    """Helper function for a weekstats payload of PLAYER_IDS."""
+    stats = {
+        '2555334': {'5': '296.77', 'pts': '20.01'},
+        '2568216': {'5': '16.93', 'pts': '0.84'},
+        '2560757': {'20': '110', 'pts': '17.0'},
+    }
+    return {
+        pid: {
+            stats_type: {
+                'week': {str(season): {str(week): {k: str(float(v) * scale) for k, v in s.items()}}}
+            }
+        }
+        for pid, s in stats.items()
+    }
+
+
+@pytest.fixture
+def tmp_warehouse(tmp_path):
+    store = StatsWarehouse(tmp_path.joinpath('warehouse'))
+    sink = store.sink(PLAYER_IDS, STAT_DEFNS)
+
+    for season, week in ((2022, 12), (2022, 13), (2023, 12)):
+        sink(season, week, 'stats', _mock_player_pts(season, week, scale=week / 12))
+
+    return store
+
+
+def test_frame_from_player_pts():
+    # Setup
+    player_pts = _mock_player_pts(2023, 12)
+    player_pts['999'] = {'stats': {'week': {'2023': {'12': {'pts': '1.5'}}}}}
+
+    # Exercise
+    result = warehouse.frame_from_player_pts(2023, 12, player_pts, PLAYER_IDS, STAT_DEFNS)
+
+    # Verify
+    assert result.columns.tolist() == [
+        'player_id',
+        'Player',
+        'Team',
+        'Position',
+        'pts',
+        'Passing_Yards',
+        'Receiving_Yards',
+    ]
+    assert result['player_id'].tolist() == [2555334, 2568216, 2560757, 999]
+    assert result['Player'].tolist() == ['Jared Goff', 'Brock Purdy', 'CeeDee Lamb', None]
+    assert result['pts'].tolist() == [20.01, 0.84, 17.0, 1.5]
+    assert np.isnan(result.loc[2, 'Passing_Yards'])
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_path(tmp_path):
+    # Setup
+    store = StatsWarehouse(tmp_path)
+
+    # Exercise
+    result = store.path(2023, 12, 'projectedStats')
+
+    # Verify
+    assert result == tmp_path.joinpath('season=2023/week=12/projected.parquet')
+    assert store.path(2023, 12, 'actual') == tmp_path.joinpath('season=2023/week=12/actual.parquet')
+    assert store.__repr__() == f"StatsWarehouse('{tmp_path}')"
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_path_raises_error_for_unknown_stats_type(tmp_path):
+    # Setup
+    store = StatsWarehouse(tmp_path)
+
+    # Exercise
+    with pytest.raises(ValueError, match="Unrecognized stats type: 'bogus'"):
+        store.path(2023, 12, 'bogus')
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_partitions(tmp_warehouse):
+    # Setup - none necessary
+
+    # Exercise
+    result = tmp_warehouse.partitions(seasons=[2022])
+
+    # Verify
+    assert [(season, week) for season, week, _ in result] == [(2022, 12), (2022, 13)]
+    assert tmp_warehouse.partitions('projected') == []
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_query_columns_and_filters(tmp_warehouse):
+    # Setup - none necessary
+
+    # Exercise
+    result = tmp_warehouse.query(
+        columns=['Player', 'Passing_Yards', 'Rushing_Yards'],
+        weeks=[12],
+        filters=[('Position', '==', 'QB')],
+    )
+
+    # Verify
+    assert result.columns.tolist() == ['season', 'week', 'Player', 'Passing_Yards', 'Rushing_Yards']
+    assert result['season'].tolist() == [2022, 2022, 2023, 2023]
+    assert result['Player'].tolist() == ['Jared Goff', 'Brock Purdy'] * 2
+    assert result['Rushing_Yards'].isna().all()
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_query_empty(tmp_path):
+    # Setup
+    store = StatsWarehouse(tmp_path)
+
+    # Exercise
+    result = store.query(columns=['Player', 'pts'])
+
+    # Verify
+    assert result.empty
+    assert result.columns.tolist() == ['season', 'week', 'Player', 'pts']
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_top_n(tmp_warehouse):
+    # Setup - none necessary
+
+    # Exercise
+    result = tmp_warehouse.top_n(2022, 13, n=2)
+
+    # Verify
+    assert result['Player'].tolist() == ['Jared Goff', 'CeeDee Lamb']
+    assert tmp_warehouse.top_n(2022, 13, n=5, position='WR')['Player'].tolist() == ['CeeDee Lamb']
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_player_history(tmp_warehouse):
+    # Setup - none necessary (Thanksgiving is week 12 in 2022 and 2023)
+
+    # Exercise
+    result = tmp_warehouse.player_history('Jared Goff', columns=['Passing_Yards'])
+
+    # Verify
+    assert result[['season', 'week']].values.tolist() == [[2022, 12], [2023, 12]]
+    assert result['Passing_Yards'].tolist() == [296.77, 296.77]
+
+    every_week = tmp_warehouse.player_history(2555334, thanksgiving_only=False)
+    assert every_week[['season', 'week']].values.tolist() == [[2022, 12], [2022, 13], [2023, 12]]
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_thanksgiving_pts(tmp_warehouse):
+    # Setup - none necessary (week 13 of 2022 is not Thanksgiving)
+
+    # Exercise
+    result = tmp_warehouse.thanksgiving_pts()
+
+    # Verify
+    assert result.to_dict() == {2555334: 20.01, 2560757: 17.0, 2568216: 0.84}
+    assert tmp_warehouse.thanksgiving_pts('projected').empty
+
+    # Cleanup - none necessary
+
+
+def test_StatsWarehouse_sink_with_backfill_tee(tmp_path):
+    # Setup
+    store = StatsWarehouse(tmp_path.joinpath('warehouse'))
+    json_store = backfill.JSONWeekStore(tmp_path.joinpath('backfill'))
+    sink = backfill.tee(json_store, store.sink(PLAYER_IDS, STAT_DEFNS))
+
+    # Exercise
+    sink(2023, 12, 'projectedStats', _mock_player_pts(2023, 12, 'projectedStats'))
+
+    # Verify
+    assert json_store.exists(2023, 12, 'projectedStats')
+    result = store.query(stats_type='projectedStats')
+    assert result['pts'].tolist() == [20.01, 0.84, 17.0]
+
+    # Cleanup - none necessary
+
+
+def test_create_player_pts_df_feeds_warehouse(tmp_path):
+    # Setup
+    store = StatsWarehouse(tmp_path)
+    player_pts = {pid: pts for pid, pts in _mock_player_pts(2023, 12).items() if pid != '2560757'}
+
+    # Exercise
+    player_pts_df = aggregate.create_player_pts_df(2023, 12, player_pts, warehouse=store)
+
+    # Verify
+    result = store.query(stats_type='actual')
+    expected = pd.DataFrame(
+        {
+            'season': [2023, 2023],
+            'week': [12, 12],
+            'player_id': [2555334, 2568216],
+            'Player': ['Jared Goff', 'Brock Purdy'],
+            'Team': ['DET', 'SF'],
+            'Position': ['QB', 'QB'],
+            'pts': [20.01, 0.84],
+            'Passing_Yards': [296.77, 16.93],
+        }
+    )
+    assert player_pts_df['Player'].tolist() == ['Jared Goff', 'Brock Purdy']
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Cleanup - none necessary
@@ -0,0 +1,246 @@
+"""
+Unit tests for writers.py
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from turkey_bowl import writers
+
+
+@pytest.fixture
+def mock_sheets():
+    board = pd.DataFrame(
+        {'PTS': [126.0, 46.0], 'margin': [80.0, None], 'pts_back': [0.0, 80.0]},
+        index=['Logan', 'Becca'],
+    )
+    logan = pd.DataFrame(
+        {
+            'Position': ['QB', 'K'],
+            'Player': ['Josh Allen', 'Cairo Santos'],
+            'Team': ['BUF', 'CHI'],
+            'ACTUAL_pts': [20.5, 7.0],
+        }
+    )
+    return {'Leader Board': board, 'Logan': logan}
+
+
+@pytest.mark.parametrize(
+    'output_format, expected_path',
+    [
+        ('xlsx', 'board.xlsx'),
+        ('json', 'board.json'),
+        ('csv', 'board'),
+        ('parquet', 'board'),
+        ('html', 'board.html'),
+        ('JSON', 'board.json'),
+    ],
+)
+def test_get_writer_path_for(output_format, expected_path):
+    # Setup - none necessary
+
+    # Exercise
+    writer = writers.get_writer(output_format)
+    result = writer.path_for(Path('board.xlsx'))
+
+    # Verify
+    assert result == Path(expected_path)
+
+    # Cleanup - none necessary
+
+
+def test_get_writer_raises_error_for_unrecognized_format():
+    # Setup - none necessary
+
+    # Exercise
+    with pytest.raises(ValueError, match="Unrecognized output format: 'pdf'"):
+        writers.get_writer('pdf')
+
+    # Verify - none necessary
+    # Cleanup - none necessary
+
+
+def test_ExcelOutputWriter(mock_sheets, tmp_path):
+    # Setup
+    savepath = tmp_path.joinpath('board.xlsx')
+
+    # Exercise
+    result = writers.ExcelOutputWriter().write(mock_sheets, savepath, index_sheets=['Leader Board'])
+
+    # Verify
+    assert result == savepath
+    written_board = pd.read_excel(result, sheet_name='Leader Board', index_col=0)
+    written_board = written_board.astype('float64')
+    written_logan = pd.read_excel(result, sheet_name='Logan')
+    assert written_board.equals(mock_sheets['Leader Board'])
+    assert written_logan.equals(mock_sheets['Logan'])
+
+    # Cleanup - none necessary
+
+
+def test_JSONOutputWriter(mock_sheets, tmp_path):
+    # Setup
+    savepath = tmp_path.joinpath('board.xlsx')
+
+    # Exercise
+    result = writers.JSONOutputWriter().write(mock_sheets, savepath, index_sheets=['Leader Board'])
+
+    # Verify
+    assert result == tmp_path.joinpath('board.json')
+    with open(result, 'r') as f:
+        written = json.load(f)
+
+    assert list(written) == ['Leader Board', 'Logan']
+    assert written['Leader Board']['Logan'] == {'PTS': 126.0, 'margin': 80.0, 'pts_back': 0.0}
+    assert written['Leader Board']['Becca']['margin'] is None
+    assert written['Logan'][0] == {
+        'Position': 'QB',
+        'Player': 'Josh Allen',
+        'Team': 'BUF',
+        'ACTUAL_pts': 20.5,
+    }
+
+    # Cleanup - none necessary
+
+
+def test_CSVOutputWriter(mock_sheets, tmp_path):
+    # Setup
+    savepath = tmp_path.joinpath('board.xlsx')
+
+    # Exercise
+    result = writers.CSVOutputWriter().write(mock_sheets, savepath, index_sheets=['Leader Board'])
+
+    # Verify
+    assert result == tmp_path.joinpath('board')
+    written_board = pd.read_csv(result.joinpath('Leader Board.csv'), index_col=0)
+    written_logan = pd.read_csv(result.joinpath('Logan.csv'))
+    assert written_board.equals(mock_sheets['Leader Board'])
+    assert written_logan.equals(mock_sheets['Logan'])
+
+    # Cleanup - none necessary
+
+
+def test_ParquetOutputWriter(mock_sheets, tmp_path):
+    # Setup
+    pytest.importorskip('pyarrow')
+    savepath = tmp_path.joinpath('board.xlsx')
+
+    # Exercise
+    result = writers.ParquetOutputWriter().write(
+        mock_sheets, savepath, index_sheets=['Leader Board']
+    )
+
+    # Verify
+    written_board = pd.read_parquet(result.joinpath('Leader Board.parquet'))
+    written_logan = pd.read_parquet(result.joinpath('Logan.parquet'))
+    assert written_board.equals(mock_sheets['Leader Board'])
+    assert written_logan.equals(mock_sheets['Logan'])
+
+    # Cleanup - none necessary
+
+
+def test_HTMLOutputWriter(mock_sheets, tmp_path):
+    # Setup
+    savepath = tmp_path.joinpath('board.xlsx')
+
+    # Exercise
+    result = writers.HTMLOutputWriter().write(mock_sheets, savepath, index_sheets=['Leader Board'])
+
+    # Verify
+    assert result == tmp_path.joinpath('board.html')
+    written = result.read_text()
+    assert written.startswith('<!DOCTYPE html>')
+    assert '<h2>Leader Board</h2>' in written
+    assert '<h2>Logan</h2>' in written
+    assert 'Cairo Santos' in written
+
+    # Cleanup - none necessary
+
+
+@pytest.mark.parametrize('output_format', ['xlsx', 'json', 'csv', 'html'])
+def test_OutputWriter_write_skips_unchanged_content(mock_sheets, tmp_path, caplog, output_format):
+    # Setup
+    caplog.set_level(logging.INFO)
+    savepath = tmp_path.joinpath('board.xlsx')
+    writer = writers.get_writer(output_format)
+    path = writer.write(mock_sheets, savepath, index_sheets=['Leader Board'])
+    digest_path = writer.digest_path(path)
+    first_mtime = path.stat().st_mtime_ns
+
+    # Exercise
+    result = writer.write(mock_sheets, savepath, index_sheets=['Leader Board'])
+
+    # Verify
+    assert result == path
+    assert path.stat().st_mtime_ns == first_mtime
+    assert digest_path.read_text().strip() == writer.digest(mock_sheets, ['Leader Board'])
+    assert f'Content unchanged, skipping write to {path}' in caplog.text
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([path.name, digest_path.name])
+
+    # Cleanup - none necessary
+
+
+def test_OutputWriter_write_rewrites_changed_content(mock_sheets, tmp_path):
+    # Setup
+    savepath = tmp_path.joinpath('board.json')
+    writer = writers.JSONOutputWriter()
+    writer.write(mock_sheets, savepath)
+    first_digest = writer.digest_path(savepath).read_text()
+
+    # Exercise
+    mock_sheets['Logan'].loc[0, 'ACTUAL_pts'] = 26.5
+    writer.write(mock_sheets, savepath)
+
+    # Verify
+    with open(savepath, 'r') as f:
+        written = json.load(f)
+
+    assert written['Logan'][0]['ACTUAL_pts'] == 26.5
+    assert writer.digest_path(savepath).read_text() != first_digest
+
+    # Cleanup - none necessary
+
+
+def test_OutputWriter_digest_depends_on_format_and_index(mock_sheets):
+    # Setup
+    json_writer = writers.JSONOutputWriter()
+    html_writer = writers.HTMLOutputWriter()
+
+    # Exercise
+    result = json_writer.digest(mock_sheets)
+
+    # Verify
+    assert result == json_writer.digest(mock_sheets)
+    assert result != html_writer.digest(mock_sheets)
+    assert result != json_writer.digest(mock_sheets, index_sheets=['Leader Board'])
+
+    # Cleanup - none necessary
+
+
+def test_OutputWriter_write_failure_leaves_previous_output(mock_sheets, tmp_path, monkeypatch):
+    # Setup
+    savepath = tmp_path.joinpath('board.json')
+    writer = writers.JSONOutputWriter()
+    writer.write(mock_sheets, savepath)
+    original = savepath.read_text()
+
+    def mock_write(self, sheets, path, index_sheets):
+        path.write_text('{"half": ')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(writers.JSONOutputWriter, '_write', mock_write)
+
+    # Exercise
+    mock_sheets['Logan'].loc[0, 'ACTUAL_pts'] = 26.5
+    with pytest.raises(OSError, match='disk full'):
+        writer.write(mock_sheets, savepath)
+
+    # Verify
+    assert savepath.read_text() == original
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['board.json', 'board.json.sha256']
+
+    # Cleanup - none necessary